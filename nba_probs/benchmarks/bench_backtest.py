@@ -0,0 +1,67 @@
+"""Backtest a full synthetic season: alignment, scoring and a parallel threshold grid.
+
+Run from the ``nba_probs/`` directory::
+
+    python benchmarks/bench_backtest.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import numpy as np  # noqa: E402
+
+from nba_probs.backtest import (  # noqa: E402
+    align_snapshots,
+    estimate_minute_timestamps,
+    score_alignment,
+    threshold_grid,
+)
+from nba_probs.data_pipeline import summarize_games  # noqa: E402
+from nba_probs.edge import MarketLink  # noqa: E402
+from nba_probs.modeling import LogisticScorer  # noqa: E402
+from nba_probs.synthetic import synthetic_season, synthetic_snapshots  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=1230, help="Games in the season")
+    parser.add_argument("--interval", type=float, default=30.0, help="Seconds between snapshots per market")
+    parser.add_argument("--jobs", type=int, default=-1, help="Worker processes for the grid")
+    args = parser.parse_args()
+
+    game_ids = [f"00223{i:05d}" for i in range(1, args.games + 1)]
+    minutes = summarize_games(synthetic_season(game_ids, events=450))
+    minutes["timestamp"] = estimate_minute_timestamps(minutes)
+    links = [MarketLink(f"{game_id}-home", game_id) for game_id in game_ids]
+    snapshots = synthetic_snapshots(minutes, links, interval_seconds=args.interval)
+    scorer = LogisticScorer(margin_coef=0.12, seconds_coef=0.0, intercept=0.05)
+
+    timings = {}
+    start = time.perf_counter()
+    aligned = align_snapshots(snapshots, minutes, links)
+    timings["align (merge_asof)"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scored = score_alignment(aligned, scorer)
+    timings["score"] = time.perf_counter() - start
+
+    entries = np.round(np.arange(0.01, 0.21, 0.01), 2)
+    exits = np.round(np.arange(0.0, 0.06, 0.01), 2)
+    start = time.perf_counter()
+    grid = threshold_grid(scored, entries, exits, n_jobs=args.jobs)
+    timings[f"grid ({len(grid)} rules)"] = time.perf_counter() - start
+
+    print(f"games={args.games} snapshots={len(snapshots):,} aligned={len(aligned):,}")
+    for name, seconds in timings.items():
+        print(f"{name:<22} {seconds:8.3f} s")
+    print(grid.head(5).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
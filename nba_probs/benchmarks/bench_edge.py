@@ -0,0 +1,54 @@
+"""Replay a synthetic slate of concurrent games through the edge engine.
+
+Run from the ``nba_probs/`` directory::
+
+    python benchmarks/bench_edge.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from nba_probs.data_pipeline import summarize_games  # noqa: E402
+from nba_probs.edge import EdgeEngine  # noqa: E402
+from nba_probs.modeling import LogisticScorer  # noqa: E402
+from nba_probs.synthetic import synthetic_live_stream, synthetic_season  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=48, help="Concurrent games in the slate")
+    parser.add_argument("--markets-per-game", type=int, default=2)
+    parser.add_argument("--quotes-per-minute", type=int, default=6)
+    args = parser.parse_args()
+
+    minutes = summarize_games(synthetic_season([f"00223{i:05d}" for i in range(1, args.games + 1)], events=400))
+    links, events = synthetic_live_stream(
+        minutes, markets_per_game=args.markets_per_game, quotes_per_minute=args.quotes_per_minute
+    )
+    engine = EdgeEngine(LogisticScorer(margin_coef=0.12, seconds_coef=0.0, intercept=0.05), links)
+
+    latencies = []
+    clock = time.perf_counter
+    for event in events:
+        start = clock()
+        engine.update(event)
+        latencies.append(clock() - start)
+
+    latencies.sort()
+    total = sum(latencies)
+    print(f"games={args.games} markets={len(links)} updates={len(events):,} recomputed={engine.recomputed:,}")
+    print(
+        f"per update: mean {total / len(events) * 1e6:.2f} us, "
+        f"p99 {latencies[int(0.99 * len(latencies))] * 1e6:.2f} us, max {latencies[-1] * 1e6:.2f} us"
+    )
+    print(f"throughput: {len(events) / total:,.0f} updates/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Compare win-probability scoring paths: per-call latency and batch throughput.
+
+Run from the ``nba_probs/`` directory::
+
+    python benchmarks/bench_predict.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import warnings
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import numpy as np  # noqa: E402
+
+from nba_probs.data_pipeline import summarize_games  # noqa: E402
+from nba_probs.modeling import predict_win_probability, train_baseline_model  # noqa: E402
+from nba_probs.synthetic import synthetic_season  # noqa: E402
+
+
+def _per_call(func, states, repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for margin, seconds in states:
+            func(margin, seconds)
+    return (time.perf_counter() - start) / (repeats * len(states))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2_000, help="Single-state calls per variant")
+    parser.add_argument("--batch", type=int, default=100_000, help="States per batch call")
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore", message="X does not have valid feature names")
+
+    data = summarize_games(synthetic_season([f"00223{i:05d}" for i in range(40)], events=300))
+    artifacts = train_baseline_model(data)
+    scorer = artifacts.scorer()
+
+    rng = np.random.default_rng(0)
+    margins = rng.integers(-30, 30, size=args.batch).astype(np.float64)
+    seconds = rng.integers(0, 2880, size=args.batch).astype(np.float64)
+    states = list(zip(margins[: args.calls].tolist(), seconds[: args.calls].tolist()))
+
+    reference = _per_call(
+        lambda m, s: predict_win_probability(artifacts.model, score_margin=m, seconds_remaining=s), states, 1
+    )
+    fast = _per_call(scorer.predict_one, states, 20)
+    print(f"{'predict_win_probability':<28} {reference * 1e6:10.2f} us/call")
+    print(f"{'LogisticScorer.predict_one':<28} {fast * 1e6:10.2f} us/call  {reference / fast:8.1f}x")
+
+    out = np.empty(args.batch)
+    start = time.perf_counter()
+    repeats = 20
+    for _ in range(repeats):
+        scorer.predict(margins, seconds, out=out)
+    elapsed = (time.perf_counter() - start) / repeats
+    print(f"{'LogisticScorer.predict':<28} {args.batch / elapsed / 1e6:10.2f} M states/s ({elapsed * 1e3:.2f} ms per batch)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Rebuild minute summaries from the raw cache with and without a summarizing process pool.
+
+Run from the ``nba_probs/`` directory::
+
+    python benchmarks/bench_rebuild.py --games 200 --processes 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from nba_probs.data_pipeline import batch_fetch  # noqa: E402
+from nba_probs.raw_cache import RawPlayByPlayCache  # noqa: E402
+from nba_probs.synthetic import synthetic_play_by_play  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=200, help="Games in the raw cache")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="Summarizing processes")
+    parser.add_argument("--concurrency", type=int, default=4, help="I/O threads reading the cache")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = RawPlayByPlayCache(Path(directory))
+        game_ids = [f"00223{index:05d}" for index in range(1, args.games + 1)]
+        for offset, game_id in enumerate(game_ids):
+            cache.put(game_id, synthetic_play_by_play(game_id, seed=offset, overtime_periods=int(offset % 5 == 4)))
+
+        variants = {
+            "serial": {"mode": "serial"},
+            "threads": {"mode": "threads", "concurrency": args.concurrency},
+            f"threads + {args.processes} processes": {
+                "mode": "threads",
+                "concurrency": args.concurrency,
+                "processes": args.processes,
+            },
+        }
+        baseline = None
+        rows = None
+        for name, options in variants.items():
+            start = time.perf_counter()
+            frame = batch_fetch(game_ids, show_progress=False, cache=cache, offline=True, **options)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            rows = rows or len(frame)
+            assert len(frame) == rows
+            print(f"{name:<28} {elapsed:8.2f} s  {args.games / elapsed:8.1f} games/s  {baseline / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
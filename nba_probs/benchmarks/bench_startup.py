@@ -0,0 +1,75 @@
+"""Measure cold-start time of the CLIs and of loading model artifacts.
+
+Each case runs in a fresh interpreter so import and unpickling costs are
+included. Run from the ``nba_probs/`` directory::
+
+    python benchmarks/bench_startup.py --repeats 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+
+def _cold_start(command: list[str], repeats: int) -> float:
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, capture_output=True, env=env)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def _write_artifacts(directory: Path) -> tuple[Path, Path]:
+    import pandas as pd  # type: ignore import-not-found
+
+    from nba_probs.modeling import train_baseline_model
+
+    data = pd.DataFrame(
+        {
+            "score_margin": [-12, -8, -3, 0, 2, 5, 9, 11, 7, -5, 4, -2],
+            "seconds_remaining": [30, 120, 240, 360, 420, 480, 540, 600, 660, 720, 780, 840],
+            "home_win": [0, 0, 0, 0, 1, 1, 1, 1, 1, 0, 1, 0],
+        }
+    )
+    artifacts = train_baseline_model(data)
+    joblib_path = directory / "model.joblib"
+    json_path = directory / "model.json"
+    artifacts.save(joblib_path)
+    artifacts.save(json_path)
+    return joblib_path, json_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=5, help="Runs per case (fastest is reported)")
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        joblib_path, json_path = _write_artifacts(Path(tmp))
+        load = "from pathlib import Path; from nba_probs.modeling import load_model; load_model(Path({!r}))"
+        cases = {
+            "python (bare interpreter)": [sys.executable, "-c", "pass"],
+            "polymarket_snapshot --help": [sys.executable, "-m", "nba_probs.cli.polymarket_snapshot", "--help"],
+            "collect --help": [sys.executable, "-m", "nba_probs.cli.collect", "--help"],
+            "load_model (joblib)": [sys.executable, "-c", load.format(str(joblib_path))],
+            "load_model (lightweight)": [sys.executable, "-c", load.format(str(json_path))],
+        }
+        for name, command in cases.items():
+            print(f"{name:<30} {_cold_start(command, args.repeats) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
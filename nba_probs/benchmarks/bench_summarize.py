@@ -0,0 +1,59 @@
+"""Compare the reference and vectorized minute summarizers on synthetic games.
+
+Run from the ``nba_probs/`` directory::
+
+    python benchmarks/bench_summarize.py --games 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from nba_probs.data_pipeline import (  # noqa: E402
+    summarize_game_by_minute,
+    summarize_game_by_minute_fast,
+    summarize_games,
+)
+from nba_probs.synthetic import synthetic_season  # noqa: E402
+
+
+def _best_of(repeats: int, func) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=50, help="Number of synthetic games")
+    parser.add_argument("--events", type=int, default=500, help="Events per game")
+    parser.add_argument("--repeats", type=int, default=3, help="Repetitions per variant (best is reported)")
+    args = parser.parse_args()
+
+    plays = synthetic_season([f"{i:010d}" for i in range(args.games)], events=args.events)
+    games = [group for _, group in plays.groupby("gameId", sort=False)]
+
+    variants = {
+        "reference (per game)": lambda: [summarize_game_by_minute(game) for game in games],
+        "fast (per game)": lambda: [summarize_game_by_minute_fast(game) for game in games],
+        "summarize_games (batch)": lambda: summarize_games(plays),
+    }
+
+    print(f"{args.games} games, {len(plays)} events")
+    baseline = None
+    for name, func in variants.items():
+        elapsed = _best_of(args.repeats, func)
+        baseline = baseline or elapsed
+        print(f"{name:<26} {elapsed * 1000:10.1f} ms  {baseline / elapsed:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
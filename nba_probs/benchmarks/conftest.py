@@ -0,0 +1,56 @@
+"""Shared fixtures for the pytest-benchmark suite.
+
+Every input comes from the seeded generators in :mod:`nba_probs.synthetic`, so
+results are comparable between commits. Run from the ``nba_probs/`` directory::
+
+    python -m pytest benchmarks --benchmark-autosave
+    python -m pytest benchmarks --benchmark-compare
+"""
+
+import sys
+import warnings
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1] / "src"
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+SEASON_GAMES = 40
+EVENTS_PER_GAME = 500
+
+
+@pytest.fixture(scope="session")
+def game_ids():
+    return [f"00223{index:05d}" for index in range(1, SEASON_GAMES + 1)]
+
+
+@pytest.fixture(scope="session")
+def season_plays(game_ids):
+    from nba_probs.synthetic import synthetic_season
+
+    return synthetic_season(game_ids, events=EVENTS_PER_GAME)
+
+
+@pytest.fixture(scope="session")
+def overtime_game():
+    from nba_probs.synthetic import synthetic_play_by_play
+
+    return synthetic_play_by_play(events=EVENTS_PER_GAME, overtime_periods=1)
+
+
+@pytest.fixture(scope="session")
+def season_minutes(season_plays):
+    from nba_probs.data_pipeline import summarize_games
+
+    return summarize_games(season_plays)
+
+
+@pytest.fixture(scope="session")
+def baseline_artifacts(season_minutes):
+    from nba_probs.modeling import train_baseline_model
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return train_baseline_model(season_minutes)
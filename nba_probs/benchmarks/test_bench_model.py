@@ -0,0 +1,43 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from nba_probs.modeling import predict_win_probability, train_baseline_model
+
+
+@pytest.fixture(scope="module")
+def states():
+    rng = np.random.default_rng(0)
+    return (
+        rng.integers(-30, 30, size=100_000).astype(np.float64),
+        rng.integers(0, 2880, size=100_000).astype(np.float64),
+    )
+
+
+def test_train_baseline_model(benchmark, season_minutes):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        artifacts = benchmark(train_baseline_model, season_minutes)
+    assert 0 < artifacts.brier < 0.25
+
+
+def test_predict_win_probability(benchmark, baseline_artifacts):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        probability = benchmark(
+            predict_win_probability, baseline_artifacts.model, score_margin=6, seconds_remaining=300
+        )
+    assert probability == pytest.approx(baseline_artifacts.scorer().predict_one(6, 300))
+
+
+def test_scorer_predict_one(benchmark, baseline_artifacts):
+    scorer = baseline_artifacts.scorer()
+    assert 0 < benchmark(scorer.predict_one, 6.0, 300.0) < 1
+
+
+def test_scorer_predict_batch(benchmark, baseline_artifacts, states):
+    scorer = baseline_artifacts.scorer()
+    out = np.empty(len(states[0]))
+    benchmark(scorer.predict, *states, out=out)
+    assert np.all((out > 0) & (out < 1))
@@ -0,0 +1,28 @@
+import pytest
+
+from nba_probs.data_pipeline import batch_fetch, summarize_game_by_minute, summarize_game_by_minute_fast, summarize_games
+
+
+def test_summarize_game_by_minute(benchmark, overtime_game):
+    minutes = benchmark(summarize_game_by_minute, overtime_game)
+    assert minutes["period"].max() == 5
+
+
+def test_summarize_game_by_minute_fast(benchmark, overtime_game):
+    minutes = benchmark(summarize_game_by_minute_fast, overtime_game)
+    assert minutes["period"].max() == 5
+
+
+def test_summarize_games(benchmark, season_plays, game_ids):
+    minutes = benchmark(summarize_games, season_plays)
+    assert minutes["game_id"].nunique() == len(game_ids)
+
+
+@pytest.mark.parametrize("mode", ["serial", "threads", "asyncio"])
+def test_batch_fetch_with_stubbed_fetcher(benchmark, season_plays, game_ids, mode):
+    games = {str(game_id): group for game_id, group in season_plays.groupby("gameId", sort=False)}
+
+    result = benchmark(
+        batch_fetch, game_ids, show_progress=False, mode=mode, concurrency=8, fetcher=games.__getitem__
+    )
+    assert result["game_id"].nunique() == len(game_ids)
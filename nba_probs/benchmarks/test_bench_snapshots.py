@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from nba_probs.polymarket import Orderbook, PolymarketClient
+from nba_probs.snapshots import SnapshotStore, snapshot_record
+from nba_probs.synthetic import synthetic_market_payloads, synthetic_orderbook_payloads
+
+MARKETS = 25
+SAMPLES = 40
+
+
+@pytest.fixture(scope="module")
+def records():
+    market_ids = [market["id"] for market in synthetic_market_payloads(MARKETS)["markets"]]
+    start = datetime(2024, 1, 15, 23, 30, tzinfo=timezone.utc)
+    records = []
+    for index, (market_id, payload) in enumerate(synthetic_orderbook_payloads(market_ids, samples=SAMPLES)):
+        prices = payload["outcomePrices"]
+        orderbook = Orderbook(market_id, PolymarketClient._safe_float(prices["yes"]), PolymarketClient._safe_float(prices["no"]))
+        records.append(snapshot_record(orderbook, timestamp=start + timedelta(seconds=15 * (index // MARKETS))))
+    return records
+
+
+@pytest.mark.parametrize("fsync", [False, True], ids=["buffered", "fsync"])
+def test_snapshot_append(benchmark, tmp_path, records, fsync):
+    stores = iter(range(10_000))
+
+    def setup():
+        return (SnapshotStore(tmp_path / f"store-{next(stores)}", fsync=fsync), records), {}
+
+    written = benchmark.pedantic(lambda store, batch: store.append(batch), setup=setup, rounds=10)
+    assert written == len(records)
+
+
+def test_snapshot_read(benchmark, tmp_path, records):
+    store = SnapshotStore(tmp_path / "store", fsync=False)
+    store.append(records)
+    market_id = records[0]["market_id"]
+
+    frame = benchmark(store.read, market_id)
+    assert len(frame) == SAMPLES
+
+
+def test_snapshot_compact_and_read(benchmark, tmp_path, records):
+    pytest.importorskip("pyarrow")
+    stores = iter(range(10_000))
+
+    def setup():
+        store = SnapshotStore(tmp_path / f"store-{next(stores)}", fsync=False)
+        store.append(records)
+        return (store,), {}
+
+    def compact_and_read(store):
+        store.compact(before=datetime(2024, 2, 1).date())
+        return store.read(records[0]["market_id"])
+
+    frame = benchmark.pedantic(compact_and_read, setup=setup, rounds=5)
+    assert len(frame) == SAMPLES
@@ -0,0 +1,285 @@
+"""Vectorized backtests of edge-trading rules on stored snapshots and game minutes."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, fields
+from datetime import time as clock_time
+from typing import TYPE_CHECKING, Dict, Iterable, Mapping, Optional, Sequence
+
+from .edge import MarketLink
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
+    import numpy as np  # type: ignore import-not-found
+    import pandas as pd  # type: ignore import-not-found
+
+REGULATION_SECONDS = 4 * 12 * 60
+OVERTIME_SECONDS = 5 * 60
+# Wall-clock seconds per second of game clock: a 48-minute game takes about 2h15m.
+DEFAULT_PACE = 2.8
+# 7:30pm US Eastern, the most common tipoff, expressed in UTC.
+DEFAULT_TIPOFF_UTC = clock_time(23, 30)
+
+
+def estimate_minute_timestamps(
+    minutes: pd.DataFrame,
+    tipoffs: Optional[Mapping[str, object]] = None,
+    *,
+    pace: float = DEFAULT_PACE,
+    default_tipoff: clock_time = DEFAULT_TIPOFF_UTC,
+) -> pd.Series:
+    """Estimate the UTC wall-clock time of every minute row.
+
+    Minute summaries only carry the game clock, so the time is extrapolated
+    from the tipoff: ``tipoffs`` maps game IDs to tipoff times, otherwise
+    ``game_date`` plus ``default_tipoff`` is used. Elapsed game time is
+    stretched by ``pace`` to account for stoppages.
+    """
+
+    import numpy as np  # type: ignore import-not-found
+    import pandas as pd  # type: ignore import-not-found
+
+    period = minutes["period"].astype("int64").to_numpy()
+    remaining = minutes["seconds_remaining"].astype("int64").to_numpy()
+    elapsed = np.where(
+        period <= 4,
+        REGULATION_SECONDS - remaining,
+        REGULATION_SECONDS + (period - 4) * OVERTIME_SECONDS - remaining,
+    )
+
+    game_ids = minutes["game_id"].astype(str)
+    if tipoffs is not None:
+        start = pd.to_datetime(game_ids.map({str(key): value for key, value in tipoffs.items()}), utc=True)
+    else:
+        start = pd.Series(pd.NaT, index=minutes.index, dtype="datetime64[ns, UTC]")
+    if start.isna().any():
+        if "game_date" not in minutes.columns:
+            raise ValueError("Minutes need a game_date column or explicit tipoffs to estimate timestamps")
+        dates = pd.to_datetime(minutes["game_date"]).dt.tz_localize(None).dt.normalize()
+        offset = pd.Timedelta(hours=default_tipoff.hour, minutes=default_tipoff.minute)
+        start = start.fillna((dates + offset).dt.tz_localize("UTC"))
+
+    return start + pd.to_timedelta(elapsed * pace, unit="s")
+
+
+def _links_frame(links: Iterable[MarketLink]) -> pd.DataFrame:
+    import pandas as pd  # type: ignore import-not-found
+
+    return pd.DataFrame(
+        [(str(link.market_id), str(link.game_id), bool(link.yes_is_home)) for link in links],
+        columns=["market_id", "game_id", "yes_is_home"],
+    )
+
+
+def align_snapshots(
+    snapshots: pd.DataFrame,
+    minutes: pd.DataFrame,
+    links: Iterable[MarketLink],
+    *,
+    tolerance: Optional[pd.Timedelta] = None,
+) -> pd.DataFrame:
+    """As-of join every snapshot to the latest game minute at or before it.
+
+    ``snapshots`` needs ``market_id``, ``timestamp`` and
+    ``implied_yes_probability`` (as returned by
+    :meth:`~nba_probs.snapshots.SnapshotStore.read`); ``minutes`` needs a
+    ``timestamp`` column (see :func:`estimate_minute_timestamps`). Snapshots
+    of unlinked markets, without a price, or taken before tipoff (or more
+    than ``tolerance`` after the last minute) are dropped. Rows come back
+    sorted by market and time.
+    """
+
+    import pandas as pd  # type: ignore import-not-found
+
+    if "timestamp" not in minutes.columns:
+        raise ValueError("minutes must have a timestamp column; see estimate_minute_timestamps")
+
+    quotes = snapshots.loc[:, ["market_id", "timestamp", "implied_yes_probability"]].copy()
+    quotes["market_id"] = quotes["market_id"].astype(str)
+    quotes["timestamp"] = pd.to_datetime(quotes["timestamp"], utc=True)
+    quotes = quotes.dropna(subset=["implied_yes_probability"]).merge(_links_frame(links), on="market_id")
+
+    state = minutes.loc[:, ["game_id", "timestamp", "score_margin", "seconds_remaining", "home_win"]].copy()
+    state["game_id"] = state["game_id"].astype(str)
+    state["timestamp"] = pd.to_datetime(state["timestamp"], utc=True)
+
+    aligned = pd.merge_asof(
+        quotes.sort_values("timestamp", kind="stable"),
+        state.sort_values("timestamp", kind="stable"),
+        on="timestamp",
+        by="game_id",
+        direction="backward",
+        tolerance=tolerance,
+    )
+    aligned = aligned.dropna(subset=["score_margin"])
+    aligned = aligned.rename(columns={"implied_yes_probability": "market_probability"})
+    return aligned.sort_values(["market_id", "timestamp"], kind="stable").reset_index(drop=True)
+
+
+def score_alignment(aligned: pd.DataFrame, scorer) -> pd.DataFrame:
+    """Add ``model_probability``, ``outcome`` and ``edge`` columns for the YES side."""
+
+    import numpy as np  # type: ignore import-not-found
+
+    from .modeling import LogisticScorer
+
+    scorer = scorer if isinstance(scorer, LogisticScorer) else LogisticScorer.from_model(scorer)
+    home = scorer.predict(
+        aligned["score_margin"].to_numpy(dtype=np.float64),
+        aligned["seconds_remaining"].to_numpy(dtype=np.float64),
+    )
+    yes_is_home = aligned["yes_is_home"].to_numpy(dtype=bool)
+    home_win = aligned["home_win"].to_numpy(dtype=np.float64)
+
+    scored = aligned.copy()
+    scored["model_probability"] = np.where(yes_is_home, home, 1.0 - home)
+    scored["outcome"] = np.where(yes_is_home, home_win, 1.0 - home_win)
+    scored["edge"] = scored["model_probability"] - scored["market_probability"]
+    return scored
+
+
+@dataclass(frozen=True)
+class BacktestResult:
+    """Aggregate outcome of one entry/exit rule over every market."""
+
+    entry_edge: float
+    exit_edge: float
+    pnl: float
+    trades: int
+    exposure: float
+    markets_traded: int
+
+    @property
+    def pnl_per_trade(self) -> float:
+        return self.pnl / self.trades if self.trades else 0.0
+
+
+def _market_arrays(scored: pd.DataFrame) -> Dict[str, np.ndarray]:
+    import numpy as np  # type: ignore import-not-found
+    import pandas as pd  # type: ignore import-not-found
+
+    codes, _ = pd.factorize(scored["market_id"], sort=False)
+    codes = codes.astype(np.int64)
+    first = np.ones(len(codes), dtype=bool)
+    first[1:] = codes[1:] != codes[:-1]
+    last = np.ones(len(codes), dtype=bool)
+    last[:-1] = first[1:]
+    return {
+        "codes": codes,
+        "first": first,
+        "last": last,
+        "price": scored["market_probability"].to_numpy(dtype=np.float64),
+        "edge": scored["edge"].to_numpy(dtype=np.float64),
+        "outcome": scored["outcome"].to_numpy(dtype=np.float64),
+    }
+
+
+def _positions(edge: np.ndarray, first: np.ndarray, entry_edge: float, exit_edge: float) -> np.ndarray:
+    """Return the position held after each row: +1 long YES, -1 long NO, 0 flat.
+
+    Positions open when ``|edge| >= entry_edge``, close once ``|edge| <=
+    exit_edge`` and are otherwise carried forward, all without a Python loop:
+    rows with a decision are forward-filled per market by a running maximum
+    of their indices.
+    """
+
+    import numpy as np  # type: ignore import-not-found
+
+    signal = np.full(len(edge), np.nan)
+    signal[np.abs(edge) <= exit_edge] = 0.0
+    signal[edge >= entry_edge] = 1.0
+    signal[edge <= -entry_edge] = -1.0
+    signal[first & np.isnan(signal)] = 0.0  # every market starts flat
+
+    decided = np.where(np.isnan(signal), 0, np.arange(len(edge)))
+    np.maximum.accumulate(decided, out=decided)
+    return signal[decided]
+
+
+def _simulate_arrays(
+    arrays: Dict[str, np.ndarray], entry_edge: float, exit_edge: float, cost: float
+) -> BacktestResult:
+    import numpy as np  # type: ignore import-not-found
+
+    codes, first, last = arrays["codes"], arrays["first"], arrays["last"]
+    price, outcome = arrays["price"], arrays["outcome"]
+    if not len(codes):
+        return BacktestResult(float(entry_edge), float(exit_edge), 0.0, 0, 0.0, 0)
+
+    position = _positions(arrays["edge"], first, entry_edge, exit_edge)
+
+    # Each position earns the price move to the next quote, or the settlement
+    # at its market's last quote. A NO share moves opposite to the YES price.
+    next_price = np.empty_like(price)
+    next_price[:-1] = price[1:]
+    next_price = np.where(last, outcome, next_price)
+    pnl = position * (next_price - price)
+
+    previous = np.empty_like(position)
+    previous[1:] = position[:-1]
+    previous[first] = 0.0
+    pnl -= cost * np.abs(position - previous)
+
+    entries = (position != 0) & (position != previous)
+    return BacktestResult(
+        entry_edge=float(entry_edge),
+        exit_edge=float(exit_edge),
+        pnl=float(pnl.sum()),
+        trades=int(entries.sum()),
+        exposure=float(np.mean(position != 0)),
+        markets_traded=int(np.unique(codes[position != 0]).size),
+    )
+
+
+def simulate(scored: pd.DataFrame, *, entry_edge: float, exit_edge: float = 0.0, cost: float = 0.0) -> BacktestResult:
+    """Backtest one entry/exit rule on :func:`score_alignment` output.
+
+    One share of YES (``edge >= entry_edge``) or NO (``edge <= -entry_edge``)
+    is held per market, marked to market between quotes and settled at the
+    game's outcome after the last quote. ``cost`` is charged per share traded,
+    e.g. half the spread.
+    """
+
+    if exit_edge > entry_edge:
+        raise ValueError("exit_edge must not exceed entry_edge")
+    return _simulate_arrays(_market_arrays(scored), entry_edge, exit_edge, cost)
+
+
+def threshold_grid(
+    scored: pd.DataFrame,
+    entry_edges: Sequence[float],
+    exit_edges: Sequence[float] = (0.0,),
+    *,
+    cost: float = 0.0,
+    n_jobs: int = -1,
+) -> pd.DataFrame:
+    """Run :func:`simulate` for every valid ``(entry, exit)`` pair across cores.
+
+    Returns one row per rule, best P&L first. Pairs whose exit edge exceeds
+    their entry edge are skipped; if none remain the frame is empty.
+    """
+
+    import pandas as pd  # type: ignore import-not-found
+    from joblib import Parallel, delayed  # type: ignore import-not-found
+
+    arrays = _market_arrays(scored)
+    rules = [(entry, exit) for entry in entry_edges for exit in exit_edges if exit <= entry]
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(_simulate_arrays)(arrays, entry, exit, cost)
+        for entry, exit in rules
+    )
+    columns = [field.name for field in fields(BacktestResult)] + ["pnl_per_trade"]
+    frame = pd.DataFrame(
+        [{**asdict(result), "pnl_per_trade": result.pnl_per_trade} for result in results],
+        columns=columns,
+    )
+    return frame.sort_values("pnl", ascending=False, kind="stable").reset_index(drop=True)
+
+
+__all__ = [
+    "BacktestResult",
+    "align_snapshots",
+    "estimate_minute_timestamps",
+    "score_alignment",
+    "simulate",
+    "threshold_grid",
+]
@@ -3,47 +3,248 @@
 from __future__ import annotations
 
 import argparse
+from datetime import date
 from pathlib import Path
-from typing import Iterable
-
-import pandas as pd
+from typing import TYPE_CHECKING, Iterable, Iterator, List
 
+from .. import metrics
 from ..config import get_settings
-from ..data_pipeline import batch_fetch
+from ..data_pipeline import FETCH_MODES, iter_batch_fetch
+from ..dataset import MinuteDataset
+from ..raw_cache import RawPlayByPlayCache
+from ..schedule import discover_game_ids, schedule_endpoint, validate_season
+from ..schema import to_arrow_table
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
+    import pandas as pd  # type: ignore import-not-found
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Download NBA games and summarize by minute")
-    parser.add_argument("game_ids", nargs="+", help="NBA game IDs to download")
+    parser.add_argument(
+        "game_ids",
+        nargs="*",
+        help="NBA game IDs to download (with --offline, defaults to every cached game)",
+    )
+    parser.add_argument(
+        "--season",
+        default=None,
+        help="Also collect every finished game of this season (e.g. 2023-24) from the league schedule",
+    )
+    parser.add_argument(
+        "--date-range",
+        nargs=2,
+        type=date.fromisoformat,
+        default=None,
+        metavar=("START", "END"),
+        help="With --season, only collect games played between these ISO dates (inclusive)",
+    )
     parser.add_argument(
         "--output",
         type=Path,
         default=None,
-        help="Optional path to save the concatenated dataset (Parquet format)",
+        help=(
+            "Optional path to save the concatenated dataset as a single Parquet file "
+            "instead of updating the partitioned processed dataset"
+        ),
     )
     parser.add_argument(
         "--no-progress",
         action="store_true",
         help="Disable tqdm progress bar",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--mode",
+        choices=FETCH_MODES,
+        default="serial",
+        help="How to issue requests to the stats endpoint (default: serial)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum number of games downloaded at once in threads/asyncio mode",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=0,
+        help="Summarize games on this many worker processes instead of the download workers",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=None,
+        help="Maximum requests per second sent to the stats endpoint",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=3,
+        help="Retries per game with jittered exponential backoff",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the raw play-by-play cache",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Rebuild from the raw play-by-play cache without any network requests",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=float,
+        default=None,
+        help="Evict least recently used games once the raw cache exceeds this size",
+    )
+    parser.add_argument(
+        "--batch-games",
+        type=int,
+        default=50,
+        help="Number of games buffered before each write (one Parquet row group per batch)",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-collect games that are already in the processed dataset and replace them",
+    )
+    parser.add_argument(
+        "--metrics",
+        type=Path,
+        default=None,
+        help="Record fetch/summarize timings and write them here (.json, otherwise Prometheus text)",
+    )
+    args = parser.parse_args()
+    if not args.game_ids and not args.offline and args.season is None:
+        parser.error("at least one game ID is required unless --offline or --season is given")
+    if args.season is not None:
+        try:
+            validate_season(args.season)
+        except ValueError as exc:
+            parser.error(str(exc))
+        if args.offline:
+            parser.error("--season reads the league schedule and cannot be combined with --offline")
+        try:
+            schedule_endpoint()
+        except ImportError as exc:
+            parser.error(str(exc))
+    if args.date_range is not None:
+        if args.season is None:
+            parser.error("--date-range requires --season")
+        if args.date_range[0] > args.date_range[1]:
+            parser.error("--date-range START must not be after END")
+    if args.processes < 0:
+        parser.error("--processes must not be negative")
+    if args.offline and args.no_cache:
+        parser.error("--offline reads from the raw cache and cannot be combined with --no-cache")
+    return args
+
+
+def _batched(frames: Iterable[pd.DataFrame], size: int) -> Iterator[List[pd.DataFrame]]:
+    batch: List[pd.DataFrame] = []
+    for frame in frames:
+        batch.append(frame)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def write_parquet_stream(frames: Iterable[pd.DataFrame], path: Path, *, batch_games: int = 50) -> int:
+    """Write per-game frames to ``path`` as they arrive, one row group per batch of games.
+
+    Rows are stored with the compact :func:`~nba_probs.schema.minute_schema` types.
+    """
+
+    import pandas as pd  # type: ignore import-not-found
+    import pyarrow.parquet as pq  # type: ignore import-not-found
+
+    writer = None
+    rows = 0
+    try:
+        for batch in _batched(frames, batch_games):
+            table = to_arrow_table(pd.concat(batch, ignore_index=True))
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table, row_group_size=table.num_rows)
+            rows += table.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
 
 
 def main(args: argparse.Namespace | None = None) -> None:
     if args is None:
         args = parse_args()
 
+    with metrics.exporting(args.metrics):
+        _collect(args)
+
+
+def _collect(args: argparse.Namespace) -> None:
+    import pandas as pd  # type: ignore import-not-found
+
     settings = get_settings()
-    dataset = batch_fetch(args.game_ids, show_progress=not args.no_progress)
+    cache = None
+    if not args.no_cache:
+        max_bytes = int(args.cache_max_mb * 1024 * 1024) if args.cache_max_mb else None
+        cache = RawPlayByPlayCache(settings.paths.raw_data_dir / "play_by_play", max_bytes=max_bytes)
+
+    game_ids = args.game_ids
+    if not game_ids and args.offline and cache is not None:
+        game_ids = cache.game_ids()
+    if args.season is not None:
+        start, end = args.date_range or (None, None)
+        discovered = discover_game_ids(args.season, start=start, end=end, retries=args.retries)
+        print(f"Found {len(discovered)} finished games in the {args.season} schedule")
+        game_ids = list(dict.fromkeys([*game_ids, *discovered]))
+
+    store = None
+    if args.output is None:
+        store = MinuteDataset(settings.paths.processed_data_dir / "minutes")
+        if not args.refresh:
+            skipped = [game_id for game_id in game_ids if game_id in store]
+            game_ids = [game_id for game_id in game_ids if game_id not in store]
+            if skipped:
+                print(f"Skipping {len(skipped)} games already in {store.root}")
+            if not game_ids:
+                print("Nothing to collect.")
+                return
+
+    frames = iter_batch_fetch(
+        game_ids,
+        show_progress=not args.no_progress,
+        mode=args.mode,
+        concurrency=args.concurrency,
+        rate_limit=args.rate_limit,
+        retries=args.retries,
+        cache=cache,
+        offline=args.offline,
+        processes=args.processes,
+    )
 
-    if args.output is not None:
-        output_path = args.output
-    else:
-        output_path = settings.paths.processed_data_dir / "minutes.parquet"
+    if store is not None:
+        rows = 0
+        partitions = set()
+        for batch in _batched(frames, args.batch_games):
+            dataset = pd.concat(batch, ignore_index=True)
+            partitions.update(store.write(dataset, mode="upsert"))
+            rows += len(dataset)
+        if not rows:
+            raise RuntimeError("No games were successfully processed.")
+        print(f"Saved {rows} rows to {len(partitions)} partitions under {store.root}")
+        return
 
+    output_path = args.output
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    dataset.to_parquet(output_path, index=False)
-    print(f"Saved {len(dataset)} rows to {output_path}")
+    rows = write_parquet_stream(frames, output_path, batch_games=args.batch_games)
+    if not rows:
+        raise RuntimeError("No games were successfully processed.")
+    print(f"Saved {rows} rows to {output_path}")
 
 
 if __name__ == "__main__":  # pragma: no cover
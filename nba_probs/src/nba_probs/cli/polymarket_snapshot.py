@@ -4,52 +4,204 @@ from __future__ import annotations
 
 import argparse
 import json
-from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence
 
-from ..config import get_settings
-from ..polymarket import PolymarketClient
+from .. import metrics
+from ..snapshots import SnapshotStore, default_store, snapshot_record
 
+if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
+    from ..concurrency import FixedRateSchedule
+    from ..polymarket import PolymarketClient
 
-def parse_args() -> argparse.Namespace:
+INACTIVE_STATUSES = frozenset({"closed", "resolved", "archived"})
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Capture a Polymarket orderbook snapshot")
-    parser.add_argument("market_id", help="Polymarket market identifier")
+    parser.add_argument("market_id", nargs="*", help="Polymarket market identifier(s)")
     parser.add_argument(
         "--output",
         type=Path,
         default=None,
-        help="Optional JSON file to append snapshot data",
+        help="Snapshot store directory to append snapshots to",
+    )
+    parser.add_argument(
+        "--import-legacy",
+        type=Path,
+        default=None,
+        metavar="FILE",
+        help="Import a JSON array file written by the old --output FILE mode into the snapshot store",
+    )
+    parser.add_argument(
+        "--save",
+        action="store_true",
+        help="Append to the default snapshot store under the Polymarket data directory",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Compact closed days of the snapshot store into Parquet after writing (needs --output or --save)",
+    )
+    parser.add_argument(
+        "--discover",
+        action="store_true",
+        help="Also sample every open NBA market returned by the Polymarket API",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=None,
+        help="Keep running and sample every INTERVAL seconds (daemon mode)",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=None,
+        help="Stop daemon mode after this many samples (default: run until interrupted)",
+    )
+    parser.add_argument(
+        "--flush-every",
+        type=int,
+        default=10,
+        help="Daemon mode: write buffered snapshots to the store every N samples",
+    )
+    parser.add_argument(
+        "--metrics",
+        type=Path,
+        default=None,
+        help="Record request latency and cache metrics and write them here (.json, otherwise Prometheus text)",
+    )
+    args = parser.parse_args(argv)
+    if not args.market_id and not args.discover and args.import_legacy is None:
+        parser.error("provide at least one market_id, --discover or --import-legacy")
+    if args.output is not None and args.output.is_file():
+        parser.error(
+            f"--output now names a snapshot store directory, but {args.output} is a file; "
+            f"import its history with --import-legacy {args.output} --output DIRECTORY"
+        )
+    if args.compact and args.output is None and not args.save:
+        parser.error("--compact needs the store to compact: pass --output DIRECTORY or --save")
+    if args.import_legacy is not None and not args.import_legacy.is_file():
+        parser.error(f"--import-legacy: {args.import_legacy} is not a file")
+    if args.interval is not None and args.interval <= 0:
+        parser.error("--interval must be positive")
+    if args.flush_every < 1:
+        parser.error("--flush-every must be at least 1")
+    return args
+
+
+def _market_ids(client: PolymarketClient, args: argparse.Namespace) -> List[str]:
+    market_ids = list(args.market_id)
+    if args.discover:
+        market_ids += [
+            market.id for market in client.list_nba_markets() if market.status.lower() not in INACTIVE_STATUSES
+        ]
+    return list(dict.fromkeys(market_ids))
+
+
+def run_daemon(
+    client: PolymarketClient,
+    store: SnapshotStore,
+    args: argparse.Namespace,
+    *,
+    schedule: Optional[FixedRateSchedule] = None,
+    log: Callable[[str], None] = print,
+) -> Dict[str, float]:
+    """Sample orderbooks on a fixed cadence and append them to ``store`` in batches.
+
+    Markets are re-discovered every tick (cheap thanks to the client's response
+    cache) and fetched concurrently over one pooled session. When discovery
+    fails the previous tick's markets are sampled again. Returns the
+    scheduler's jitter summary.
+    """
+
+    import requests
+
+    if schedule is None:
+        from ..concurrency import FixedRateSchedule
+
+        schedule = FixedRateSchedule(args.interval)
+    buffered: List[Dict[str, object]] = []
+    captured = 0
+    market_ids = list(dict.fromkeys(args.market_id))
+    try:
+        for sample, _ in enumerate(schedule.ticks(args.iterations), start=1):
+            try:
+                market_ids = _market_ids(client, args)
+            except requests.RequestException as exc:
+                log(f"Market discovery failed ({exc}); sampling the previous {len(market_ids)} markets")
+            orderbooks = client.fetch_orderbooks(market_ids, skip_errors=True)
+            buffered.extend(snapshot_record(orderbook) for orderbook in orderbooks.values())
+            if sample % args.flush_every == 0:
+                captured += store.append(buffered)
+                buffered = []
+    except KeyboardInterrupt:
+        log("Interrupted; flushing buffered snapshots")
+    finally:
+        captured += store.append(buffered)
+
+    summary = schedule.jitter_summary()
+    if summary["ticks"]:
+        log(
+            f"Captured {captured} snapshots in {summary['ticks']} samples "
+            f"(missed {summary['missed']}); jitter mean {summary['mean'] * 1000:.1f} ms, "
+            f"p95 {summary['p95'] * 1000:.1f} ms, max {summary['max'] * 1000:.1f} ms"
+        )
+    return summary
 
 
 def main(args: argparse.Namespace | None = None) -> None:
     if args is None:
         args = parse_args()
 
-    settings = get_settings()
-    client = PolymarketClient()
-    snapshot = client.fetch_orderbook(args.market_id)
-
-    payload = {
-        "market_id": snapshot.market_id,
-        "timestamp": datetime.now(tz=timezone.utc).isoformat(),
-        "yes_price": snapshot.yes_price,
-        "no_price": snapshot.no_price,
-        "implied_yes_probability": snapshot.implied_yes_probability,
-        "implied_no_probability": snapshot.implied_no_probability,
-    }
-
-    if args.output is not None:
-        args.output.parent.mkdir(parents=True, exist_ok=True)
-        existing = []
-        if args.output.exists():
-            existing = json.loads(args.output.read_text())
-        existing.append(payload)
-        args.output.write_text(json.dumps(existing, indent=2))
-        print(f"Snapshot appended to {args.output}")
+    with metrics.exporting(args.metrics):
+        _snapshot(args)
+
+
+def _open_store(args: argparse.Namespace) -> SnapshotStore:
+    return SnapshotStore(args.output) if args.output is not None else default_store()
+
+
+def _snapshot(args: argparse.Namespace) -> None:
+    if args.import_legacy is not None:
+        store = _open_store(args)
+        imported = store.import_json(args.import_legacy)
+        print(f"Imported {imported} snapshots from {args.import_legacy} into {store.root}")
+        if not args.market_id and not args.discover:
+            if args.compact:
+                store.compact()
+            return
+
+    # requests and asyncio are only imported once there is work to do, so
+    # ``--help`` and argument errors return without paying for them.
+    from ..polymarket import PolymarketClient
+
+    with PolymarketClient() as client:
+        _sample(client, args)
+
+
+def _sample(client: PolymarketClient, args: argparse.Namespace) -> None:
+    if args.interval is not None:
+        store = _open_store(args)
+        run_daemon(client, store, args)
     else:
-        print(json.dumps(payload, indent=2))
+        market_ids = _market_ids(client, args)
+        if len(market_ids) == 1:
+            payloads = [snapshot_record(client.fetch_orderbook(market_ids[0]))]
+        else:
+            payloads = [snapshot_record(book) for book in client.fetch_orderbooks(market_ids).values()]
+
+        if args.output is None and not args.save and not args.compact:
+            for payload in payloads:
+                print(json.dumps(payload, indent=2))
+            return
+        store = _open_store(args)
+        store.append(payloads)
+        print(f"Snapshot appended to {store.root}")
+
+    if args.compact:
+        store.compact()
 
 
 if __name__ == "__main__":  # pragma: no cover
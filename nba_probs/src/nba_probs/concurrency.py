@@ -0,0 +1,195 @@
+"""Rate limiting and retry helpers shared by the network-bound pipelines."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing ``rate`` acquisitions per second.
+
+    Up to ``capacity`` tokens (one by default, i.e. no bursts) may be spent at
+    once; afterwards callers are paced at the refill rate. The bucket can be
+    shared between threads and between coroutines running on an event loop.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else 1.0)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        """Take a token if one is available.
+
+        Returns ``0.0`` on success, otherwise the number of seconds to wait
+        before a token will be available.
+        """
+
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return 0.0
+            return (1.0 - self._tokens) / self.rate
+
+    def acquire(self) -> None:
+        """Block the calling thread until a token is available."""
+
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait on the running event loop until a token is available."""
+
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+
+def backoff_delay(
+    attempt: int,
+    *,
+    base_delay: float = 0.5,
+    max_delay: float = 30.0,
+    rng: Optional[random.Random] = None,
+) -> float:
+    """Return a "full jitter" exponential backoff delay for ``attempt`` (0-based)."""
+
+    ceiling = min(max_delay, base_delay * (2 ** attempt))
+    return (rng or random).uniform(0.0, ceiling)
+
+
+def call_with_retry(
+    func: Callable[[], T],
+    *,
+    retries: int = 3,
+    base_delay: float = 0.5,
+    max_delay: float = 30.0,
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    sleep: Callable[[float], None] = time.sleep,
+    rng: Optional[random.Random] = None,
+) -> T:
+    """Call ``func`` and retry up to ``retries`` times with jittered backoff."""
+
+    for attempt in range(retries + 1):
+        try:
+            return func()
+        except retry_on:
+            if attempt == retries:
+                raise
+            sleep(backoff_delay(attempt, base_delay=base_delay, max_delay=max_delay, rng=rng))
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+async def async_call_with_retry(
+    func: Callable[[], Awaitable[T]],
+    *,
+    retries: int = 3,
+    base_delay: float = 0.5,
+    max_delay: float = 30.0,
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    rng: Optional[random.Random] = None,
+) -> T:
+    """Coroutine counterpart of :func:`call_with_retry`."""
+
+    for attempt in range(retries + 1):
+        try:
+            return await func()
+        except retry_on:
+            if attempt == retries:
+                raise
+            await asyncio.sleep(backoff_delay(attempt, base_delay=base_delay, max_delay=max_delay, rng=rng))
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+class FixedRateSchedule:
+    """Drift-free fixed-cadence ticker.
+
+    Tick ``k`` is due at ``start + k * interval`` regardless of how long the
+    previous iteration took, so delays never accumulate. Ticks that are
+    already in the past when the loop gets to them are skipped (and counted)
+    rather than run back to back. The lateness of every tick is recorded for
+    :meth:`jitter_summary`.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.interval = float(interval)
+        self._clock = clock
+        self._sleep = sleep
+        self.lateness: List[float] = []
+        self.missed = 0
+
+    def ticks(self, iterations: Optional[int] = None) -> Iterator[int]:
+        """Yield tick numbers, sleeping until each one is due."""
+
+        start = self._clock()
+        tick = 0
+        produced = 0
+        while iterations is None or produced < iterations:
+            due = start + tick * self.interval
+            now = self._clock()
+            if now < due:
+                self._sleep(due - now)
+                now = self._clock()
+            self.lateness.append(max(0.0, now - due))
+            yield tick
+            produced += 1
+            behind = int((self._clock() - start) // self.interval) - tick
+            skipped = max(0, behind)
+            self.missed += skipped
+            tick += 1 + skipped
+
+    def jitter_summary(self) -> Dict[str, float]:
+        """Return tick count, missed ticks and mean/p95/max lateness in seconds."""
+
+        if not self.lateness:
+            return {"ticks": 0, "missed": self.missed}
+        ordered = sorted(self.lateness)
+        return {
+            "ticks": len(ordered),
+            "missed": self.missed,
+            "mean": sum(ordered) / len(ordered),
+            "p95": ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))],
+            "max": ordered[-1],
+        }
+
+
+__all__ = [
+    "FixedRateSchedule",
+    "TokenBucket",
+    "backoff_delay",
+    "call_with_retry",
+    "async_call_with_retry",
+]
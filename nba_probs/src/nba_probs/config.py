@@ -1,22 +1,57 @@
-"""Configuration management for the NBA probability project."""
-
-from functools import lru_cache
-from pathlib import Path
-from typing import Optional
-
-from pydantic import BaseModel, Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+"""Configuration management for the NBA probability project.
 
+Settings are read from environment variables and the project's ``.env``
+file with the standard library only, so importing them costs nothing a
+one-shot command would notice. Directories are left to the code that
+writes into them; :meth:`Paths.ensure_exists` creates them all at once.
+"""
 
-class Paths(BaseModel):
-    """Collection of commonly used project paths."""
+from __future__ import annotations
 
-    project_root: Path = Field(default_factory=lambda: Path(__file__).resolve().parents[2])
-    data_dir: Path = Field(default_factory=lambda: Path(__file__).resolve().parents[2] / "data")
-    raw_data_dir: Path = Field(default_factory=lambda: Path(__file__).resolve().parents[2] / "data" / "raw")
-    processed_data_dir: Path = Field(default_factory=lambda: Path(__file__).resolve().parents[2] / "data" / "processed")
-    models_dir: Path = Field(default_factory=lambda: Path(__file__).resolve().parents[2] / "data" / "models")
-    polymarket_dir: Path = Field(default_factory=lambda: Path(__file__).resolve().parents[2] / "data" / "polymarket")
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DATA_DIR = PROJECT_ROOT / "data"
+ENV_FILE = PROJECT_ROOT / ".env"
+
+
+def read_env_file(path: Path) -> Dict[str, str]:
+    """Parse ``KEY=VALUE`` lines of a dotenv file; a missing file yields nothing."""
+
+    try:
+        lines = Path(path).read_text().splitlines()
+    except FileNotFoundError:
+        return {}
+    values = {}
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        key = key.strip()
+        if key.startswith("export "):
+            key = key[len("export "):].strip()
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+            value = value[1:-1]
+        values[key] = value
+    return values
+
+
+@dataclass(frozen=True)
+class Paths:
+    """Collection of commonly used project paths; none are created on access."""
+
+    project_root: Path = PROJECT_ROOT
+    data_dir: Path = DATA_DIR
+    raw_data_dir: Path = DATA_DIR / "raw"
+    processed_data_dir: Path = DATA_DIR / "processed"
+    models_dir: Path = DATA_DIR / "models"
+    polymarket_dir: Path = DATA_DIR / "polymarket"
 
     def ensure_exists(self) -> None:
         """Create directories if they do not already exist."""
@@ -31,26 +66,34 @@ class Paths(BaseModel):
             path.mkdir(parents=True, exist_ok=True)
 
 
-class Settings(BaseSettings):
+@dataclass(frozen=True)
+class Settings:
     """Runtime configuration derived from environment variables."""
 
-    polymarket_api_key: Optional[str] = Field(default=None, alias="POLYMARKET_API_KEY")
-    polymarket_api_secret: Optional[str] = Field(default=None, alias="POLYMARKET_API_SECRET")
-    http_proxy: Optional[str] = Field(default=None, alias="HTTP_PROXY")
-    https_proxy: Optional[str] = Field(default=None, alias="HTTPS_PROXY")
+    polymarket_api_key: Optional[str] = None
+    polymarket_api_secret: Optional[str] = None
+    http_proxy: Optional[str] = None
+    https_proxy: Optional[str] = None
 
-    paths: Paths = Field(default_factory=Paths)
-
-    model_config = SettingsConfigDict(env_file=Path(__file__).resolve().parents[2] / ".env", extra="ignore")
+    paths: Paths = field(default_factory=Paths)
 
 
 @lru_cache
 def get_settings() -> Settings:
-    """Return a cached Settings instance."""
+    """Return a cached Settings instance read from the environment and ``.env``.
+
+    Names are matched case-insensitively and the environment takes
+    precedence over the file.
+    """
 
-    settings = Settings()  # type: ignore[call-arg]
-    settings.paths.ensure_exists()
-    return settings
+    values = {key.upper(): value for key, value in read_env_file(ENV_FILE).items()}
+    values.update((key.upper(), value) for key, value in os.environ.items())
+    return Settings(
+        polymarket_api_key=values.get("POLYMARKET_API_KEY"),
+        polymarket_api_secret=values.get("POLYMARKET_API_SECRET"),
+        http_proxy=values.get("HTTP_PROXY"),
+        https_proxy=values.get("HTTPS_PROXY"),
+    )
 
 
-__all__ = ["Settings", "Paths", "get_settings"]
+__all__ = ["Settings", "Paths", "get_settings", "read_env_file"]
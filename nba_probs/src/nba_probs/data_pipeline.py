@@ -2,12 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Iterable, List, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
+from . import metrics
+from .concurrency import TokenBucket, async_call_with_retry, call_with_retry
 from .config import get_settings
 
+if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
+    from .raw_cache import RawPlayByPlayCache
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class GameMinute:
@@ -48,7 +63,13 @@ def fetch_play_by_play(game_id: str):
 
 
 def summarize_game_by_minute(plays):
-    """Convert raw play-by-play events into one-minute summaries."""
+    """Convert raw play-by-play events into one-minute summaries.
+
+    This row-by-row version is kept as the reference implementation; the
+    pipeline uses :func:`summarize_game_by_minute_fast`. Events sharing a
+    clock (free throws, substitutions) keep their arrival order, so the last
+    one to arrive sets the minute's score.
+    """
 
     import pandas as pd  # type: ignore import-not-found
 
@@ -64,7 +85,7 @@ def summarize_game_by_minute(plays):
     minutes: List[GameMinute] = []
 
     for period, group in periods:
-        group = group.sort_values("clock", ascending=False)
+        group = group.sort_values("clock", ascending=False, kind="stable")
         game_clock = 12 * 60 if period <= 4 else 5 * 60
 
         home_score = 0
@@ -100,24 +121,736 @@ def summarize_game_by_minute(plays):
     return df
 
 
-def batch_fetch(game_ids: Iterable[str], show_progress: bool = True):
-    """Download and summarize multiple games."""
+_REGULATION_PERIODS = 4
+_REGULATION_PERIOD_SECONDS = 12 * 60
+_OVERTIME_PERIOD_SECONDS = 5 * 60
+
+MINUTE_COLUMNS = (
+    "game_id",
+    "minute_index",
+    "period",
+    "seconds_remaining",
+    "home_team_score",
+    "away_team_score",
+    "home_team_id",
+    "away_team_id",
+    "home_win",
+    "game_date",
+    "score_margin",
+)
+
 
+def _event_clock_arrays(plays):
+    """Return ``(period, clock_seconds, minute_index, seconds_remaining)`` arrays for events."""
+
+    import numpy as np  # type: ignore import-not-found
     import pandas as pd  # type: ignore import-not-found
 
-    from tqdm import tqdm  # type: ignore import-not-found
+    period = plays["periodNumber"].astype("int64").to_numpy()
+    clock_seconds = pd.to_timedelta(plays["clock"]).dt.total_seconds().to_numpy()
+
+    regulation = period <= _REGULATION_PERIODS
+    game_clock = np.where(regulation, _REGULATION_PERIOD_SECONDS, _OVERTIME_PERIOD_SECONDS)
+    elapsed = game_clock - np.trunc(clock_seconds).astype(np.int64)
+    minute_index = elapsed // 60 + (period - 1) * 12
+    seconds_remaining = np.trunc(
+        np.where(
+            regulation,
+            clock_seconds + (_REGULATION_PERIODS - period) * _REGULATION_PERIOD_SECONDS,
+            clock_seconds,
+        )
+    ).astype(np.int64)
+    return period, clock_seconds, minute_index, seconds_remaining
+
+
+def _summarize_columnar(plays):
+    """Summarize play-by-play events for one or more games using array operations.
+
+    Mirrors :func:`summarize_game_by_minute`: events are ordered by period and
+    descending clock (ties keep their original order), and the last event seen
+    in each ``(game_id, minute_index)`` bucket supplies the row for that minute.
+    """
+
+    import numpy as np  # type: ignore import-not-found
+    import pandas as pd  # type: ignore import-not-found
+
+    n_events = len(plays)
+    game_codes, _ = pd.factorize(plays["gameId"], sort=False)
+    period, clock_seconds, minute_index, seconds_remaining = _event_clock_arrays(plays)
+    home_score = plays["homeScore"].astype("int64").to_numpy()
+    away_score = plays["awayScore"].astype("int64").to_numpy()
+
+    # Rank every event by the order the reference implementation visits it.
+    position = np.arange(n_events)
+    visit_order = np.lexsort((position, -clock_seconds, period, game_codes))
+    visit_rank = np.empty(n_events, dtype=np.int64)
+    visit_rank[visit_order] = position
+
+    # Group by (game, minute) and keep the most recently visited event.
+    ordered = np.lexsort((visit_rank, minute_index, game_codes))
+    ordered_games = game_codes[ordered]
+    ordered_minutes = minute_index[ordered]
+    is_last = np.ones(n_events, dtype=bool)
+    is_last[:-1] = (ordered_games[1:] != ordered_games[:-1]) | (ordered_minutes[1:] != ordered_minutes[:-1])
+    keep = ordered[is_last]
+
+    # The final event of each game (in input order) decides the label.
+    reversed_codes = game_codes[::-1]
+    _, first_in_reverse = np.unique(reversed_codes, return_index=True)
+    final_event = n_events - 1 - first_in_reverse
+    home_win_by_game = (home_score[final_event] > away_score[final_event]).astype(np.int64)
+
+    if "gameDate" in plays.columns:
+        game_date = pd.to_datetime(plays["gameDate"].to_numpy()[keep])
+    else:
+        game_date = [None] * len(keep)
+
+    kept_home = home_score[keep]
+    kept_away = away_score[keep]
+    return pd.DataFrame(
+        {
+            "game_id": plays["gameId"].to_numpy()[keep],
+            "minute_index": minute_index[keep],
+            "period": period[keep],
+            "seconds_remaining": seconds_remaining[keep],
+            "home_team_score": kept_home,
+            "away_team_score": kept_away,
+            "home_team_id": plays["homeTeamId"].astype("int64").to_numpy()[keep],
+            "away_team_id": plays["visitorTeamId"].astype("int64").to_numpy()[keep],
+            "home_win": home_win_by_game[game_codes[keep]],
+            "game_date": game_date,
+            "score_margin": kept_home - kept_away,
+        },
+        columns=list(MINUTE_COLUMNS),
+    )
+
+
+def summarize_game_by_minute_fast(plays):
+    """Vectorized equivalent of :func:`summarize_game_by_minute` for a single game."""
+
+    if plays.empty:
+        raise ValueError("Expected play-by-play events, received empty DataFrame")
+
+    return _summarize_columnar(plays)
+
 
-    records: List[pd.DataFrame] = []
-    iterator: Iterable[str] = tqdm(game_ids, desc="Downloading games") if show_progress else game_ids
+def summarize_games(plays):
+    """Summarize the concatenated play-by-play events of many games in one pass.
 
-    for game_id in iterator:
+    Games are returned in the order they first appear in ``plays``, each sorted
+    by ``minute_index``.
+    """
+
+    if plays.empty:
+        raise ValueError("Expected play-by-play events, received empty DataFrame")
+
+    return _summarize_columnar(plays)
+
+
+@dataclass
+class _LiveGame:
+    """Per-game state held by :class:`IncrementalMinuteSummarizer`."""
+
+    order: int
+    # minute_index -> (visit key, row); the key is (period, -clock, arrival position)
+    minutes: Dict[int, Tuple[Tuple[int, float, int], Tuple[Any, ...]]]
+    dirty: set
+    max_minute: int = -1
+    final_home: int = 0
+    final_away: int = 0
+
+
+class IncrementalMinuteSummarizer:
+    """Maintain minute summaries of live games from play-by-play deltas.
+
+    :meth:`feed` takes only the events appended since the previous call, in
+    the same order they would appear in the full play-by-play. Each minute
+    keeps the event the batch summarizer would pick: the one latest in
+    ``(period, descending clock, arrival)`` order. This also resolves the
+    minute-12 collision between the end of one period and the start of the
+    next. A minute counts as finalized once an event from a later minute of
+    the same game has arrived.
+
+    Finalized minutes whose row changed are returned by :meth:`feed` and the
+    rest by :meth:`flush`, with ``home_win`` left as ``None``. :meth:`to_frame`
+    returns exactly what :func:`summarize_games` returns for all events fed so
+    far, labels included.
+    """
+
+    def __init__(self) -> None:
+        self._games: Dict[Any, _LiveGame] = {}
+        self._events = 0
+
+    def __len__(self) -> int:
+        return sum(len(game.minutes) for game in self._games.values())
+
+    def feed(self, plays) -> List[GameMinute]:
+        """Apply new events and return the minutes they finalized or changed."""
+
+        with metrics.timer("nba_live_feed_seconds"):
+            emitted = self._feed(plays)
+        metrics.inc("nba_live_events_total", len(plays))
+        metrics.inc("nba_live_minutes_emitted_total", len(emitted))
+        return emitted
+
+    def _feed(self, plays) -> List[GameMinute]:
+        import numpy as np  # type: ignore import-not-found
+        import pandas as pd  # type: ignore import-not-found
+
+        if plays.empty:
+            return []
+
+        n_events = len(plays)
+        game_ids = plays["gameId"].to_numpy()
+        game_codes, uniques = pd.factorize(plays["gameId"], sort=False)
+        period, clock_seconds, minute_index, seconds_remaining = _event_clock_arrays(plays)
+        home_score = plays["homeScore"].astype("int64").to_numpy()
+        away_score = plays["awayScore"].astype("int64").to_numpy()
+        home_team = plays["homeTeamId"].astype("int64").to_numpy()
+        away_team = plays["visitorTeamId"].astype("int64").to_numpy()
+        game_dates = plays["gameDate"].to_numpy() if "gameDate" in plays.columns else np.full(n_events, None)
+        position = np.arange(self._events, self._events + n_events)
+        self._events += n_events
+
+        # Reduce the delta to its best event per (game, minute) before touching state.
+        ordered = np.lexsort((position, -clock_seconds, period, minute_index, game_codes))
+        last = np.ones(n_events, dtype=bool)
+        last[:-1] = (game_codes[ordered][1:] != game_codes[ordered][:-1]) | (
+            minute_index[ordered][1:] != minute_index[ordered][:-1]
+        )
+        for index in ordered[last].tolist():
+            game = self._game(game_ids[index])
+            minute = int(minute_index[index])
+            key = (int(period[index]), -float(clock_seconds[index]), int(position[index]))
+            current = game.minutes.get(minute)
+            if current is None or key > current[0]:
+                row = (
+                    int(period[index]),
+                    int(seconds_remaining[index]),
+                    int(home_score[index]),
+                    int(away_score[index]),
+                    int(home_team[index]),
+                    int(away_team[index]),
+                    game_dates[index],
+                )
+                game.minutes[minute] = (key, row)
+                game.dirty.add(minute)
+
+        emitted: List[GameMinute] = []
+        for code, game_id in enumerate(uniques):
+            game = self._games[game_id]
+            in_game = np.flatnonzero(game_codes == code)
+            final = in_game[-1]
+            game.final_home, game.final_away = int(home_score[final]), int(away_score[final])
+            game.max_minute = max(game.max_minute, int(minute_index[in_game].max()))
+            ready = sorted(minute for minute in game.dirty if minute < game.max_minute)
+            game.dirty.difference_update(ready)
+            emitted.extend(self._minute(game_id, game, minute) for minute in ready)
+        return emitted
+
+    def flush(self) -> List[GameMinute]:
+        """Return every changed minute not emitted yet, including the current one."""
+
+        emitted: List[GameMinute] = []
+        for game_id, game in self._games.items():
+            emitted.extend(self._minute(game_id, game, minute) for minute in sorted(game.dirty))
+            game.dirty.clear()
+        return emitted
+
+    def to_frame(self):
+        """Return the minute summaries of every game, identical to :func:`summarize_games`."""
+
+        import pandas as pd  # type: ignore import-not-found
+
+        records = []
+        for game_id, game in sorted(self._games.items(), key=lambda item: item[1].order):
+            home_win = int(game.final_home > game.final_away)
+            for minute in sorted(game.minutes):
+                period, seconds, home, away, home_team, away_team, game_date = game.minutes[minute][1]
+                records.append(
+                    (game_id, minute, period, seconds, home, away, home_team, away_team, home_win, game_date, home - away)
+                )
+
+        frame = pd.DataFrame.from_records(records, columns=list(MINUTE_COLUMNS))
+        for column in MINUTE_COLUMNS:
+            if column not in ("game_id", "game_date"):
+                frame[column] = frame[column].astype("int64")
+        if records and any(record[9] is not None for record in records):
+            frame["game_date"] = pd.to_datetime(frame["game_date"])
+        return frame
+
+    def _game(self, game_id) -> _LiveGame:
+        game = self._games.get(game_id)
+        if game is None:
+            game = self._games[game_id] = _LiveGame(order=len(self._games), minutes={}, dirty=set())
+        return game
+
+    @staticmethod
+    def _minute(game_id, game: _LiveGame, minute: int) -> GameMinute:
+        import pandas as pd  # type: ignore import-not-found
+
+        period, seconds, home, away, home_team, away_team, game_date = game.minutes[minute][1]
+        return GameMinute(
+            game_id=game_id,
+            minute_index=minute,
+            period=period,
+            seconds_remaining=seconds,
+            home_team_score=home,
+            away_team_score=away,
+            home_team_id=home_team,
+            away_team_id=away_team,
+            home_win=None,
+            game_date=pd.to_datetime(game_date) if game_date is not None else None,
+        )
+
+
+FETCH_MODES = ("serial", "threads", "asyncio")
+
+FetchResult = Tuple[str, Any, Optional[BaseException]]
+
+
+def _iter_serial(game_ids: List[str], work: Callable[[str], Any]) -> Iterator[FetchResult]:
+    for game_id in game_ids:
+        try:
+            yield game_id, work(game_id), None
+        except Exception as exc:
+            yield game_id, None, exc
+
+
+def _iter_threads(game_ids: List[str], work: Callable[[str], Any], concurrency: int) -> Iterator[FetchResult]:
+    # Keep a bounded window of submitted games so results are handed out as
+    # they finish instead of accumulating behind a fully queued executor.
+    pending_ids = iter(game_ids)
+    window = max(1, concurrency) * 2
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        in_flight: Dict[Future, str] = {}
+        for game_id in itertools.islice(pending_ids, window):
+            in_flight[pool.submit(work, game_id)] = game_id
+
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                game_id = in_flight.pop(future)
+                try:
+                    yield game_id, future.result(), None
+                except Exception as exc:
+                    yield game_id, None, exc
+                for next_id in itertools.islice(pending_ids, 1):
+                    in_flight[pool.submit(work, next_id)] = next_id
+
+
+def _iter_asyncio(
+    game_ids: List[str],
+    work: Callable[[str], Awaitable[Any]],
+    concurrency: int,
+) -> Iterator[FetchResult]:
+    # The event loop runs on a helper thread and hands results over through
+    # an unbounded queue, so its coroutines never block on the consumer.
+    # Backpressure comes from ``slots`` instead: a game only starts once one
+    # of the ``2 * concurrency`` slots is free, and the consumer frees a slot
+    # for every result it takes. Closing the generator cancels the loop.
+    results: "queue.Queue[object]" = queue.Queue()
+    finished = object()
+    loop = asyncio.new_event_loop()
+    slots = asyncio.Semaphore(max(1, concurrency) * 2)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run_one(game_id: str) -> None:
+        await slots.acquire()
+        async with semaphore:
+            try:
+                frame = await work(game_id)
+            except Exception as exc:
+                results.put_nowait((game_id, None, exc))
+            else:
+                results.put_nowait((game_id, frame, None))
+
+    async def run_all() -> None:
+        await asyncio.gather(*(run_one(game_id) for game_id in game_ids))
+
+    main = loop.create_task(run_all())
+
+    def run_loop() -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(main)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+            loop.close()
+            results.put(finished)
+
+    def call_in_loop(callback: Callable[[], object]) -> None:
+        try:
+            loop.call_soon_threadsafe(callback)
+        except RuntimeError:  # the loop has already finished and closed
+            pass
+
+    thread = threading.Thread(target=run_loop, name="batch-fetch-loop", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = results.get()
+            if item is finished:
+                break
+            call_in_loop(slots.release)
+            yield item  # type: ignore[misc]
+    finally:
+        call_in_loop(main.cancel)
+        thread.join()
+
+
+# Columns read by the summarizer; only these cross the process boundary.
+SUMMARY_INPUT_COLUMNS = (
+    "gameId",
+    "periodNumber",
+    "clock",
+    "homeScore",
+    "awayScore",
+    "homeTeamId",
+    "visitorTeamId",
+    "gameDate",
+)
+# The I/O stage runs on threads, so worker processes must not be forked from it.
+SUMMARY_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def _plays_to_ipc(plays):
+    """Serialize the summarizer's input columns to an Arrow IPC stream buffer.
+
+    A buffer pickles as one contiguous copy, unlike a frame of Python
+    objects. Frames Arrow cannot type are returned unchanged and pickled.
+    """
+
+    import pyarrow as pa  # type: ignore import-not-found
+
+    columns = [column for column in SUMMARY_INPUT_COLUMNS if column in plays.columns]
+    try:
+        table = pa.Table.from_pandas(plays, columns=columns, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return plays
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def _summarize_payload(payload):
+    """Process-pool task: summarize one game and report the seconds it took."""
+
+    import pyarrow as pa  # type: ignore import-not-found
+
+    start = time.perf_counter()
+    if isinstance(payload, pa.Buffer):
+        payload = pa.ipc.open_stream(payload).read_all().to_pandas()
+    minutes = summarize_game_by_minute_fast(payload)
+    return minutes, time.perf_counter() - start
+
+
+def _iter_process_pool(raw_results: Iterator[FetchResult], processes: int) -> Iterator[FetchResult]:
+    """Summarize the raw frames yielded by ``raw_results`` on a process pool.
+
+    A helper thread drives the I/O stage and submits each frame as soon as it
+    arrives, so downloads continue while workers summarize. At most
+    ``2 * processes`` games are submitted but not yet consumed; beyond that
+    the I/O stage blocks, which also stops it from fetching further ahead.
+    Results are yielded in completion order.
+    """
+
+    slots = threading.Semaphore(max(1, processes) * 2)
+    results: "queue.Queue[Tuple[Any, Any, Optional[BaseException]]]" = queue.Queue()
+    stop = threading.Event()
+    finished = object()
+
+    def hand_over(game_id: str) -> Callable[[Future], None]:
+        def callback(future: Future) -> None:
+            results.put((game_id, future, None))
+
+        return callback
+
+    def produce(pool: ProcessPoolExecutor) -> None:
+        count = 0
+        failure: Optional[BaseException] = None
         try:
-            plays = fetch_play_by_play(game_id)
-            minutes = summarize_game_by_minute(plays)
-            records.append(minutes)
-        except Exception as exc:  # pragma: no cover - debug logging placeholder
-            print(f"Failed to process game {game_id}: {exc}")
-            continue
+            for game_id, plays, error in raw_results:
+                if error is not None:
+                    results.put((game_id, None, error))
+                    count += 1
+                    continue
+                payload = _plays_to_ipc(plays)
+                while not slots.acquire(timeout=0.1):
+                    if stop.is_set():
+                        return
+                if stop.is_set():
+                    return
+                future = pool.submit(_summarize_payload, payload)
+                future.add_done_callback(hand_over(game_id))
+                count += 1
+        except BaseException as exc:  # surfaced to the consumer below
+            failure = exc
+        finally:
+            close = getattr(raw_results, "close", None)
+            if close is not None:
+                close()
+            results.put((finished, count, failure))
+
+    context = multiprocessing.get_context(SUMMARY_START_METHOD)
+    with ProcessPoolExecutor(max_workers=max(1, processes), mp_context=context) as pool:
+        producer = threading.Thread(target=produce, args=(pool,), name="batch-fetch-io", daemon=True)
+        producer.start()
+        received = 0
+        expected: Optional[int] = None
+        failure: Optional[BaseException] = None
+        try:
+            while expected is None or received < expected:
+                game_id, value, error = results.get()
+                if game_id is finished:
+                    expected, failure = value, error
+                    continue
+                received += 1
+                if not isinstance(value, Future):
+                    yield game_id, None, error
+                    continue
+                slots.release()
+                try:
+                    minutes, elapsed = value.result()
+                except Exception as exc:
+                    yield game_id, None, exc
+                    continue
+                metrics.observe("nba_summarize_seconds", elapsed)
+                metrics.inc("nba_summarized_minutes_total", len(minutes))
+                yield game_id, minutes, None
+            if failure is not None:
+                raise failure
+        finally:
+            stop.set()
+            producer.join()
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _iter_fetch_results(
+    game_ids: Iterable[str],
+    *,
+    fetcher: Callable[[str], Any],
+    mode: str,
+    concurrency: int,
+    rate_limit: Optional[float],
+    retries: int,
+    base_delay: float,
+    max_delay: float,
+    cache: Optional[RawPlayByPlayCache] = None,
+    offline: bool = False,
+    processes: int = 0,
+) -> Iterator[FetchResult]:
+    """Yield ``(game_id, minutes, error)`` tuples in completion order.
+
+    With ``processes``, the ``mode`` workers only load raw frames and
+    summarizing moves to a process pool (see :func:`_iter_process_pool`).
+    """
+
+    if mode not in FETCH_MODES:
+        raise ValueError(f"Unknown fetch mode {mode!r}; expected one of {FETCH_MODES}")
+    if processes < 0:
+        raise ValueError("processes must not be negative")
+
+    ids = list(game_ids)
+    limiter = TokenBucket(rate_limit) if rate_limit else None
+
+    def fetch_once(game_id: str):
+        if limiter is not None:
+            with metrics.timer("nba_rate_limit_wait_seconds"):
+                limiter.acquire()
+        metrics.inc("nba_fetch_attempts_total")
+        with metrics.timer("nba_fetch_seconds"):
+            return fetcher(game_id)
+
+    def from_cache(game_id: str):
+        if cache is None:
+            if offline:
+                raise LookupError("Offline mode requires a raw play-by-play cache")
+            return None
+        # Finished games are final; unfinished ones are only reused offline.
+        plays = cache.get(game_id, finished_only=not offline)
+        if plays is None and offline:
+            raise LookupError(f"Game {game_id} is not in the raw cache")
+        metrics.inc("nba_raw_cache_total", outcome="miss" if plays is None else "hit")
+        return plays
+
+    def to_cache(game_id: str, plays) -> None:
+        if cache is not None:
+            cache.put(game_id, plays)
+
+    def summarize(plays):
+        with metrics.timer("nba_summarize_seconds"):
+            minutes = summarize_game_by_minute_fast(plays)
+        metrics.inc("nba_summarized_minutes_total", len(minutes))
+        return minutes
+
+    def load(game_id: str):
+        plays = from_cache(game_id)
+        if plays is None:
+            plays = call_with_retry(
+                lambda: fetch_once(game_id), retries=retries, base_delay=base_delay, max_delay=max_delay
+            )
+            to_cache(game_id, plays)
+        return plays
+
+    def work(game_id: str):
+        return summarize(load(game_id))
+
+    async def load_async(game_id: str):
+        async def attempt():
+            if limiter is not None:
+                with metrics.timer("nba_rate_limit_wait_seconds"):
+                    await limiter.acquire_async()
+            metrics.inc("nba_fetch_attempts_total")
+            with metrics.timer("nba_fetch_seconds"):
+                return await asyncio.to_thread(fetcher, game_id)
+
+        plays = from_cache(game_id)
+        if plays is None:
+            plays = await async_call_with_retry(
+                attempt, retries=retries, base_delay=base_delay, max_delay=max_delay
+            )
+            to_cache(game_id, plays)
+        return plays
+
+    async def work_async(game_id: str):
+        return summarize(await load_async(game_id))
+
+    if processes:
+        if mode == "serial":
+            raw = _iter_serial(ids, load)
+        elif mode == "threads":
+            raw = _iter_threads(ids, load, concurrency)
+        else:
+            raw = _iter_asyncio(ids, load_async, concurrency)
+        return _iter_process_pool(raw, processes)
+
+    if mode == "serial":
+        return _iter_serial(ids, work)
+    if mode == "threads":
+        return _iter_threads(ids, work, concurrency)
+    return _iter_asyncio(ids, work_async, concurrency)
+
+
+def iter_batch_fetch(
+    game_ids: Iterable[str],
+    show_progress: bool = True,
+    *,
+    mode: str = "serial",
+    concurrency: int = 4,
+    rate_limit: Optional[float] = None,
+    retries: int = 3,
+    base_delay: float = 0.5,
+    max_delay: float = 30.0,
+    fetcher: Optional[Callable[[str], Any]] = None,
+    cache: Optional[RawPlayByPlayCache] = None,
+    offline: bool = False,
+    processes: int = 0,
+) -> Iterator[Any]:
+    """Download and summarize multiple games, yielding each game's minutes as it finishes.
+
+    ``mode`` selects sequential downloads (``"serial"``), a bounded thread pool
+    (``"threads"``) or an asyncio event loop (``"asyncio"``); ``concurrency``
+    caps the number of requests in flight. ``rate_limit`` (requests per second)
+    is enforced with a token bucket shared by all workers and failed requests
+    are retried ``retries`` times with jittered exponential backoff.
+
+    With a raw ``cache``, finished games are read from disk instead of the
+    network and fresh downloads are stored for next time. ``offline`` serves
+    every game from the cache and never calls ``fetcher``.
+
+    ``processes`` moves summarizing off the I/O workers onto that many worker
+    processes: the workers above only download or read raw frames, which are
+    handed over as Arrow IPC buffers, so a cache rebuild uses every core.
+    The summaries are identical to the in-thread path.
+
+    Only the games in flight are held in memory, so the caller decides how
+    many summaries to buffer. Games that still fail after retrying are
+    logged and skipped. Fetch, summarize and rate-limit wait times are
+    recorded in :mod:`nba_probs.metrics` when it is enabled.
+    """
+
+    from tqdm import tqdm  # type: ignore import-not-found
+
+    ids = list(game_ids)
+    results = _iter_fetch_results(
+        ids,
+        fetcher=fetcher or fetch_play_by_play,
+        mode=mode,
+        concurrency=concurrency,
+        rate_limit=rate_limit,
+        retries=retries,
+        base_delay=base_delay,
+        max_delay=max_delay,
+        cache=cache,
+        offline=offline,
+        processes=processes,
+    )
+
+    progress = tqdm(total=len(ids), desc="Downloading games") if show_progress else None
+    try:
+        for game_id, minutes, error in results:
+            if progress is not None:
+                progress.update(1)
+            if error is not None:
+                metrics.inc("nba_games_total", status="failed")
+                logger.warning("Failed to process game %s: %s", game_id, error)
+                continue
+            metrics.inc("nba_games_total", status="ok")
+            yield minutes
+    finally:
+        close = getattr(results, "close", None)
+        if close is not None:
+            close()
+        if progress is not None:
+            progress.close()
+        if cache is not None:
+            cache.flush()
+
+
+def batch_fetch(
+    game_ids: Iterable[str],
+    show_progress: bool = True,
+    *,
+    mode: str = "serial",
+    concurrency: int = 4,
+    rate_limit: Optional[float] = None,
+    retries: int = 3,
+    base_delay: float = 0.5,
+    max_delay: float = 30.0,
+    fetcher: Optional[Callable[[str], Any]] = None,
+    cache: Optional[RawPlayByPlayCache] = None,
+    offline: bool = False,
+    processes: int = 0,
+):
+    """Download and summarize multiple games into one DataFrame.
+
+    Accepts the same options as :func:`iter_batch_fetch`; games are
+    concatenated in the order they finish.
+    """
+
+    import pandas as pd  # type: ignore import-not-found
+
+    records: List[pd.DataFrame] = list(
+        iter_batch_fetch(
+            game_ids,
+            show_progress,
+            mode=mode,
+            concurrency=concurrency,
+            rate_limit=rate_limit,
+            retries=retries,
+            base_delay=base_delay,
+            max_delay=max_delay,
+            fetcher=fetcher,
+            cache=cache,
+            offline=offline,
+            processes=processes,
+        )
+    )
 
     if not records:
         raise RuntimeError("No games were successfully processed.")
@@ -129,5 +862,10 @@ __all__ = [
     "GameMinute",
     "fetch_play_by_play",
     "summarize_game_by_minute",
+    "summarize_game_by_minute_fast",
+    "summarize_games",
+    "IncrementalMinuteSummarizer",
+    "iter_batch_fetch",
     "batch_fetch",
+    "FETCH_MODES",
 ]
@@ -0,0 +1,331 @@
+"""Hive-partitioned Parquet store for the processed minute-level dataset."""
+
+from __future__ import annotations
+
+import json
+import os
+import uuid
+from dataclasses import asdict, dataclass, replace
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from .config import get_settings
+from .schema import from_arrow_table, minute_schema, to_arrow_table, validate_table
+
+CATALOG_VERSION = 1
+UNKNOWN_PARTITION = "unknown"
+WRITE_MODES = ("append", "upsert")
+
+DateLike = Union[str, date, datetime]
+
+
+@dataclass
+class CatalogEntry:
+    """Location and size of one game inside the dataset."""
+
+    partition: str
+    file: str
+    rows: int
+
+
+def season_from_game_id(game_id: str) -> Optional[str]:
+    """Return the season label (e.g. ``"2023-24"``) encoded in an NBA game ID.
+
+    NBA game IDs look like ``0022300001``: the fourth and fifth digits hold the
+    two-digit year the season starts in.
+    """
+
+    if len(game_id) != 10 or not game_id.isdigit():
+        return None
+    start = 2000 + int(game_id[3:5])
+    return f"{start}-{(start + 1) % 100:02d}"
+
+
+def season_from_date(value) -> Optional[str]:
+    """Return the season a game played on ``value`` belongs to."""
+
+    import pandas as pd  # type: ignore import-not-found
+
+    if value is None or pd.isna(value):
+        return None
+    timestamp = pd.Timestamp(value)
+    start = timestamp.year if timestamp.month >= 8 else timestamp.year - 1
+    return f"{start}-{(start + 1) % 100:02d}"
+
+
+def _partition_for_game(game_id: str, game_date) -> str:
+    season = season_from_game_id(str(game_id)) or season_from_date(game_date) or UNKNOWN_PARTITION
+    day = game_date.strftime("%Y-%m-%d") if game_date is not None else UNKNOWN_PARTITION
+    return f"season={season}/date={day}"
+
+
+class MinuteDataset:
+    """Processed minute summaries stored as ``season=<season>/date=<YYYY-MM-DD>`` partitions.
+
+    Each write adds one Parquet file per touched partition, so collecting a
+    night of games only creates files for that night. A catalog at
+    ``root/_catalog.json`` records which games are present and where; upserts
+    rewrite only the files that hold the games being replaced.
+    """
+
+    def __init__(self, root: Path, *, compression: str = "zstd") -> None:
+        self.root = Path(root)
+        self.catalog_path = self.root / "_catalog.json"
+        self.compression = compression
+        self._catalog = self._load_catalog()
+
+    def _load_catalog(self) -> Dict[str, CatalogEntry]:
+        if not self.catalog_path.exists():
+            return {}
+        payload = json.loads(self.catalog_path.read_text())
+        if payload.get("version") != CATALOG_VERSION:
+            raise ValueError(f"Unsupported dataset catalog version: {payload.get('version')!r}")
+        return {game_id: CatalogEntry(**entry) for game_id, entry in payload["games"].items()}
+
+    def _save_catalog(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": CATALOG_VERSION,
+            "games": {game_id: asdict(entry) for game_id, entry in sorted(self._catalog.items())},
+        }
+        tmp_path = self.catalog_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(payload, indent=2))
+        os.replace(tmp_path, self.catalog_path)
+
+    def __contains__(self, game_id: object) -> bool:
+        return game_id in self._catalog
+
+    def __len__(self) -> int:
+        return len(self._catalog)
+
+    def game_ids(self) -> List[str]:
+        """Return the IDs of every game in the dataset."""
+
+        return sorted(self._catalog)
+
+    def partitions(self) -> List[str]:
+        """Return the partitions that currently hold data."""
+
+        return sorted({entry.partition for entry in self._catalog.values()})
+
+    def catalog(self) -> Dict[str, CatalogEntry]:
+        return dict(self._catalog)
+
+    def _write_file(self, partition: str, table) -> str:
+        import pyarrow.parquet as pq  # type: ignore import-not-found
+
+        directory = self.root / partition
+        directory.mkdir(parents=True, exist_ok=True)
+        name = f"part-{uuid.uuid4().hex}.parquet"
+        tmp_path = directory / f".{name}.tmp"
+        pq.write_table(table, tmp_path, compression=self.compression)
+        os.replace(tmp_path, directory / name)
+        return name
+
+    def _drop_games(self, catalog: Dict[str, CatalogEntry], game_ids: Iterable[str]) -> List[Path]:
+        """Write copies of the files holding ``game_ids`` without them into ``catalog``.
+
+        The replaced files are left in place and returned, to be deleted once
+        the catalog no longer refers to them.
+        """
+
+        import pyarrow.parquet as pq  # type: ignore import-not-found
+
+        by_file: Dict[tuple, set] = {}
+        for game_id in game_ids:
+            entry = catalog.get(game_id)
+            if entry is not None:
+                by_file.setdefault((entry.partition, entry.file), set()).add(game_id)
+
+        replaced = []
+        for (partition, name), dropped in by_file.items():
+            path = self.root / partition / name
+            remaining = from_arrow_table(pq.read_table(path))
+            remaining = remaining.loc[~remaining["game_id"].astype(str).isin(dropped)]
+            for game_id in dropped:
+                del catalog[game_id]
+            if not remaining.empty:
+                new_name = self._write_file(partition, to_arrow_table(remaining))
+                for game_id in remaining["game_id"].astype(str).unique():
+                    catalog[game_id].file = new_name
+            replaced.append(path)
+        return replaced
+
+    def write(self, frame, *, mode: str = "upsert") -> List[str]:
+        """Add the games in ``frame`` to the dataset and return the touched partitions.
+
+        ``mode="append"`` refuses games that are already present, while
+        ``mode="upsert"`` replaces them. Rows are stored with the compact
+        :func:`~nba_probs.schema.minute_schema` types. New files are written
+        and the catalog saved before any replaced file is deleted, so an
+        interrupted write leaves the previous contents readable.
+        """
+
+        import pandas as pd  # type: ignore import-not-found
+
+        if mode not in WRITE_MODES:
+            raise ValueError(f"Unknown write mode {mode!r}; expected one of {WRITE_MODES}")
+        if frame.empty:
+            return []
+
+        frame = frame.copy()
+        frame["game_id"] = frame["game_id"].astype(str)
+        if "game_date" in frame.columns:
+            frame["game_date"] = pd.to_datetime(frame["game_date"])
+        incoming = list(frame["game_id"].unique())
+
+        existing = [game_id for game_id in incoming if game_id in self._catalog]
+        if existing and mode == "append":
+            raise ValueError(f"Games already present in dataset: {sorted(existing)}")
+        catalog = {game_id: replace(entry) for game_id, entry in self._catalog.items()}
+        replaced = self._drop_games(catalog, existing)
+
+        partition_of = {}
+        for game_id, group in frame.groupby("game_id", sort=False):
+            game_date = None
+            if "game_date" in group:
+                dates = group["game_date"].dropna()
+                if len(dates):
+                    game_date = dates.iloc[0]
+            partition_of[game_id] = _partition_for_game(game_id, game_date)
+        frame["_partition"] = frame["game_id"].map(partition_of)
+
+        touched: List[str] = []
+        for partition, rows in frame.groupby("_partition", sort=True):
+            rows = rows.drop(columns="_partition")
+            name = self._write_file(partition, to_arrow_table(rows))
+            for game_id, count in rows["game_id"].value_counts().items():
+                catalog[game_id] = CatalogEntry(partition=partition, file=name, rows=int(count))
+            touched.append(partition)
+
+        self._catalog = catalog
+        self._save_catalog()
+        for path in replaced:
+            path.unlink(missing_ok=True)
+        return touched
+
+    def _scan(
+        self,
+        *,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        seasons: Optional[Sequence[str]] = None,
+        game_ids: Optional[Sequence[str]] = None,
+    ):
+        """Return the underlying ``pyarrow`` dataset and the partition-pruning filter.
+
+        The dataset is built from the files listed in the catalog, so files
+        left behind by an interrupted write are never read.
+        """
+
+        import pandas as pd  # type: ignore import-not-found
+        import pyarrow as pa  # type: ignore import-not-found
+        import pyarrow.dataset as ds  # type: ignore import-not-found
+
+        partitioning = ds.partitioning(pa.schema([("season", pa.string()), ("date", pa.string())]), flavor="hive")
+        files = sorted({str(self.root / entry.partition / entry.file) for entry in self._catalog.values()})
+        dataset = ds.dataset(files, format="parquet", partitioning=partitioning, partition_base_dir=str(self.root))
+        expression = None
+
+        def combine(condition):
+            return condition if expression is None else expression & condition
+
+        if start is not None:
+            expression = combine(ds.field("date") >= pd.Timestamp(start).strftime("%Y-%m-%d"))
+        if end is not None:
+            expression = combine(ds.field("date") <= pd.Timestamp(end).strftime("%Y-%m-%d"))
+        if start is not None or end is not None:
+            expression = combine(ds.field("date") != UNKNOWN_PARTITION)
+        if seasons is not None:
+            expression = combine(ds.field("season").isin(list(seasons)))
+        if game_ids is not None:
+            expression = combine(ds.field("game_id").isin([str(game_id) for game_id in game_ids]))
+        return dataset, expression
+
+    def read(
+        self,
+        *,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        seasons: Optional[Sequence[str]] = None,
+        game_ids: Optional[Sequence[str]] = None,
+        columns: Optional[Sequence[str]] = None,
+    ):
+        """Load rows for games played between ``start`` and ``end`` (inclusive).
+
+        Date and season filters prune whole partitions, so only the matching
+        files are opened. Games without a known date are only returned when no
+        date bounds are given.
+        """
+
+        import pandas as pd  # type: ignore import-not-found
+
+        if not self._catalog:
+            return pd.DataFrame(columns=list(columns) if columns else None)
+
+        dataset, expression = self._scan(start=start, end=end, seasons=seasons, game_ids=game_ids)
+        # Parquet only round-trips dictionary encoding for string columns, so the
+        # scanned table is cast back to the minute schema here.
+        if columns is None:
+            return from_arrow_table(dataset.to_table(columns=minute_schema().names, filter=expression))
+        return dataset.to_table(columns=list(columns), filter=expression).to_pandas()
+
+    def iter_batches(
+        self,
+        *,
+        columns: Optional[Sequence[str]] = None,
+        batch_size: int = 65_536,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        seasons: Optional[Sequence[str]] = None,
+        game_ids: Optional[Sequence[str]] = None,
+    ) -> Iterator:
+        """Yield ``pyarrow.RecordBatch`` objects of at most ``batch_size`` rows.
+
+        Files are scanned row group by row group, so memory use is bounded by
+        the batch size rather than the size of the dataset. Filters behave as
+        in :meth:`read`.
+        """
+
+        if not self._catalog:
+            return
+        dataset, expression = self._scan(start=start, end=end, seasons=seasons, game_ids=game_ids)
+        names = list(columns) if columns is not None else minute_schema().names
+        yield from dataset.to_batches(columns=names, filter=expression, batch_size=batch_size)
+
+    def compact(self, partition: str) -> Optional[str]:
+        """Merge the files of ``partition`` into one and return its name."""
+
+        import pyarrow as pa  # type: ignore import-not-found
+        import pyarrow.parquet as pq  # type: ignore import-not-found
+
+        names = sorted({entry.file for entry in self._catalog.values() if entry.partition == partition})
+        if len(names) <= 1:
+            return names[0] if names else None
+
+        merged = pa.concat_tables([validate_table(pq.read_table(self.root / partition / name)) for name in names])
+        new_name = self._write_file(partition, merged)
+        for entry in self._catalog.values():
+            if entry.partition == partition:
+                entry.file = new_name
+        self._save_catalog()
+        for name in names:
+            (self.root / partition / name).unlink(missing_ok=True)
+        return new_name
+
+
+def default_dataset() -> MinuteDataset:
+    """Return the dataset stored under ``processed_data_dir/minutes``."""
+
+    settings = get_settings()
+    return MinuteDataset(settings.paths.processed_data_dir / "minutes")
+
+
+__all__ = [
+    "CatalogEntry",
+    "MinuteDataset",
+    "default_dataset",
+    "season_from_date",
+    "season_from_game_id",
+]
@@ -0,0 +1,141 @@
+"""Streaming comparison of model win probabilities with Polymarket prices."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .data_pipeline import GameMinute
+from .modeling import LogisticScorer
+from .polymarket import Orderbook
+
+
+@dataclass(frozen=True)
+class MarketLink:
+    """Ties a Polymarket market to an NBA game.
+
+    ``yes_is_home`` says whether the market's YES outcome is a home-team win.
+    """
+
+    market_id: str
+    game_id: str
+    yes_is_home: bool = True
+
+
+@dataclass(frozen=True)
+class Edge:
+    """Model probability of a market's YES outcome against its price."""
+
+    market_id: str
+    game_id: str
+    model_probability: float
+    market_probability: float
+
+    @property
+    def edge(self) -> float:
+        """Model minus market probability; positive means YES looks cheap."""
+
+        return self.model_probability - self.market_probability
+
+
+class EdgeEngine:
+    """Keep per-game state and per-market prices and recompute edges incrementally.
+
+    A score update re-scores its game once and refreshes only that game's
+    markets; a price update refreshes only its own market. Updates that do not
+    change the model inputs (same margin and clock, same implied price) are
+    ignored, so :attr:`recomputed` counts the work actually done.
+    """
+
+    def __init__(self, scorer, links: Iterable[MarketLink] = ()) -> None:
+        self.scorer = scorer if isinstance(scorer, LogisticScorer) else LogisticScorer.from_model(scorer)
+        self._links: Dict[str, MarketLink] = {}
+        self._markets_by_game: Dict[str, Set[str]] = {}
+        self._states: Dict[str, Tuple[float, float]] = {}
+        self._home_probability: Dict[str, float] = {}
+        self._prices: Dict[str, float] = {}
+        self._edges: Dict[str, Edge] = {}
+        self.recomputed = 0
+        for link in links:
+            self.link(link)
+
+    def link(self, link: MarketLink) -> List[Edge]:
+        """Register (or re-point) a market and return its edge if it can be computed."""
+
+        previous = self._links.get(link.market_id)
+        if previous is not None:
+            self._markets_by_game[previous.game_id].discard(link.market_id)
+            self._edges.pop(link.market_id, None)
+        self._links[link.market_id] = link
+        self._markets_by_game.setdefault(link.game_id, set()).add(link.market_id)
+        return self._refresh([link.market_id])
+
+    def update_game(self, minute: GameMinute) -> List[Edge]:
+        """Apply a new game state and return the edges that changed."""
+
+        return self.update_state(minute.game_id, minute.score_margin, minute.seconds_remaining)
+
+    def update_state(self, game_id: str, score_margin: float, seconds_remaining: float) -> List[Edge]:
+        state = (float(score_margin), float(seconds_remaining))
+        if self._states.get(game_id) == state:
+            return []
+        self._states[game_id] = state
+        self._home_probability[game_id] = self.scorer.predict_one(*state)
+        return self._refresh(self._markets_by_game.get(game_id, ()))
+
+    def update_orderbook(self, orderbook: Orderbook) -> List[Edge]:
+        """Apply a new orderbook and return the market's edge if it changed."""
+
+        price = orderbook.implied_yes_probability
+        if price is None or self._prices.get(orderbook.market_id) == price:
+            return []
+        self._prices[orderbook.market_id] = price
+        return self._refresh((orderbook.market_id,))
+
+    def update(self, event: Union[GameMinute, Orderbook]) -> List[Edge]:
+        """Dispatch a game state or orderbook update."""
+
+        if isinstance(event, Orderbook):
+            return self.update_orderbook(event)
+        return self.update_game(event)
+
+    def replay(self, events: Iterable[Union[GameMinute, Orderbook]]) -> List[Edge]:
+        """Apply a recorded, time-ordered stream and return every edge emitted."""
+
+        emitted: List[Edge] = []
+        for event in events:
+            emitted.extend(self.update(event))
+        return emitted
+
+    def _refresh(self, market_ids: Iterable[str]) -> List[Edge]:
+        changed = []
+        for market_id in market_ids:
+            link = self._links.get(market_id)
+            price = self._prices.get(market_id)
+            if link is None or price is None:
+                continue
+            home = self._home_probability.get(link.game_id)
+            if home is None:
+                continue
+            edge = Edge(market_id, link.game_id, home if link.yes_is_home else 1.0 - home, price)
+            self._edges[market_id] = edge
+            self.recomputed += 1
+            changed.append(edge)
+        return changed
+
+    def edge(self, market_id: str) -> Optional[Edge]:
+        return self._edges.get(market_id)
+
+    def edges(self) -> Dict[str, Edge]:
+        """Return the latest edge of every market with both a price and a game state."""
+
+        return dict(self._edges)
+
+    def opportunities(self, min_edge: float) -> List[Edge]:
+        """Return current edges at least ``min_edge`` in size, largest first."""
+
+        found = [edge for edge in self._edges.values() if abs(edge.edge) >= min_edge]
+        return sorted(found, key=lambda edge: abs(edge.edge), reverse=True)
+
+
+__all__ = ["Edge", "EdgeEngine", "MarketLink"]
@@ -0,0 +1,341 @@
+"""In-process counters, timers and histograms for the collection and live pipelines.
+
+Instrumentation is off by default and every recording call then returns after
+a single attribute check, so the hot paths pay next to nothing. Call
+:func:`enable` to start recording and :func:`write_metrics` to export the
+default registry as a Prometheus text file or a JSON dump, or wrap a run in
+:func:`exporting` as the CLIs do for ``--metrics PATH``. Setting
+``NBA_PROBS_METRICS=1`` enables recording at import time.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union, cast
+
+# Seconds, from sub-millisecond scoring calls up to slow downloads.
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    if not labels:
+        return ()
+    return tuple(sorted([(key, str(value)) for key, value in labels.items()]))
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [*key, extra] if extra is not None else list(key)
+    if not pairs:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"') for _, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class Counter:
+    """Monotonically increasing count for one label set."""
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        self._registry = registry
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        if not self._registry.enabled:
+            return
+        with self._lock:
+            self.value += amount
+
+
+class Histogram:
+    """Bucketed distribution of observed values for one label set."""
+
+    def __init__(self, registry: MetricsRegistry, buckets: Sequence[float]) -> None:
+        self._registry = registry
+        self._lock = threading.Lock()
+        self.buckets = tuple(sorted(float(bound) for bound in buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # the last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        if not self._registry.enabled:
+            return
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    def time(self) -> TimerContext:
+        """Return a context manager observing the seconds spent inside it."""
+
+        return _Timer(self) if self._registry.enabled else _NULL_TIMER
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """Return ``(upper_bound, count)`` pairs in Prometheus ``le`` form."""
+
+        with self._lock:
+            counts = list(self.counts)
+        total = 0
+        pairs = []
+        for bound, count in zip((*self.buckets, math.inf), counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+
+class _Timer:
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: Histogram) -> None:
+        self._histogram = histogram
+        self._start = 0.0
+
+    def __enter__(self) -> _Timer:
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._histogram.observe(time.perf_counter() - self._start)
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self) -> _NullTimer:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+TimerContext = Union[_Timer, _NullTimer]
+Metric = Union[Counter, Histogram]
+
+
+class _Family:
+    def __init__(self, kind: str, help: str, buckets: Sequence[float] = ()) -> None:
+        self.kind = kind
+        self.help = help
+        self.buckets = tuple(buckets)
+        self.children: Dict[LabelKey, Metric] = {}
+
+
+class MetricsRegistry:
+    """Named metric families, each holding one counter or histogram per label set.
+
+    ``timer`` names are histograms of seconds. Names follow Prometheus
+    conventions: counters end in ``_total`` and timers in ``_seconds``.
+    """
+
+    def __init__(self, *, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._families: Dict[str, _Family] = {}
+        self._lock = threading.Lock()
+
+    def _child(
+        self, name: str, kind: str, help: str, labels: Dict[str, object], buckets: Sequence[float] = ()
+    ) -> Metric:
+        key = _label_key(labels)
+        family = self._families.get(name)
+        if family is not None:
+            child = family.children.get(key)
+            if child is not None and family.kind == kind:
+                return child
+        with self._lock:
+            family = self._families.setdefault(name, _Family(kind, help, buckets))
+            if family.kind != kind:
+                raise ValueError(f"Metric {name!r} is already registered as a {family.kind}")
+            child = family.children.get(key)
+            if child is None:
+                child = Counter(self) if kind == "counter" else Histogram(self, family.buckets)
+                family.children[key] = child
+            return child
+
+    # Labels travel as a dict below this point so that a label can never be
+    # mistaken for the ``help`` or ``buckets`` parameter.
+    def _counter(self, name: str, labels: Dict[str, object], help: str = "") -> Counter:
+        return cast(Counter, self._child(name, "counter", help, labels))
+
+    def _histogram(
+        self, name: str, labels: Dict[str, object], help: str = "", buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return cast(Histogram, self._child(name, "histogram", help, labels, buckets))
+
+    def counter(self, name: str, help: str = "", **labels: object) -> Counter:
+        return self._counter(name, labels, help)
+
+    def histogram(
+        self, name: str, help: str = "", *, buckets: Sequence[float] = DEFAULT_BUCKETS, **labels: object
+    ) -> Histogram:
+        return self._histogram(name, labels, help, buckets)
+
+    def inc(self, name: str, amount: float = 1.0, **labels: object) -> None:
+        """Add ``amount`` to the counter ``name`` (a no-op while disabled)."""
+
+        if self.enabled:
+            self._counter(name, labels).inc(amount)
+
+    def observe(self, name: str, value: float, **labels: object) -> None:
+        """Record ``value`` in the histogram ``name`` (a no-op while disabled)."""
+
+        if self.enabled:
+            self._histogram(name, labels).observe(value)
+
+    def timer(self, name: str, **labels: object) -> TimerContext:
+        """Time a block into the histogram ``name``::
+
+            with registry.timer("summarize_seconds"):
+                ...
+        """
+
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self._histogram(name, labels))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._families.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return every metric as plain Python data, suitable for ``json.dump``."""
+
+        with self._lock:
+            families = {name: (family, dict(family.children)) for name, family in self._families.items()}
+        snapshot: Dict[str, Dict[str, Any]] = {}
+        for name, (family, children) in sorted(families.items()):
+            series = []
+            for key, child in sorted(children.items()):
+                entry: Dict[str, object] = {"labels": dict(key)}
+                if isinstance(child, Counter):
+                    entry["value"] = child.value
+                else:
+                    entry.update(
+                        count=child.count,
+                        sum=child.sum,
+                        mean=child.sum / child.count if child.count else 0.0,
+                        buckets={_format_value(bound): total for bound, total in child.cumulative()},
+                    )
+                series.append(entry)
+            snapshot[name] = {"type": family.kind, "help": family.help, "series": series}
+        return snapshot
+
+    def to_prometheus(self) -> str:
+        """Render the registry in the Prometheus text exposition format."""
+
+        lines: List[str] = []
+        for name, family in self.snapshot().items():
+            if family["help"]:
+                lines.append(f"# HELP {name} {family['help']}")
+            lines.append(f"# TYPE {name} {family['type']}")
+            for entry in family["series"]:
+                key = _label_key(entry["labels"])
+                if family["type"] == "counter":
+                    lines.append(f"{name}{_format_labels(key)} {_format_value(entry['value'])}")
+                    continue
+                for bound, total in entry["buckets"].items():
+                    lines.append(f"{name}_bucket{_format_labels(key, ('le', bound))} {total}")
+                lines.append(f"{name}_sum{_format_labels(key)} {_format_value(entry['sum'])}")
+                lines.append(f"{name}_count{_format_labels(key)} {entry['count']}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def write(self, path: Path) -> Path:
+        """Atomically write the registry to ``path``: JSON for ``.json``, Prometheus text otherwise."""
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == ".json":
+            text = json.dumps(self.snapshot(), indent=2)
+        else:
+            text = self.to_prometheus()
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        tmp_path.write_text(text)
+        os.replace(tmp_path, path)
+        return path
+
+
+REGISTRY = MetricsRegistry(enabled=os.environ.get("NBA_PROBS_METRICS", "").lower() in {"1", "true", "yes"})
+
+
+def enable() -> MetricsRegistry:
+    REGISTRY.enabled = True
+    return REGISTRY
+
+
+def disable() -> None:
+    REGISTRY.enabled = False
+
+
+def inc(name: str, amount: float = 1.0, **labels: object) -> None:
+    if REGISTRY.enabled:
+        REGISTRY._counter(name, labels).inc(amount)
+
+
+def observe(name: str, value: float, **labels: object) -> None:
+    if REGISTRY.enabled:
+        REGISTRY._histogram(name, labels).observe(value)
+
+
+def timer(name: str, **labels: object) -> TimerContext:
+    if not REGISTRY.enabled:
+        return _NULL_TIMER
+    return _Timer(REGISTRY._histogram(name, labels))
+
+
+def write_metrics(path: Path) -> Path:
+    """Export the default registry; see :meth:`MetricsRegistry.write`."""
+
+    return REGISTRY.write(path)
+
+
+@contextmanager
+def exporting(path: Optional[Path]) -> Iterator[MetricsRegistry]:
+    """Record into the default registry for the duration of the block and export it to ``path``.
+
+    The file is written even if the block raises; with ``path=None`` nothing
+    is enabled or written.
+    """
+
+    if path is None:
+        yield REGISTRY
+        return
+    was_enabled = REGISTRY.enabled
+    REGISTRY.enabled = True
+    try:
+        yield REGISTRY
+    finally:
+        REGISTRY.write(path)
+        REGISTRY.enabled = was_enabled
+
+
+__all__ = [
+    "Counter",
+    "DEFAULT_BUCKETS",
+    "Histogram",
+    "MetricsRegistry",
+    "REGISTRY",
+    "disable",
+    "enable",
+    "exporting",
+    "inc",
+    "observe",
+    "timer",
+    "write_metrics",
+]
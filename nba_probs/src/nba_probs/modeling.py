@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import json
+import math
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Tuple, TYPE_CHECKING
+from typing import Callable, Iterable, Optional, Sequence, Tuple, TYPE_CHECKING, Union
 
 if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
     import joblib  # type: ignore import-not-found
@@ -12,24 +14,61 @@ if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
     import pandas as pd  # type: ignore import-not-found
     from sklearn.linear_model import LogisticRegression  # type: ignore import-not-found
 
+    from .dataset import MinuteDataset
+
+from . import metrics
 from .config import get_settings
 
 
+@dataclass(frozen=True)
+class FoldMetrics:
+    """Held-out metrics of one cross-validation fit."""
+
+    fold: int
+    regularization_c: float
+    brier: float
+    roc_auc: float
+    train_rows: int
+    test_rows: int
+
+
 @dataclass
 class ModelArtifacts:
     """Container for artifacts produced during training."""
 
-    model: LogisticRegression
+    model: LogisticRegression | LogisticScorer
     features: Tuple[str, ...]
     brier: float
     roc_auc: float
     train_rows: int
     test_rows: int
+    grid: Optional[WinProbabilityGrid] = None
+    fold_metrics: Tuple[FoldMetrics, ...] = ()
+    regularization_c: Optional[float] = None
 
-    def save(self, path: Path) -> None:
-        import joblib  # type: ignore import-not-found
+    def save(self, path: Path, *, grid: bool = False) -> None:
+        """Write the artifacts to ``path``.
+
+        A ``.json`` path selects the lightweight format (metadata as JSON plus
+        the coefficients in ``<name>.coef.npy``), which loads without sklearn
+        or joblib; any other suffix is written with joblib. With ``grid=True`` a
+        :class:`WinProbabilityGrid` is materialized and stored as
+        ``<name>.grid.npy`` alongside.
+        """
 
         path.parent.mkdir(parents=True, exist_ok=True)
+        grid_info = None
+        if grid:
+            if self.grid is None:
+                self.grid = WinProbabilityGrid.from_scorer(self.scorer())
+            grid_info = self.grid.save(grid_path_for(path))
+
+        if path.suffix == ".json":
+            self._save_lightweight(path, grid_info)
+            return
+
+        import joblib  # type: ignore import-not-found
+
         joblib.dump({
             "model": self.model,
             "features": self.features,
@@ -37,12 +76,252 @@ class ModelArtifacts:
             "roc_auc": self.roc_auc,
             "train_rows": self.train_rows,
             "test_rows": self.test_rows,
+            "grid": grid_info,
+            "fold_metrics": [asdict(metrics) for metrics in self.fold_metrics],
+            "regularization_c": self.regularization_c,
         }, path)
 
+    def _save_lightweight(self, path: Path, grid_info: Optional[dict]) -> None:
+        import numpy as np  # type: ignore import-not-found
+
+        scorer = self.scorer()
+        coefficients_path = path.with_name(f"{path.stem}.coef.npy")
+        np.save(coefficients_path, np.array([scorer.intercept, *scorer.coef_[0]], dtype=np.float64))
+        payload = {
+            "format": LIGHTWEIGHT_FORMAT,
+            "version": LIGHTWEIGHT_VERSION,
+            "features": list(self.features),
+            "coefficients": {"file": coefficients_path.name, "layout": ["intercept", *scorer.features]},
+            "brier": float(self.brier),
+            "roc_auc": float(self.roc_auc),
+            "train_rows": int(self.train_rows),
+            "test_rows": int(self.test_rows),
+            "grid": grid_info,
+            "fold_metrics": [asdict(metrics) for metrics in self.fold_metrics],
+            "regularization_c": self.regularization_c,
+        }
+        path.write_text(json.dumps(payload, indent=2))
+
+    def scorer(self) -> LogisticScorer:
+        """Return a closed-form scorer for the trained model."""
+
+        return LogisticScorer.from_model(self.model, self.features)
+
 
 FEATURES = ("score_margin", "seconds_remaining")
 TARGET = "home_win"
 
+LIGHTWEIGHT_FORMAT = "nba_probs.logistic"
+LIGHTWEIGHT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class LogisticScorer:
+    """Evaluate a fitted logistic regression without going through sklearn.
+
+    The coefficients are extracted once so that scoring is a handful of NumPy
+    ufuncs for batches and pure ``math`` for single game states.
+    """
+
+    margin_coef: float
+    seconds_coef: float
+    intercept: float
+    features: Tuple[str, ...] = FEATURES
+
+    @classmethod
+    def from_model(cls, model: LogisticRegression | LogisticScorer, features: Tuple[str, ...] = FEATURES) -> LogisticScorer:
+        if isinstance(model, LogisticScorer):
+            return model
+        return cls.from_coefficients(features, intercept=model.intercept_[0], coef=model.coef_[0])
+
+    @classmethod
+    def from_coefficients(cls, features: Tuple[str, ...], *, intercept: float, coef) -> LogisticScorer:
+        weights = dict(zip(features, (float(value) for value in coef)))
+        return cls(
+            margin_coef=weights["score_margin"],
+            seconds_coef=weights["seconds_remaining"],
+            intercept=float(intercept),
+            features=tuple(features),
+        )
+
+    @property
+    def coef_(self) -> np.ndarray:
+        """Coefficients in ``features`` order, shaped like sklearn's ``coef_``."""
+
+        import numpy as np  # type: ignore import-not-found
+
+        weights = {"score_margin": self.margin_coef, "seconds_remaining": self.seconds_coef}
+        return np.array([[weights[name] for name in self.features]])
+
+    @property
+    def intercept_(self) -> np.ndarray:
+        import numpy as np  # type: ignore import-not-found
+
+        return np.array([self.intercept])
+
+    def predict(self, score_margin, seconds_remaining, *, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Return home-win probabilities for arrays (or scalars) of game states.
+
+        Pass a preallocated float64 ``out`` array to reuse it across calls;
+        float64 inputs are then scored without allocating.
+        """
+
+        import numpy as np  # type: ignore import-not-found
+
+        margin = np.asarray(score_margin)
+        seconds = np.asarray(seconds_remaining)
+        if out is None:
+            out = np.empty(np.broadcast_shapes(margin.shape, seconds.shape), dtype=np.float64)
+        if metrics.REGISTRY.enabled:
+            metrics.inc("model_scored_rows_total", out.size)
+        z = out
+        if self.seconds_coef:
+            # seconds_coef * (margin * ratio + seconds) builds both terms in ``out``.
+            np.multiply(margin, self.margin_coef / self.seconds_coef, out=z, dtype=np.float64)
+            z += seconds
+            z *= self.seconds_coef
+        else:
+            np.multiply(margin, self.margin_coef, out=z, dtype=np.float64)
+        z += self.intercept
+        # 1 / (1 + exp(-z)) computed in place; overflow saturates to 0 as intended.
+        with np.errstate(over="ignore"):
+            np.negative(z, out=z)
+            np.exp(z, out=z)
+        z += 1.0
+        np.reciprocal(z, out=z)
+        return z
+
+    def predict_one(self, score_margin: float, seconds_remaining: float) -> float:
+        """Return the home-win probability for a single game state."""
+
+        z = self.intercept + self.margin_coef * score_margin + self.seconds_coef * seconds_remaining
+        if z >= 0:
+            return 1.0 / (1.0 + math.exp(-z))
+        exp_z = math.exp(z)
+        return exp_z / (1.0 + exp_z)
+
+    def predict_proba(self, X) -> np.ndarray:
+        """sklearn-compatible ``predict_proba`` over an ``(n, 2)`` feature matrix."""
+
+        import numpy as np  # type: ignore import-not-found
+
+        X = np.asarray(X, dtype=np.float64)
+        columns = {name: X[:, index] for index, name in enumerate(self.features)}
+        positive = self.predict(columns["score_margin"], columns["seconds_remaining"])
+        return np.column_stack((1.0 - positive, positive))
+
+
+GRID_MARGIN_RANGE = (-60, 60)
+GRID_MAX_SECONDS = 4 * 12 * 60
+
+
+def grid_path_for(path: Path) -> Path:
+    """Return where the lookup grid for the artifact at ``path`` is stored."""
+
+    return path.with_name(f"{path.stem}.grid.npy")
+
+
+@dataclass
+class WinProbabilityGrid:
+    """Precomputed probabilities for every integer (score_margin, seconds_remaining) state.
+
+    ``values[m - min_margin, s]`` holds the probability for margin ``m`` and
+    ``s`` seconds remaining. Integer states inside the grid are a single array
+    index; fractional states are interpolated bilinearly and states beyond the
+    bounds are scored by ``fallback`` when one is set (or clamped to the edge).
+    """
+
+    values: np.ndarray
+    min_margin: int
+    fallback: Optional[LogisticScorer] = None
+
+    @property
+    def max_margin(self) -> int:
+        return self.min_margin + self.values.shape[0] - 1
+
+    @property
+    def max_seconds(self) -> int:
+        return self.values.shape[1] - 1
+
+    @classmethod
+    def from_scorer(
+        cls,
+        scorer: LogisticScorer,
+        *,
+        margin_range: Tuple[int, int] = GRID_MARGIN_RANGE,
+        max_seconds: int = GRID_MAX_SECONDS,
+    ) -> WinProbabilityGrid:
+        import numpy as np  # type: ignore import-not-found
+
+        margins, seconds = np.meshgrid(
+            np.arange(margin_range[0], margin_range[1] + 1, dtype=np.float64),
+            np.arange(0, max_seconds + 1, dtype=np.float64),
+            indexing="ij",
+        )
+        return cls(values=scorer.predict(margins, seconds), min_margin=margin_range[0], fallback=scorer)
+
+    def save(self, path: Path) -> dict:
+        """Write the grid as ``.npy`` and return the metadata needed to reload it."""
+
+        import numpy as np  # type: ignore import-not-found
+
+        # Rewriting the file a memory-mapped grid was loaded from would corrupt it.
+        source = getattr(self.values, "filename", None)
+        if source is None or Path(source).resolve() != path.resolve():
+            np.save(path, np.ascontiguousarray(self.values))
+        return {"file": path.name, "min_margin": self.min_margin}
+
+    @classmethod
+    def load(cls, path: Path, *, min_margin: int, fallback: Optional[LogisticScorer] = None) -> WinProbabilityGrid:
+        """Memory-map a grid written by :meth:`save`."""
+
+        import numpy as np  # type: ignore import-not-found
+
+        return cls(values=np.load(path, mmap_mode="r"), min_margin=min_margin, fallback=fallback)
+
+    def lookup(self, score_margin: float, seconds_remaining: float) -> float:
+        """Return the probability for a single game state."""
+
+        row = score_margin - self.min_margin
+        if (
+            row == int(row)
+            and seconds_remaining == int(seconds_remaining)
+            and 0 <= row < self.values.shape[0]
+            and 0 <= seconds_remaining < self.values.shape[1]
+        ):
+            return float(self.values[int(row), int(seconds_remaining)])
+        return float(self.lookup_many([score_margin], [seconds_remaining])[0])
+
+    def lookup_many(self, score_margin, seconds_remaining) -> np.ndarray:
+        """Return probabilities for arrays of game states."""
+
+        import numpy as np  # type: ignore import-not-found
+
+        margin = np.asarray(score_margin, dtype=np.float64)
+        seconds = np.asarray(seconds_remaining, dtype=np.float64)
+        rows = np.clip(margin - self.min_margin, 0, self.values.shape[0] - 1)
+        cols = np.clip(seconds, 0, self.values.shape[1] - 1)
+
+        row0 = np.minimum(np.floor(rows).astype(np.intp), self.values.shape[0] - 2)
+        col0 = np.minimum(np.floor(cols).astype(np.intp), self.values.shape[1] - 2)
+        row_weight = rows - row0
+        col_weight = cols - col0
+
+        top = self.values[row0, col0] * (1 - col_weight) + self.values[row0, col0 + 1] * col_weight
+        bottom = self.values[row0 + 1, col0] * (1 - col_weight) + self.values[row0 + 1, col0 + 1] * col_weight
+        result = top * (1 - row_weight) + bottom * row_weight
+
+        if self.fallback is not None:
+            outside = (
+                (margin < self.min_margin)
+                | (margin > self.max_margin)
+                | (seconds < 0)
+                | (seconds > self.max_seconds)
+            )
+            if outside.any():
+                result[outside] = self.fallback.predict(margin[outside], seconds[outside])
+        return result
+
 
 def train_baseline_model(data: pd.DataFrame, *, random_state: int = 42) -> ModelArtifacts:
     """Train a baseline logistic regression model on the provided dataset."""
@@ -69,7 +348,9 @@ def train_baseline_model(data: pd.DataFrame, *, random_state: int = 42) -> Model
     )
 
     model = LogisticRegression(max_iter=1000)
-    model.fit(X_train, y_train)
+    with metrics.timer("model_fit_seconds", trainer="baseline"):
+        model.fit(X_train, y_train)
+    metrics.inc("model_train_rows_total", len(X_train), trainer="baseline")
 
     prob_test = model.predict_proba(X_test)[:, 1]
     brier = brier_score_loss(y_test, prob_test)
@@ -85,8 +366,258 @@ def train_baseline_model(data: pd.DataFrame, *, random_state: int = 42) -> Model
     )
 
 
+DEFAULT_C_GRID = (0.01, 0.1, 1.0, 10.0)
+
+
+def _fit_fold(X, y, train_index, test_index, regularization_c: float, fold: int) -> FoldMetrics:
+    import numpy as np  # type: ignore import-not-found
+    from sklearn.linear_model import LogisticRegression  # type: ignore import-not-found
+    from sklearn.metrics import brier_score_loss, roc_auc_score  # type: ignore import-not-found
+
+    model = LogisticRegression(C=regularization_c, max_iter=1000)
+    model.fit(X[train_index], y[train_index])
+    prob_test = model.predict_proba(X[test_index])[:, 1]
+    y_test = y[test_index]
+    roc_auc = roc_auc_score(y_test, prob_test) if len(np.unique(y_test)) == 2 else float("nan")
+    return FoldMetrics(
+        fold=fold,
+        regularization_c=float(regularization_c),
+        brier=float(brier_score_loss(y_test, prob_test)),
+        roc_auc=float(roc_auc),
+        train_rows=len(train_index),
+        test_rows=len(test_index),
+    )
+
+
+def train_grouped_cv_model(
+    data: pd.DataFrame,
+    *,
+    n_splits: int = 5,
+    c_grid: Sequence[float] = DEFAULT_C_GRID,
+    group_column: str = "game_id",
+    n_jobs: int = -1,
+) -> ModelArtifacts:
+    """Select the regularization strength with GroupKFold by game and refit on all rows.
+
+    Every minute of a game lands in the same fold, so the held-out metrics
+    never see a game the model was fitted on. All ``(C, fold)`` fits run in
+    parallel through joblib (``n_jobs=-1`` uses every core). The returned
+    artifacts report the mean held-out Brier score and ROC AUC of the chosen
+    ``C`` and keep every fold's metrics in ``fold_metrics``.
+    """
+
+    import numpy as np  # type: ignore import-not-found
+    import pandas as pd  # type: ignore import-not-found
+    from joblib import Parallel, delayed  # type: ignore import-not-found
+    from sklearn.linear_model import LogisticRegression  # type: ignore import-not-found
+    from sklearn.model_selection import GroupKFold  # type: ignore import-not-found
+
+    missing_columns = {col for col in (*FEATURES, TARGET, group_column) if col not in data.columns}
+    if missing_columns:
+        raise ValueError(f"Missing required columns: {missing_columns}")
+
+    df = data.dropna(subset=[*FEATURES, TARGET])
+    if df.empty:
+        raise ValueError("No rows available for training after dropping missing values.")
+
+    groups, _ = pd.factorize(df[group_column])
+    if len(np.unique(groups)) < n_splits:
+        raise ValueError(f"Need at least {n_splits} games for {n_splits}-fold grouped cross-validation.")
+
+    X = df.loc[:, FEATURES].to_numpy(dtype=np.float64)
+    y = df.loc[:, TARGET].to_numpy(dtype=np.int64)
+    splits = list(GroupKFold(n_splits=n_splits).split(X, y, groups))
+
+    with metrics.timer("model_cv_seconds"):
+        results = Parallel(n_jobs=n_jobs)(
+            delayed(_fit_fold)(X, y, train_index, test_index, c, fold)
+            for c in c_grid
+            for fold, (train_index, test_index) in enumerate(splits)
+        )
+
+    def mean_brier(c: float) -> float:
+        return float(np.mean([m.brier for m in results if m.regularization_c == float(c)]))
+
+    best_c = float(min(c_grid, key=mean_brier))
+    best_folds = [m for m in results if m.regularization_c == best_c]
+
+    model = LogisticRegression(C=best_c, max_iter=1000)
+    with metrics.timer("model_fit_seconds", trainer="grouped_cv"):
+        model.fit(df.loc[:, FEATURES], df.loc[:, TARGET])
+    metrics.inc("model_train_rows_total", len(df), trainer="grouped_cv")
+
+    return ModelArtifacts(
+        model=model,
+        features=FEATURES,
+        brier=float(np.mean([m.brier for m in best_folds])),
+        roc_auc=float(np.nanmean([m.roc_auc for m in best_folds])),
+        train_rows=len(df),
+        test_rows=sum(m.test_rows for m in best_folds),
+        fold_metrics=tuple(results),
+        regularization_c=best_c,
+    )
+
+
+STREAMING_COLUMNS = ("game_id", *FEATURES, TARGET)
+
+BatchSource = Union["MinuteDataset", str, Path, Callable[[], Iterable]]
+
+
+def _batch_factory(source: BatchSource, batch_size: int) -> Callable[[], Iterable]:
+    """Return a callable that starts a fresh pass of record batches over ``source``."""
+
+    from .dataset import MinuteDataset
+
+    if isinstance(source, MinuteDataset):
+        return lambda: source.iter_batches(columns=STREAMING_COLUMNS, batch_size=batch_size)
+    if isinstance(source, (str, Path)):
+        import pyarrow.dataset as ds  # type: ignore import-not-found
+
+        dataset = ds.dataset(source, format="parquet", partitioning="hive")
+        return lambda: dataset.to_batches(columns=list(STREAMING_COLUMNS), batch_size=batch_size)
+    if callable(source):
+        return source
+    raise TypeError(f"Unsupported batch source: {source!r}")
+
+
+def _holdout_mask(game_ids, test_fraction: float):
+    """Assign whole games to the holdout set by a stable hash of their ID."""
+
+    import zlib
+
+    import numpy as np  # type: ignore import-not-found
+    import pyarrow as pa  # type: ignore import-not-found
+    import pyarrow.compute as pc  # type: ignore import-not-found
+
+    if not isinstance(game_ids, (pa.Array, pa.ChunkedArray)):
+        game_ids = pa.array(np.asarray(game_ids, dtype=str))
+    if isinstance(game_ids, pa.ChunkedArray):
+        game_ids = game_ids.combine_chunks()
+    if not pa.types.is_dictionary(game_ids.type):
+        game_ids = pc.dictionary_encode(game_ids.cast(pa.string()))
+
+    threshold = int(test_fraction * 2**32)
+    in_holdout = np.fromiter(
+        (zlib.crc32(str(value).encode()) < threshold for value in game_ids.dictionary.to_pylist()),
+        dtype=bool,
+        count=len(game_ids.dictionary),
+    )
+    return in_holdout[game_ids.indices.to_numpy(zero_copy_only=False)]
+
+
+def _batch_arrays(batch, test_fraction: float):
+    """Return ``(X, y, holdout)`` for the complete rows of one record batch."""
+
+    import numpy as np  # type: ignore import-not-found
+
+    X = np.column_stack(
+        [batch.column(name).to_numpy(zero_copy_only=False).astype(np.float64) for name in FEATURES]
+    )
+    y = batch.column(TARGET).to_numpy(zero_copy_only=False).astype(np.float64)
+    complete = np.isfinite(X).all(axis=1) & np.isfinite(y)
+    holdout = _holdout_mask(batch.column("game_id"), test_fraction)
+    return X[complete], y[complete], holdout[complete]
+
+
+def train_streaming_model(
+    source: BatchSource,
+    *,
+    batch_size: int = 65_536,
+    test_fraction: float = 0.2,
+    regularization_c: float = 1.0,
+    max_iter: int = 25,
+    tol: float = 1e-8,
+    auc_bins: int = 4096,
+) -> ModelArtifacts:
+    """Fit the baseline logistic regression without loading the dataset into memory.
+
+    ``source`` is a :class:`~nba_probs.dataset.MinuteDataset`, a Parquet file or
+    directory, or a callable returning a fresh iterable of record batches. Each
+    Newton-IRLS iteration is one pass that accumulates the exact gradient and
+    Hessian batch by batch, so the fit matches sklearn's ``LogisticRegression``
+    with the same ``C``. Whole games are held out by hashing their IDs; the
+    holdout Brier score is exact and ROC AUC is computed from ``auc_bins``
+    probability histograms.
+    """
+
+    import numpy as np  # type: ignore import-not-found
+
+    if not 0 < test_fraction < 1:
+        raise ValueError("test_fraction must be between 0 and 1")
+    batches = _batch_factory(source, batch_size)
+    n_params = len(FEATURES) + 1
+    penalty = np.eye(n_params) / regularization_c
+    penalty[0, 0] = 0.0  # the intercept is not regularized, as in sklearn
+
+    weights = np.zeros(n_params)
+    train_rows = 0
+    for _ in range(max_iter):
+        gradient = penalty @ weights
+        hessian = penalty.copy()
+        train_rows = 0
+        with metrics.timer("model_streaming_pass_seconds", phase="fit"):
+            for batch in batches():
+                X, y, holdout = _batch_arrays(batch, test_fraction)
+                X, y = X[~holdout], y[~holdout]
+                if not len(y):
+                    continue
+                design = np.column_stack([np.ones(len(y)), X])
+                prob = 1.0 / (1.0 + np.exp(-(design @ weights)))
+                gradient += design.T @ (prob - y)
+                hessian += (design * (prob * (1.0 - prob))[:, None]).T @ design
+                train_rows += len(y)
+        if train_rows == 0:
+            raise ValueError("No rows available for training after dropping missing values.")
+        step = np.linalg.solve(hessian, gradient)
+        weights -= step
+        metrics.inc("model_streaming_iterations_total")
+        if np.max(np.abs(step)) <= tol * max(1.0, np.max(np.abs(weights))):
+            break
+
+    scorer = LogisticScorer.from_coefficients(FEATURES, intercept=weights[0], coef=weights[1:])
+    squared_error = 0.0
+    test_rows = 0
+    positives = np.zeros(auc_bins, dtype=np.int64)
+    negatives = np.zeros(auc_bins, dtype=np.int64)
+    with metrics.timer("model_streaming_pass_seconds", phase="evaluate"):
+        for batch in batches():
+            X, y, holdout = _batch_arrays(batch, test_fraction)
+            X, y = X[holdout], y[holdout]
+            if not len(y):
+                continue
+            prob = scorer.predict(X[:, 0], X[:, 1])
+            squared_error += float(np.sum((prob - y) ** 2))
+            test_rows += len(y)
+            bins = np.minimum((prob * auc_bins).astype(np.int64), auc_bins - 1)
+            positives += np.bincount(bins[y == 1], minlength=auc_bins)
+            negatives += np.bincount(bins[y == 0], minlength=auc_bins)
+
+    if test_rows == 0:
+        raise ValueError("No games were assigned to the holdout set; increase test_fraction.")
+    n_pos, n_neg = positives.sum(), negatives.sum()
+    if n_pos and n_neg:
+        negatives_below = np.cumsum(negatives) - negatives
+        roc_auc = float(np.sum(positives * (negatives_below + 0.5 * negatives)) / (n_pos * n_neg))
+    else:
+        roc_auc = float("nan")
+
+    return ModelArtifacts(
+        model=scorer,
+        features=FEATURES,
+        brier=squared_error / test_rows,
+        roc_auc=roc_auc,
+        train_rows=train_rows,
+        test_rows=test_rows,
+        regularization_c=float(regularization_c),
+    )
+
+
 def predict_win_probability(model: LogisticRegression, *, score_margin: float, seconds_remaining: float) -> float:
-    """Return the probability of the home team winning."""
+    """Return the probability of the home team winning.
+
+    For live scoring of many states, build a :class:`LogisticScorer` once and
+    use its ``predict``/``predict_one`` methods instead.
+    """
 
     import numpy as np  # type: ignore import-not-found
 
@@ -94,36 +625,101 @@ def predict_win_probability(model: LogisticRegression, *, score_margin: float, s
     return float(model.predict_proba(X)[0, 1])
 
 
-def save_model(artifacts: ModelArtifacts, filename: str = "baseline_model.joblib") -> Path:
-    """Persist trained model artifacts to disk."""
+def save_model(artifacts: ModelArtifacts, filename: str = "baseline_model.joblib", *, grid: bool = False) -> Path:
+    """Persist trained model artifacts to disk, optionally with a lookup grid.
+
+    The joblib file is written together with a lightweight ``.json`` copy of
+    the same stem, which ``load_model(lightweight=True)`` reads.
+    """
 
     settings = get_settings()
     path = settings.paths.models_dir / filename
-    artifacts.save(path)
+    artifacts.save(path, grid=grid)
+    artifacts.save(path.with_suffix(".json"), grid=grid)
     return path
 
 
-def load_model(path: Path | None = None) -> ModelArtifacts:
-    """Load model artifacts from disk."""
+def _load_lightweight(path: Path) -> ModelArtifacts:
+    import numpy as np  # type: ignore import-not-found
 
-    import joblib  # type: ignore import-not-found
+    payload = json.loads(path.read_text())
+    if payload.get("format") != LIGHTWEIGHT_FORMAT or payload.get("version") != LIGHTWEIGHT_VERSION:
+        raise ValueError(f"Unsupported model artifact format in {path}")
+
+    layout = payload["coefficients"]["layout"]
+    weights = np.load(path.parent / payload["coefficients"]["file"])
+    scorer = LogisticScorer.from_coefficients(
+        tuple(layout[1:]),
+        intercept=weights[0],
+        coef=weights[1:],
+    )
+    artifacts = ModelArtifacts(
+        model=scorer,
+        features=tuple(payload["features"]),
+        brier=float(payload["brier"]),
+        roc_auc=float(payload["roc_auc"]),
+        train_rows=int(payload["train_rows"]),
+        test_rows=int(payload["test_rows"]),
+        fold_metrics=tuple(FoldMetrics(**metrics) for metrics in payload.get("fold_metrics", ())),
+        regularization_c=payload.get("regularization_c"),
+    )
+    grid_info = payload.get("grid")
+    if grid_info:
+        artifacts.grid = WinProbabilityGrid.load(
+            path.parent / grid_info["file"],
+            min_margin=int(grid_info["min_margin"]),
+            fallback=scorer,
+        )
+    return artifacts
+
+
+def load_model(path: Path | None = None, *, lightweight: bool = False) -> ModelArtifacts:
+    """Load model artifacts from disk.
+
+    By default the joblib file is unpickled and ``.model`` is the fitted
+    sklearn estimator. With ``lightweight=True``, or a ``.json`` ``path``, the
+    ``.json`` artifact of the same stem is read instead, without importing
+    sklearn or joblib, and ``.model`` is a :class:`LogisticScorer`.
+    """
 
     settings = get_settings()
-    target_path = path or (settings.paths.models_dir / "baseline_model.joblib")
+    target_path = Path(path) if path is not None else settings.paths.models_dir / "baseline_model.joblib"
+    if lightweight:
+        target_path = target_path.with_suffix(".json")
+    if target_path.suffix == ".json":
+        return _load_lightweight(target_path)
+
+    import joblib  # type: ignore import-not-found
+
     payload = joblib.load(target_path)
-    return ModelArtifacts(
+    artifacts = ModelArtifacts(
         model=payload["model"],
         features=tuple(payload["features"]),
         brier=float(payload["brier"]),
         roc_auc=float(payload["roc_auc"]),
         train_rows=int(payload["train_rows"]),
         test_rows=int(payload["test_rows"]),
+        fold_metrics=tuple(FoldMetrics(**metrics) for metrics in payload.get("fold_metrics", ())),
+        regularization_c=payload.get("regularization_c"),
     )
+    grid_info = payload.get("grid")
+    if grid_info:
+        artifacts.grid = WinProbabilityGrid.load(
+            Path(target_path).parent / grid_info["file"],
+            min_margin=int(grid_info["min_margin"]),
+            fallback=artifacts.scorer(),
+        )
+    return artifacts
 
 
 __all__ = [
     "ModelArtifacts",
+    "LogisticScorer",
+    "WinProbabilityGrid",
+    "FoldMetrics",
     "train_baseline_model",
+    "train_grouped_cv_model",
+    "train_streaming_model",
     "predict_win_probability",
     "save_model",
     "load_model",
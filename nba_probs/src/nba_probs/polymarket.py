@@ -2,14 +2,32 @@
 
 from __future__ import annotations
 
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Deque, Dict, Iterable, List, Mapping, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from . import metrics
 from .config import get_settings
+from .response_cache import CachedResponse, ResponseCache, cache_key
 
 POLYMARKET_BASE_URL = "https://gamma-api.polymarket.com"
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def _endpoint(path: str) -> str:
+    """Collapse market IDs out of ``path`` so metrics have one series per endpoint."""
+
+    parts = path.split("?", 1)[0].split("/")
+    if len(parts) > 2 and parts[1] == "markets":
+        parts[2] = "{id}"
+    return "/".join(parts)
 
 
 @dataclass
@@ -44,22 +62,162 @@ class Orderbook:
         return self.no_price
 
 
+@dataclass(frozen=True)
+class RequestMetric:
+    """Timing of one API call, including any retries urllib3 made for it."""
+
+    method: str
+    path: str
+    status: Optional[int]
+    elapsed: float
+    retries: int
+
+
 class PolymarketClient:
-    """Simple wrapper around Polymarket's HTTP API."""
+    """Wrapper around Polymarket's HTTP API backed by a pooled keep-alive session.
+
+    Connections are reused through an ``HTTPAdapter`` holding at most
+    ``pool_maxsize`` connections per host (callers block rather than open
+    more), and GET requests answered with 429 or 5xx are retried with
+    exponential backoff, honouring ``Retry-After``. Every call is timed into
+    :attr:`metrics` and, when enabled, into the :mod:`nba_probs.metrics`
+    registry by endpoint.
+
+    GET responses go through a :class:`~nba_probs.response_cache.ResponseCache`
+    (disable with ``cache=False``): ``cache_ttls`` sets how long each endpoint
+    is served from memory before being revalidated with ``If-None-Match`` /
+    ``If-Modified-Since``. ``persist_cache=True`` also keeps a copy under
+    ``Paths.polymarket_dir / "http_cache"`` so separate processes share it.
 
-    def __init__(self) -> None:
+    :meth:`fetch_orderbooks` runs on a pool of ``max_workers`` threads that is
+    started on first use and shut down by :meth:`close`.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_url: str = POLYMARKET_BASE_URL,
+        timeout: float = 10.0,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        pool_maxsize: int = 8,
+        max_workers: int = 8,
+        metrics_window: int = 1024,
+        cache: bool = True,
+        cache_ttls: Optional[Mapping[str, float]] = None,
+        persist_cache: bool = False,
+    ) -> None:
         self.settings = get_settings()
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.metrics: Deque[RequestMetric] = deque(maxlen=metrics_window)
+        self._metrics_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self.cache: Optional[ResponseCache] = None
+        if cache:
+            directory = self.settings.paths.polymarket_dir / "http_cache" if persist_cache else None
+            self.cache = ResponseCache(ttls=cache_ttls, directory=directory)
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, pool_block=True, max_retries=retry)
         self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         if self.settings.http_proxy:
             self.session.proxies["http"] = self.settings.http_proxy
         if self.settings.https_proxy:
             self.session.proxies["https"] = self.settings.https_proxy
 
+    def close(self) -> None:
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self.session.close()
+
+    def __enter__(self) -> PolymarketClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _record(self, metric: RequestMetric) -> None:
+        with self._metrics_lock:
+            self.metrics.append(metric)
+        if metrics.REGISTRY.enabled:
+            endpoint = _endpoint(metric.path)
+            metrics.observe("polymarket_request_seconds", metric.elapsed, endpoint=endpoint)
+            metrics.inc("polymarket_requests_total", endpoint=endpoint, status=metric.status or "error")
+            if metric.retries:
+                metrics.inc("polymarket_request_retries_total", metric.retries, endpoint=endpoint)
+
+    def _send(self, method: str, path: str, **kwargs: Any) -> requests.Response:
+        url = f"{self.base_url}{path}"
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+        except requests.RequestException:
+            self._record(RequestMetric(method, path, None, time.perf_counter() - start, 0))
+            raise
+        history = getattr(getattr(response.raw, "retries", None), "history", ())
+        self._record(RequestMetric(method, path, response.status_code, time.perf_counter() - start, len(history)))
+        return response
+
     def _request(self, method: str, path: str, **kwargs: Any) -> Any:
-        url = f"{POLYMARKET_BASE_URL}{path}"
-        response = self.session.request(method, url, timeout=10, **kwargs)
+        if self.cache is None or method.upper() != "GET":
+            response = self._send(method, path, **kwargs)
+            response.raise_for_status()
+            return response.json()
+
+        key = cache_key(method, f"{self.base_url}{path}", kwargs.get("params"))
+        entry = self.cache.get(key)
+        if entry is not None and self.cache.is_fresh(entry, path):
+            self.cache.record("hit")
+            return entry.payload
+
+        if entry is not None:
+            kwargs["headers"] = {**entry.validators(), **(kwargs.get("headers") or {})}
+        response = self._send(method, path, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            self.cache.record("revalidated")
+            return self.cache.refresh(entry).payload
+
         response.raise_for_status()
-        return response.json()
+        payload = response.json()
+        self.cache.record("miss")
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified or self.cache.ttl_for(path) > 0:
+            self.cache.store(CachedResponse(key, payload, etag, last_modified, self.cache.now()))
+        return payload
+
+    def latency_summary(self) -> Dict[str, float]:
+        """Return count, mean, p50, p95 and max latency (seconds) of recent calls."""
+
+        with self._metrics_lock:
+            elapsed = sorted(metric.elapsed for metric in self.metrics)
+        if not elapsed:
+            return {"count": 0}
+
+        def percentile(fraction: float) -> float:
+            return elapsed[min(len(elapsed) - 1, int(fraction * len(elapsed)))]
+
+        return {
+            "count": len(elapsed),
+            "mean": sum(elapsed) / len(elapsed),
+            "p50": percentile(0.5),
+            "p95": percentile(0.95),
+            "max": elapsed[-1],
+        }
 
     def list_nba_markets(self) -> List[Market]:
         payload = self._request("GET", "/markets", params={"tag": "NBA"})
@@ -85,6 +243,39 @@ class PolymarketClient:
             no_price=self._safe_float(outcome_prices.get("no")),
         )
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the client's worker pool, started on first use and reused until :meth:`close`."""
+
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="polymarket")
+            return self._executor
+
+    def fetch_orderbooks(self, market_ids: Iterable[str], *, skip_errors: bool = False) -> Dict[str, Orderbook]:
+        """Fetch many orderbooks concurrently over the shared connection pool.
+
+        Results are keyed by market ID in input order. The first failure is
+        re-raised once every request has finished, unless ``skip_errors`` is
+        set, in which case failed markets are left out.
+        """
+
+        market_ids = list(dict.fromkeys(market_ids))
+        if not market_ids:
+            return {}
+
+        executor = self._get_executor()
+        futures = {market_id: executor.submit(self.fetch_orderbook, market_id) for market_id in market_ids}
+        wait(futures.values())
+
+        orderbooks: Dict[str, Orderbook] = {}
+        for market_id, future in futures.items():
+            error = future.exception()
+            if error is None:
+                orderbooks[market_id] = future.result()
+            elif not skip_errors:
+                raise error
+        return orderbooks
+
     @staticmethod
     def _safe_float(value: Any) -> Optional[float]:
         try:
@@ -93,4 +284,4 @@ class PolymarketClient:
             return None
 
 
-__all__ = ["PolymarketClient", "Market", "Orderbook"]
+__all__ = ["PolymarketClient", "Market", "Orderbook", "RequestMetric"]
@@ -0,0 +1,232 @@
+"""Content-addressed on-disk cache for raw play-by-play downloads."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class CacheEntry:
+    """Manifest record describing one cached game."""
+
+    digest: str
+    size: int
+    finished: bool
+    fetched_at: str
+    last_access: float
+
+
+def is_game_finished(plays) -> bool:
+    """Return ``True`` when the play-by-play covers a completed game.
+
+    A game counts as finished once regulation (or an overtime period) has
+    ended with the clock at zero and the score is not tied.
+    """
+
+    import pandas as pd  # type: ignore import-not-found
+
+    if plays.empty:
+        return False
+
+    periods = plays["periodNumber"].astype(int)
+    last_period = int(periods.max())
+    if last_period < 4:
+        return False
+
+    final_period = plays.loc[periods == last_period]
+    clock = pd.to_timedelta(final_period["clock"])
+    if clock.min().total_seconds() > 0:
+        return False
+    final_event = final_period.loc[clock == clock.min()].iloc[-1]
+    return int(final_event["homeScore"]) != int(final_event["awayScore"])
+
+
+class RawPlayByPlayCache:
+    """Store each game's raw play-by-play as compressed Parquet keyed by content.
+
+    Objects live under ``root/objects`` named by the SHA-256 of their bytes and
+    ``root/manifest.json`` maps game IDs to objects. When ``max_bytes`` is set
+    the least recently used games are evicted after each write.
+
+    The manifest is rewritten after every ``flush_every`` writes rather than
+    after each one, so a season backfill does not rewrite it once per game;
+    call :meth:`flush` (as :func:`~nba_probs.data_pipeline.iter_batch_fetch`
+    does when it finishes) to persist the rest. Objects are written
+    immediately, so a manifest lagging behind them loses no data.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        max_bytes: Optional[int] = None,
+        compression: str = "zstd",
+        flush_every: int = 100,
+    ) -> None:
+        if flush_every < 1:
+            raise ValueError("flush_every must be at least 1")
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.manifest_path = self.root / "manifest.json"
+        self.max_bytes = max_bytes
+        self.compression = compression
+        self.flush_every = flush_every
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._unflushed_puts = 0
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self._entries = self._load_manifest()
+
+    def _load_manifest(self) -> Dict[str, CacheEntry]:
+        if not self.manifest_path.exists():
+            return {}
+        payload = json.loads(self.manifest_path.read_text())
+        if payload.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported raw cache manifest version: {payload.get('version')!r}")
+        return {game_id: CacheEntry(**entry) for game_id, entry in payload["entries"].items()}
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}.parquet"
+
+    def flush(self) -> None:
+        """Write the manifest to disk if it has pending changes."""
+
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {
+                "version": MANIFEST_VERSION,
+                "entries": {game_id: asdict(entry) for game_id, entry in sorted(self._entries.items())},
+            }
+            tmp_path = self.manifest_path.with_suffix(".json.tmp")
+            tmp_path.write_text(json.dumps(payload, indent=2))
+            os.replace(tmp_path, self.manifest_path)
+            self._dirty = False
+            self._unflushed_puts = 0
+
+    def __contains__(self, game_id: object) -> bool:
+        return game_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def game_ids(self) -> List[str]:
+        """Return the cached game IDs in sorted order."""
+
+        return sorted(self._entries)
+
+    def entry(self, game_id: str) -> Optional[CacheEntry]:
+        return self._entries.get(game_id)
+
+    def is_finished(self, game_id: str) -> bool:
+        """Return ``True`` when a completed game is cached and never needs refetching."""
+
+        entry = self._entries.get(game_id)
+        return entry is not None and entry.finished
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes on disk used by the objects referenced from the manifest."""
+
+        return sum({entry.digest: entry.size for entry in self._entries.values()}.values())
+
+    def get(self, game_id: str, *, finished_only: bool = False):
+        """Return the cached play-by-play for ``game_id`` or ``None``."""
+
+        import pyarrow.parquet as pq  # type: ignore import-not-found
+
+        with self._lock:
+            entry = self._entries.get(game_id)
+            if entry is None or (finished_only and not entry.finished):
+                return None
+            path = self._object_path(entry.digest)
+            if not path.exists():
+                del self._entries[game_id]
+                self._dirty = True
+                return None
+            entry.last_access = time.time()
+            self._dirty = True
+
+        return pq.read_table(path).to_pandas()
+
+    def put(self, game_id: str, plays, *, finished: Optional[bool] = None) -> CacheEntry:
+        """Store ``plays`` for ``game_id`` and return its manifest entry."""
+
+        import pyarrow as pa  # type: ignore import-not-found
+        import pyarrow.parquet as pq  # type: ignore import-not-found
+
+        sink = pa.BufferOutputStream()
+        pq.write_table(pa.Table.from_pandas(plays, preserve_index=False), sink, compression=self.compression)
+        data = sink.getvalue().to_pybytes()
+        digest = hashlib.sha256(data).hexdigest()
+
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+
+        now = time.time()
+        entry = CacheEntry(
+            digest=digest,
+            size=len(data),
+            finished=is_game_finished(plays) if finished is None else finished,
+            fetched_at=datetime.fromtimestamp(now, tz=timezone.utc).isoformat(),
+            last_access=now,
+        )
+        with self._lock:
+            previous = self._entries.get(game_id)
+            self._entries[game_id] = entry
+            self._dirty = True
+            if previous is not None and previous.digest != digest:
+                self._remove_unreferenced(previous.digest)
+            if self.max_bytes is not None:
+                self._evict(self.max_bytes)
+            self._unflushed_puts += 1
+            if self._unflushed_puts >= self.flush_every:
+                self.flush()
+        return entry
+
+    def evict(self, max_bytes: int) -> List[str]:
+        """Drop least recently used games until the cache fits in ``max_bytes``."""
+
+        with self._lock:
+            evicted = self._evict(max_bytes)
+            self.flush()
+        return evicted
+
+    def _evict(self, max_bytes: int) -> List[str]:
+        evicted: List[str] = []
+        with self._lock:
+            total = self.total_bytes
+            by_age = sorted(self._entries.items(), key=lambda item: item[1].last_access)
+            for game_id, entry in by_age:
+                if total <= max_bytes:
+                    break
+                del self._entries[game_id]
+                if self._remove_unreferenced(entry.digest):
+                    total -= entry.size
+                evicted.append(game_id)
+            if evicted:
+                self._dirty = True
+        return evicted
+
+    def _remove_unreferenced(self, digest: str) -> bool:
+        if any(entry.digest == digest for entry in self._entries.values()):
+            return False
+        self._object_path(digest).unlink(missing_ok=True)
+        return True
+
+
+__all__ = ["CacheEntry", "RawPlayByPlayCache", "is_game_finished"]
@@ -0,0 +1,172 @@
+"""TTL response cache with HTTP revalidation for the Polymarket client."""
+
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from . import metrics
+
+# ``/markets`` is large and changes slowly; orderbooks are always revalidated.
+DEFAULT_TTLS: Mapping[str, float] = {"/markets": 60.0, "/markets/*": 0.0}
+
+
+@dataclass
+class CachedResponse:
+    """Decoded payload of a GET response plus its validators."""
+
+    key: str
+    payload: Any
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+    def validators(self) -> Dict[str, str]:
+        """Return the conditional request headers for revalidating this entry."""
+
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def cache_key(method: str, url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+    """Return a canonical key for a request (query parameters sorted)."""
+
+    query = "&".join(f"{name}={value}" for name, value in sorted((params or {}).items()))
+    return f"{method.upper()} {url}?{query}"
+
+
+class ResponseCache:
+    """In-memory LRU of decoded responses with an optional on-disk copy.
+
+    ``ttls`` maps path patterns (``fnmatch`` syntax, first match wins) to the
+    number of seconds a response is served without contacting the server.
+    Stale entries that carry an ``ETag`` or ``Last-Modified`` validator are
+    revalidated with a conditional request, so an unchanged resource costs a
+    ``304``. Hits, revalidations and misses are counted in :meth:`stats`.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttls: Optional[Mapping[str, float]] = None,
+        default_ttl: float = 0.0,
+        directory: Optional[Path] = None,
+        max_entries: int = 256,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.directory = Path(directory) if directory is not None else None
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def ttl_for(self, path: str) -> float:
+        for pattern, ttl in self.ttls.items():
+            if fnmatch.fnmatchcase(path, pattern):
+                return ttl
+        return self.default_ttl
+
+    def is_fresh(self, entry: CachedResponse, path: str) -> bool:
+        return self._clock() - entry.stored_at < self.ttl_for(path)
+
+    def _disk_path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the entry for ``key`` from memory or disk, fresh or not."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if self.directory is None:
+            return None
+        path = self._disk_path(key)
+        try:
+            entry = CachedResponse(**json.loads(path.read_text()))
+        except (OSError, ValueError, TypeError):
+            return None
+        if entry.key != key:
+            return None
+        self._remember(entry)
+        return entry
+
+    def _remember(self, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[entry.key] = entry
+            self._entries.move_to_end(entry.key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def store(self, entry: CachedResponse) -> None:
+        """Keep ``entry`` in memory and, when configured, write it to disk atomically."""
+
+        self._remember(entry)
+        if self.directory is None:
+            return
+        path = self._disk_path(entry.key)
+        tmp_path = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(asdict(entry)))
+        os.replace(tmp_path, path)
+
+    def refresh(self, entry: CachedResponse) -> CachedResponse:
+        """Restart the TTL of an entry the server confirmed unchanged."""
+
+        entry.stored_at = self._clock()
+        self.store(entry)
+        return entry
+
+    def record(self, outcome: str) -> None:
+        """Count a lookup as ``"hit"``, ``"revalidated"`` or ``"miss"``."""
+
+        metrics.inc("polymarket_cache_total", outcome=outcome)
+        with self._lock:
+            if outcome == "hit":
+                self.hits += 1
+            elif outcome == "revalidated":
+                self.revalidations += 1
+            else:
+                self.misses += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "revalidations": self.revalidations,
+                "misses": self.misses,
+                "entries": len(self._entries),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        if self.directory is not None:
+            for path in self.directory.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    def now(self) -> float:
+        return self._clock()
+
+
+__all__ = ["CachedResponse", "DEFAULT_TTLS", "ResponseCache", "cache_key"]
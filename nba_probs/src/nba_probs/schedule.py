@@ -0,0 +1,182 @@
+"""Game ID discovery from the league schedule endpoint."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+from . import metrics
+from .concurrency import call_with_retry
+
+SEASON_PATTERN = re.compile(r"^(\d{4})-(\d{2})$")
+
+# The third digit of an NBA game ID gives the type of game.
+GAME_TYPES = {
+    "1": "preseason",
+    "2": "regular",
+    "3": "all-star",
+    "4": "playoffs",
+    "5": "play-in",
+    "6": "cup",
+}
+DEFAULT_GAME_TYPES = ("regular", "play-in", "playoffs")
+# ``gameStatus`` of a finished game; earlier games have no full play-by-play.
+FINAL_STATUS = 3
+# The first nba_api release that ships the ScheduleLeagueV2 endpoint.
+MIN_NBA_API_VERSION = "1.8"
+
+
+@dataclass(frozen=True)
+class ScheduledGame:
+    """One game of the league schedule."""
+
+    game_id: str
+    game_date: date
+    home_team: str
+    away_team: str
+    status: int
+
+    @property
+    def game_type(self) -> Optional[str]:
+        return GAME_TYPES.get(self.game_id[2:3])
+
+    @property
+    def is_final(self) -> bool:
+        return self.status == FINAL_STATUS
+
+
+def validate_season(season: str) -> str:
+    """Return ``season`` if it is a label such as ``"2023-24"``, else raise ``ValueError``."""
+
+    match = SEASON_PATTERN.match(season)
+    if match is None or (int(match.group(1)) + 1) % 100 != int(match.group(2)):
+        raise ValueError(f"Expected a season such as 2023-24, got {season!r}")
+    return season
+
+
+def schedule_endpoint():
+    """Return nba_api's ``ScheduleLeagueV2`` endpoint class.
+
+    Raises ``ImportError`` naming the required nba_api release when it is
+    missing, as it is from nba_api releases before 1.8.
+    """
+
+    try:
+        from nba_api.stats.endpoints import scheduleleaguev2  # type: ignore import-not-found
+    except ImportError as exc:
+        raise ImportError(
+            f"season discovery needs the ScheduleLeagueV2 endpoint from nba_api>={MIN_NBA_API_VERSION}; "
+            f"upgrade with: pip install 'nba_api>={MIN_NBA_API_VERSION}'"
+        ) from exc
+    return scheduleleaguev2.ScheduleLeagueV2
+
+
+def fetch_schedule(season: str) -> Dict[str, Any]:
+    """Download the raw league schedule of ``season`` in a single request."""
+
+    endpoint = schedule_endpoint()
+    return endpoint(season=validate_season(season), league_id="00").get_dict()
+
+
+def _parse_date(game: Mapping[str, Any], fallback: Optional[str]) -> date:
+    for value in (game.get("gameDateEst"), game.get("gameDate"), fallback):
+        if not value:
+            continue
+        text = str(value)
+        try:
+            return datetime.fromisoformat(text[:10]).date()
+        except ValueError:
+            return datetime.strptime(text.split(" ")[0], "%m/%d/%Y").date()
+    raise ValueError(f"Scheduled game {game.get('gameId')!r} has no date")
+
+
+def _tricode(team: Optional[Mapping[str, Any]]) -> str:
+    return str((team or {}).get("teamTricode") or "")
+
+
+def parse_schedule(payload: Mapping[str, Any]) -> List[ScheduledGame]:
+    """Flatten a ``ScheduleLeagueV2`` payload into games, ordered by date and ID."""
+
+    schedule = payload.get("leagueSchedule", payload)
+    games: Dict[str, ScheduledGame] = {}
+    for game_date in schedule.get("gameDates", ()):
+        for game in game_date.get("games", ()):
+            game_id = str(game["gameId"])
+            games[game_id] = ScheduledGame(
+                game_id=game_id,
+                game_date=_parse_date(game, game_date.get("gameDate")),
+                home_team=_tricode(game.get("homeTeam")),
+                away_team=_tricode(game.get("awayTeam")),
+                status=int(game.get("gameStatus") or 0),
+            )
+    return sorted(games.values(), key=lambda game: (game.game_date, game.game_id))
+
+
+def filter_games(
+    games: Iterable[ScheduledGame],
+    *,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    game_types: Iterable[str] = DEFAULT_GAME_TYPES,
+    final_only: bool = True,
+) -> List[ScheduledGame]:
+    """Keep games of ``game_types`` played between ``start`` and ``end`` (both inclusive)."""
+
+    game_types = set(game_types)
+    return [
+        game
+        for game in games
+        if game.game_type in game_types
+        and (not final_only or game.is_final)
+        and (start is None or game.game_date >= start)
+        and (end is None or game.game_date <= end)
+    ]
+
+
+def discover_game_ids(
+    season: str,
+    *,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    game_types: Iterable[str] = DEFAULT_GAME_TYPES,
+    final_only: bool = True,
+    retries: int = 3,
+    fetcher: Optional[Callable[[str], Mapping[str, Any]]] = None,
+) -> List[str]:
+    """Return the IDs of the finished games of ``season``, optionally within a date range.
+
+    The schedule is fetched with one call to ``fetcher`` (by default
+    :func:`fetch_schedule`), retried like the play-by-play downloads.
+    """
+
+    season = validate_season(season)
+    if fetcher is None:
+        schedule_endpoint()  # fail before retrying a missing endpoint
+    fetch = fetcher or fetch_schedule
+    with metrics.timer("nba_schedule_fetch_seconds"):
+        payload = call_with_retry(lambda: fetch(season), retries=retries)
+    games = filter_games(
+        parse_schedule(payload),
+        start=start,
+        end=end,
+        game_types=game_types,
+        final_only=final_only,
+    )
+    metrics.inc("nba_schedule_games_total", len(games))
+    return [game.game_id for game in games]
+
+
+__all__ = [
+    "DEFAULT_GAME_TYPES",
+    "GAME_TYPES",
+    "MIN_NBA_API_VERSION",
+    "ScheduledGame",
+    "discover_game_ids",
+    "fetch_schedule",
+    "filter_games",
+    "parse_schedule",
+    "schedule_endpoint",
+    "validate_season",
+]
@@ -0,0 +1,147 @@
+"""Versioned Arrow schema for the minute-level dataset."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
+    import pandas as pd  # type: ignore import-not-found
+    import pyarrow as pa  # type: ignore import-not-found
+
+MINUTE_SCHEMA_VERSION = 1
+SCHEMA_VERSION_KEY = b"nba_probs.minute_schema_version"
+
+# Columns that may be absent from an incoming frame and are filled with nulls.
+OPTIONAL_COLUMNS = frozenset({"game_date"})
+
+
+class SchemaVersionError(ValueError):
+    """Raised when stored data was written with an incompatible schema version."""
+
+
+def minute_schema() -> pa.Schema:
+    """Return the Arrow schema used to store minute summaries.
+
+    Scores, clocks and margins use narrow integers, game and team IDs are
+    dictionary-encoded and the period is categorical (dictionary of ``int8``).
+    """
+
+    import pyarrow as pa  # type: ignore import-not-found
+
+    return pa.schema(
+        [
+            ("game_id", pa.dictionary(pa.int32(), pa.string())),
+            ("minute_index", pa.int16()),
+            ("period", pa.dictionary(pa.int8(), pa.int8())),
+            ("seconds_remaining", pa.int16()),
+            ("home_team_score", pa.int16()),
+            ("away_team_score", pa.int16()),
+            ("home_team_id", pa.dictionary(pa.int16(), pa.int32())),
+            ("away_team_id", pa.dictionary(pa.int16(), pa.int32())),
+            ("home_win", pa.int8()),
+            ("game_date", pa.timestamp("us")),
+            ("score_margin", pa.int16()),
+        ],
+        metadata={SCHEMA_VERSION_KEY: str(MINUTE_SCHEMA_VERSION).encode()},
+    )
+
+
+def _cast_column(column, field):
+    import pyarrow as pa  # type: ignore import-not-found
+
+    if pa.types.is_dictionary(field.type) and not pa.types.is_dictionary(column.type):
+        column = column.cast(field.type.value_type).dictionary_encode()
+    return column.cast(field.type)
+
+
+def to_arrow_table(frame: pd.DataFrame) -> pa.Table:
+    """Convert a minute-level DataFrame to a table matching :func:`minute_schema`.
+
+    Raises ``ValueError`` when required columns are missing and
+    ``pyarrow.ArrowInvalid`` when values do not fit the narrow types.
+    """
+
+    import pandas as pd  # type: ignore import-not-found
+    import pyarrow as pa  # type: ignore import-not-found
+
+    schema = minute_schema()
+    missing = [name for name in schema.names if name not in frame.columns and name not in OPTIONAL_COLUMNS]
+    if missing:
+        raise ValueError(f"Missing required columns: {missing}")
+
+    columns = {}
+    for field in schema:
+        if field.name not in frame.columns:
+            columns[field.name] = pa.nulls(len(frame), type=field.type)
+            continue
+        values = frame[field.name]
+        if field.name == "game_date":
+            values = pd.to_datetime(values)
+        column = pa.chunked_array([pa.Array.from_pandas(values)])
+        columns[field.name] = _cast_column(column, field)
+
+    return pa.Table.from_arrays(list(columns.values()), schema=schema)
+
+
+def validate_table(table: pa.Table) -> pa.Table:
+    """Check a stored table's schema version and cast it to :func:`minute_schema`.
+
+    Tables without a version (written before the schema existed) are cast;
+    tables stamped with a different version are rejected.
+    """
+
+    import pyarrow as pa  # type: ignore import-not-found
+
+    schema = minute_schema()
+    metadata = table.schema.metadata or {}
+    version = metadata.get(SCHEMA_VERSION_KEY)
+    if version is not None and int(version) != MINUTE_SCHEMA_VERSION:
+        raise SchemaVersionError(
+            f"Minute data uses schema version {int(version)}, expected {MINUTE_SCHEMA_VERSION}"
+        )
+    if table.schema.equals(schema, check_metadata=False):
+        return table.replace_schema_metadata(schema.metadata)
+
+    names = set(table.schema.names)
+    missing = [name for name in schema.names if name not in names and name not in OPTIONAL_COLUMNS]
+    if missing:
+        raise ValueError(f"Missing required columns: {missing}")
+
+    columns = [
+        _cast_column(table.column(field.name), field) if field.name in names else pa.nulls(table.num_rows, type=field.type)
+        for field in schema
+    ]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def from_arrow_table(table: pa.Table) -> pd.DataFrame:
+    """Convert a stored table to pandas, keeping the compact dtypes."""
+
+    return validate_table(table).to_pandas()
+
+
+def conform_minutes(frame: pd.DataFrame) -> pd.DataFrame:
+    """Return ``frame`` with the compact dtypes of :func:`minute_schema`."""
+
+    return from_arrow_table(to_arrow_table(frame))
+
+
+def read_minutes(path: Path) -> pd.DataFrame:
+    """Read a minute-level Parquet file and enforce the schema."""
+
+    import pyarrow.parquet as pq  # type: ignore import-not-found
+
+    return from_arrow_table(pq.read_table(path))
+
+
+__all__ = [
+    "MINUTE_SCHEMA_VERSION",
+    "SchemaVersionError",
+    "conform_minutes",
+    "from_arrow_table",
+    "minute_schema",
+    "read_minutes",
+    "to_arrow_table",
+    "validate_table",
+]
@@ -0,0 +1,272 @@
+"""Append-only, crash-safe storage for Polymarket orderbook snapshots."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import uuid
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import quote, unquote
+
+from .config import get_settings
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
+    from .polymarket import Orderbook
+
+SNAPSHOT_FIELDS = (
+    "market_id",
+    "timestamp",
+    "yes_price",
+    "no_price",
+    "implied_yes_probability",
+    "implied_no_probability",
+)
+SEGMENT_PREFIX = "segment-"
+DEFAULT_SEGMENT_BYTES = 8 * 1024 * 1024
+
+TimeLike = Union[str, date, datetime]
+
+
+def snapshot_record(orderbook: Orderbook, *, timestamp: Optional[datetime] = None) -> Dict[str, object]:
+    """Return the JSON-serializable record stored for one orderbook sample."""
+
+    timestamp = timestamp or datetime.now(tz=timezone.utc)
+    return {
+        "market_id": orderbook.market_id,
+        "timestamp": timestamp.isoformat(),
+        "yes_price": orderbook.yes_price,
+        "no_price": orderbook.no_price,
+        "implied_yes_probability": orderbook.implied_yes_probability,
+        "implied_no_probability": orderbook.implied_no_probability,
+    }
+
+
+def _parse_time(value: TimeLike) -> datetime:
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, date):
+        parsed = datetime(value.year, value.month, value.day)
+    else:
+        parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def _fsync_directory(path: Path) -> None:
+    if os.name != "posix":  # pragma: no cover - directories cannot be opened on Windows
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _repair_tail(path: Path) -> None:
+    """Truncate a partially written last line left behind by a crash."""
+
+    with path.open("rb+") as handle:
+        size = handle.seek(0, os.SEEK_END)
+        if size == 0:
+            return
+        handle.seek(size - 1)
+        if handle.read(1) == b"\n":
+            return
+        position = size
+        while position > 0:
+            step = min(4096, position)
+            position -= step
+            handle.seek(position)
+            newline = handle.read(step).rfind(b"\n")
+            if newline != -1:
+                handle.truncate(position + newline + 1)
+                return
+        handle.truncate(0)
+
+
+class SnapshotStore:
+    """Snapshots stored as ``market=<id>/date=<YYYY-MM-DD>`` partitions.
+
+    New samples are appended to rolling JSON Lines segments and fsynced, so a
+    crash can at most leave a torn final line, which readers skip and the next
+    append truncates. :meth:`compact` rewrites closed partitions (days before
+    today, by default) into a single Parquet file. :meth:`read` only opens the
+    partitions of the requested market and days.
+    """
+
+    def __init__(self, root: Path, *, max_segment_bytes: int = DEFAULT_SEGMENT_BYTES, fsync: bool = True) -> None:
+        self.root = Path(root)
+        self.max_segment_bytes = max_segment_bytes
+        self.fsync = fsync
+        self._lock = threading.Lock()
+
+    def _partition(self, market_id: str, day: date) -> Path:
+        return self.root / f"market={quote(str(market_id), safe='')}" / f"date={day.isoformat()}"
+
+    def _segments(self, partition: Path) -> List[Path]:
+        return sorted(partition.glob(f"{SEGMENT_PREFIX}*.jsonl"))
+
+    def _active_segment(self, partition: Path) -> Path:
+        segments = self._segments(partition)
+        if segments and segments[-1].stat().st_size < self.max_segment_bytes:
+            return segments[-1]
+        index = int(segments[-1].stem[len(SEGMENT_PREFIX):]) + 1 if segments else 0
+        return partition / f"{SEGMENT_PREFIX}{index:06d}.jsonl"
+
+    def markets(self) -> List[str]:
+        """Return the IDs of every market with stored snapshots."""
+
+        return sorted(unquote(path.name[len("market="):]) for path in self.root.glob("market=*"))
+
+    def append(self, records: Iterable[Dict[str, object]]) -> int:
+        """Durably append snapshot records and return how many were written.
+
+        Records are grouped by partition so a batch spanning many markets costs
+        one write and one ``fsync`` per partition.
+        """
+
+        batches: Dict[Path, List[str]] = {}
+        for record in records:
+            day = _parse_time(str(record["timestamp"])).astimezone(timezone.utc).date()
+            partition = self._partition(str(record["market_id"]), day)
+            batches.setdefault(partition, []).append(json.dumps(record, separators=(",", ":")))
+
+        written = 0
+        with self._lock:
+            for partition, lines in batches.items():
+                created = not partition.exists()
+                partition.mkdir(parents=True, exist_ok=True)
+                segment = self._active_segment(partition)
+                new_file = not segment.exists()
+                if not new_file:
+                    _repair_tail(segment)
+                with segment.open("ab") as handle:
+                    handle.write(("\n".join(lines) + "\n").encode())
+                    handle.flush()
+                    if self.fsync:
+                        os.fsync(handle.fileno())
+                if self.fsync and new_file:
+                    _fsync_directory(partition)
+                    if created:
+                        _fsync_directory(partition.parent)
+                written += len(lines)
+        return written
+
+    def import_json(self, path: Path) -> int:
+        """Append the records of a JSON array file and return how many were imported.
+
+        This is the format ``polymarket_snapshot --output FILE`` wrote before
+        snapshots moved into a store.
+        """
+
+        records = json.loads(Path(path).read_text())
+        if not isinstance(records, list):
+            raise ValueError(f"{path} does not hold a JSON array of snapshots")
+        return self.append(records)
+
+    def _partitions_between(
+        self, market_id: str, start: Optional[datetime], end: Optional[datetime]
+    ) -> List[Tuple[date, Path]]:
+        market_dir = self.root / f"market={quote(str(market_id), safe='')}"
+        partitions = []
+        for path in market_dir.glob("date=*"):
+            day = date.fromisoformat(path.name[len("date="):])
+            if start is not None and day < start.astimezone(timezone.utc).date():
+                continue
+            if end is not None and day > end.astimezone(timezone.utc).date():
+                continue
+            partitions.append((day, path))
+        return sorted(partitions)
+
+    @staticmethod
+    def _read_segment(path: Path) -> List[Dict[str, object]]:
+        records = []
+        with path.open("rb") as handle:
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    break  # torn write from a crash; the record was never acknowledged
+                records.append(json.loads(line))
+        return records
+
+    def _read_partition(self, partition: Path):
+        import pandas as pd  # type: ignore import-not-found
+
+        frames = [pd.read_parquet(path) for path in sorted(partition.glob("*.parquet"))]
+        records: List[Dict[str, object]] = []
+        for segment in self._segments(partition):
+            records.extend(self._read_segment(segment))
+        if records:
+            frames.append(pd.DataFrame.from_records(records, columns=list(SNAPSHOT_FIELDS)))
+        if not frames:
+            return pd.DataFrame(columns=list(SNAPSHOT_FIELDS))
+        frame = pd.concat(frames, ignore_index=True)
+        frame["timestamp"] = pd.to_datetime(frame["timestamp"], utc=True, format="ISO8601")
+        return frame
+
+    def read(self, market_id: str, *, start: Optional[TimeLike] = None, end: Optional[TimeLike] = None):
+        """Return the snapshots of ``market_id`` taken in ``[start, end]`` as a DataFrame.
+
+        Timestamps are returned as timezone-aware UTC values, sorted ascending.
+        """
+
+        import pandas as pd  # type: ignore import-not-found
+
+        start_time = _parse_time(start) if start is not None else None
+        end_time = _parse_time(end) if end is not None else None
+        frames = [self._read_partition(path) for _, path in self._partitions_between(market_id, start_time, end_time)]
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame(columns=list(SNAPSHOT_FIELDS))
+
+        frame = pd.concat(frames, ignore_index=True)
+        if start_time is not None:
+            frame = frame.loc[frame["timestamp"] >= pd.Timestamp(start_time)]
+        if end_time is not None:
+            frame = frame.loc[frame["timestamp"] <= pd.Timestamp(end_time)]
+        return frame.sort_values("timestamp", kind="stable").reset_index(drop=True)
+
+    def compact(self, *, before: Optional[date] = None, compression: str = "zstd") -> List[Path]:
+        """Merge each closed partition's segments into one Parquet file.
+
+        Partitions dated before ``before`` (today in UTC by default) are
+        rewritten; the new file is in place before any segment is removed, so
+        an interrupted compaction never loses data. Returns the files written.
+        """
+
+        import pyarrow as pa  # type: ignore import-not-found
+        import pyarrow.parquet as pq  # type: ignore import-not-found
+
+        cutoff = before or datetime.now(tz=timezone.utc).date()
+        written: List[Path] = []
+        with self._lock:
+            for market_dir in sorted(self.root.glob("market=*")):
+                for partition in sorted(market_dir.glob("date=*")):
+                    if date.fromisoformat(partition.name[len("date="):]) >= cutoff:
+                        continue
+                    segments = self._segments(partition)
+                    parts = sorted(partition.glob("*.parquet"))
+                    if not segments and len(parts) <= 1:
+                        continue
+
+                    frame = self._read_partition(partition).sort_values("timestamp", kind="stable")
+                    table = pa.Table.from_pandas(frame, preserve_index=False)
+
+                    name = f"part-{uuid.uuid4().hex}.parquet"
+                    tmp_path = partition / f".{name}.tmp"
+                    pq.write_table(table, tmp_path, compression=compression)
+                    os.replace(tmp_path, partition / name)
+                    for path in [*segments, *parts]:
+                        path.unlink()
+                    written.append(partition / name)
+        return written
+
+
+def default_store() -> SnapshotStore:
+    """Return the snapshot store under ``Paths.polymarket_dir / "snapshots"``."""
+
+    return SnapshotStore(get_settings().paths.polymarket_dir / "snapshots")
+
+
+__all__ = ["SNAPSHOT_FIELDS", "SnapshotStore", "default_store", "snapshot_record"]
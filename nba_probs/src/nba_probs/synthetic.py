@@ -0,0 +1,263 @@
+"""Seeded generators for realistic synthetic NBA data used in tests and benchmarks."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
+    from .data_pipeline import GameMinute
+    from .edge import MarketLink
+    from .polymarket import Orderbook
+
+REGULATION_PERIODS = 4
+REGULATION_PERIOD_SECONDS = 12 * 60
+OVERTIME_PERIOD_SECONDS = 5 * 60
+
+
+def _format_clock(tenths: int) -> str:
+    minutes, rest = divmod(tenths, 600)
+    return f"PT{minutes:02d}M{rest / 10:05.2f}S"
+
+
+def synthetic_play_by_play(
+    game_id: str = "0022300001",
+    *,
+    seed: int = 0,
+    events: int = 500,
+    overtime_periods: int = 0,
+    home_team_id: int = 1610612737,
+    away_team_id: int = 1610612738,
+    game_date: Optional[str] = "2023-10-24",
+    tied_fraction: float = 0.0,
+):
+    """Return a play-by-play DataFrame shaped like ``fetch_play_by_play`` output.
+
+    Events are spread across the periods in proportion to their length, clocks
+    are non-increasing within a period and each period's boundaries (the
+    starting clock and ``0:00``) are always present. About ``tied_fraction``
+    of the interior events repeat the previous event's clock, as free throws
+    and substitutions do.
+    """
+
+    import numpy as np  # type: ignore import-not-found
+    import pandas as pd  # type: ignore import-not-found
+
+    rng = np.random.default_rng(seed)
+    period_lengths = [REGULATION_PERIOD_SECONDS] * REGULATION_PERIODS + [OVERTIME_PERIOD_SECONDS] * overtime_periods
+    total_seconds = sum(period_lengths)
+
+    periods = []
+    clocks = []
+    for period, length in enumerate(period_lengths, start=1):
+        count = max(2, round(events * length / total_seconds))
+        interior = rng.choice(np.arange(1, length * 10), size=count - 2, replace=False)
+        interior = np.sort(interior)[::-1]
+        if tied_fraction and len(interior) > 1:
+            tied = np.flatnonzero(rng.random(len(interior) - 1) < tied_fraction) + 1
+            interior[tied] = interior[tied - 1]
+            interior = np.minimum.accumulate(interior)
+        tenths = np.concatenate(([length * 10], interior, [0]))
+        periods.append(np.full(len(tenths), period))
+        clocks.append(tenths)
+
+    period_column = np.concatenate(periods)
+    clock_tenths = np.concatenate(clocks)
+    n_events = len(period_column)
+
+    scoring = rng.random(n_events) < 0.45
+    scoring[0] = False
+    points = rng.choice([1, 2, 3], size=n_events, p=[0.2, 0.6, 0.2]) * scoring
+    home_scores = rng.random(n_events) < 0.5
+    home_score = np.cumsum(np.where(home_scores, points, 0))
+    away_score = np.cumsum(np.where(home_scores, 0, points))
+
+    frame = pd.DataFrame(
+        {
+            "gameId": game_id,
+            "actionNumber": np.arange(1, n_events + 1),
+            "periodNumber": period_column,
+            "clock": [_format_clock(int(value)) for value in clock_tenths],
+            "homeScore": home_score,
+            "awayScore": away_score,
+            "homeTeamId": home_team_id,
+            "visitorTeamId": away_team_id,
+        }
+    )
+    if game_date is not None:
+        frame["gameDate"] = game_date
+    return frame
+
+
+def synthetic_season(game_ids: Iterable[str], *, seed: int = 0, events: int = 500):
+    """Return the concatenated play-by-play of several synthetic games.
+
+    Every fifth game goes to overtime so that the overtime branches are
+    exercised.
+    """
+
+    import pandas as pd  # type: ignore import-not-found
+
+    frames = [
+        synthetic_play_by_play(
+            game_id,
+            seed=seed + offset,
+            events=events,
+            overtime_periods=1 if offset % 5 == 4 else 0,
+        )
+        for offset, game_id in enumerate(game_ids)
+    ]
+    return pd.concat(frames, ignore_index=True)
+
+
+def synthetic_live_stream(
+    minutes, *, seed: int = 0, markets_per_game: int = 2, quotes_per_minute: int = 3
+) -> Tuple[List[MarketLink], List[Union[GameMinute, Orderbook]]]:
+    """Return ``(links, events)`` replaying summarized games alongside market quotes.
+
+    ``minutes`` is a minute-level frame such as :func:`summarize_games` output.
+    Every game gets ``markets_per_game`` markets (alternating which side YES
+    backs) and every game minute is followed by ``quotes_per_minute`` orderbook
+    updates per market, drifting around 0.5. Games are interleaved minute by
+    minute as if played concurrently; some quotes repeat the previous price.
+    """
+
+    import numpy as np  # type: ignore import-not-found
+
+    from .data_pipeline import GameMinute
+    from .edge import MarketLink
+    from .polymarket import Orderbook
+
+    rng = np.random.default_rng(seed)
+    fields = GameMinute.__dataclass_fields__
+    games = {
+        game_id: [GameMinute(**{name: row[name] for name in fields}) for row in group.to_dict("records")]
+        for game_id, group in minutes.groupby("game_id", sort=False)
+    }
+    links = [
+        MarketLink(f"{game_id}-m{index}", str(game_id), yes_is_home=index % 2 == 0)
+        for game_id in games
+        for index in range(markets_per_game)
+    ]
+    links_by_game: Dict[str, List[MarketLink]] = {}
+    for link in links:
+        links_by_game.setdefault(link.game_id, []).append(link)
+    prices = {link.market_id: 0.5 for link in links}
+
+    events: List[Union[GameMinute, Orderbook]] = []
+    for step in range(max(len(rows) for rows in games.values())):
+        for game_id, rows in games.items():
+            if step >= len(rows):
+                continue
+            events.append(rows[step])
+            for link in links_by_game[str(game_id)]:
+                for _ in range(quotes_per_minute):
+                    if rng.random() < 0.7:
+                        prices[link.market_id] = float(np.clip(prices[link.market_id] + rng.normal(0, 0.02), 0.01, 0.99))
+                    yes = round(prices[link.market_id], 3)
+                    events.append(Orderbook(link.market_id, yes, round(1 - yes, 3)))
+    return links, events
+
+
+def synthetic_snapshots(minutes, links, *, seed: int = 0, interval_seconds: float = 60.0, noise: float = 0.04):
+    """Return a snapshot frame (as :meth:`SnapshotStore.read` yields) for linked markets.
+
+    ``minutes`` needs a ``timestamp`` column. Each market is quoted every
+    ``interval_seconds`` (with jitter) from ten minutes before the first game
+    minute until its last one. Prices track a logistic function of the
+    current margin plus autocorrelated noise, so they disagree with any
+    particular model by a realistic amount.
+    """
+
+    import numpy as np  # type: ignore import-not-found
+    import pandas as pd  # type: ignore import-not-found
+
+    rng = np.random.default_rng(seed)
+    by_game = {str(game_id): group.sort_values("timestamp") for game_id, group in minutes.groupby("game_id")}
+    frames = []
+    for link in links:
+        game = by_game[str(link.game_id)]
+        start = game["timestamp"].iloc[0] - pd.Timedelta(minutes=10)
+        span = (game["timestamp"].iloc[-1] - start).total_seconds()
+        offsets = np.arange(0.0, span, interval_seconds) + rng.uniform(0, interval_seconds / 4, size=int(np.ceil(span / interval_seconds)))
+        stamps = start + pd.to_timedelta(offsets[offsets <= span], unit="s")
+        positions = np.searchsorted(game["timestamp"].to_numpy(), stamps.to_numpy(), side="right") - 1
+        margin = np.where(positions >= 0, game["score_margin"].to_numpy()[np.maximum(positions, 0)], 0)
+        drift = np.cumsum(rng.normal(0, noise / 4, size=len(stamps))) * 0.5 + rng.normal(0, noise, size=len(stamps))
+        home = 1.0 / (1.0 + np.exp(-0.15 * margin))
+        yes = np.clip((home if link.yes_is_home else 1.0 - home) + drift, 0.01, 0.99).round(3)
+        frames.append(
+            pd.DataFrame(
+                {
+                    "market_id": link.market_id,
+                    "timestamp": stamps,
+                    "yes_price": yes,
+                    "no_price": (1.0 - yes).round(3),
+                    "implied_yes_probability": yes,
+                    "implied_no_probability": (1.0 - yes).round(3),
+                }
+            )
+        )
+    return pd.concat(frames, ignore_index=True)
+
+
+NBA_TEAMS = (
+    "Hawks", "Celtics", "Nets", "Hornets", "Bulls", "Cavaliers", "Mavericks", "Nuggets", "Pistons", "Warriors",
+    "Rockets", "Pacers", "Clippers", "Lakers", "Grizzlies", "Heat", "Bucks", "Timberwolves", "Pelicans", "Knicks",
+    "Thunder", "Magic", "76ers", "Suns", "Trail Blazers", "Kings", "Spurs", "Raptors", "Jazz", "Wizards",
+)
+
+
+def synthetic_market_payloads(count: int, *, seed: int = 0, closed_fraction: float = 0.25):
+    """Return a ``GET /markets?tag=NBA`` payload with ``count`` binary game markets.
+
+    About ``closed_fraction`` of the markets are already closed or resolved;
+    prices are serialized as strings, as the API does.
+    """
+
+    import numpy as np  # type: ignore import-not-found
+
+    rng = np.random.default_rng(seed)
+    markets = []
+    for index in range(count):
+        home, away = rng.choice(len(NBA_TEAMS), size=2, replace=False)
+        yes = round(float(rng.uniform(0.05, 0.95)), 3)
+        status = str(rng.choice(["closed", "resolved"])) if rng.random() < closed_fraction else "active"
+        markets.append(
+            {
+                "id": f"{0x51a000 + index:x}",
+                "question": f"Will the {NBA_TEAMS[home]} beat the {NBA_TEAMS[away]}?",
+                "status": status,
+                "outcomePrices": {"yes": f"{yes:.3f}", "no": f"{1 - yes:.3f}"},
+            }
+        )
+    return {"markets": markets}
+
+
+def synthetic_orderbook_payloads(market_ids: Iterable[str], *, seed: int = 0, samples: int = 1, volatility: float = 0.02):
+    """Return ``GET /markets/<id>`` payloads: ``samples`` per market, as a random walk.
+
+    The result is a list of ``(market_id, payload)`` pairs ordered sample by
+    sample, the order a polling loop would see them in.
+    """
+
+    import numpy as np  # type: ignore import-not-found
+
+    rng = np.random.default_rng(seed)
+    market_ids = list(market_ids)
+    prices = rng.uniform(0.2, 0.8, size=len(market_ids))
+    payloads = []
+    for _ in range(samples):
+        prices = np.clip(prices + rng.normal(0, volatility, size=len(prices)), 0.01, 0.99)
+        for market_id, yes in zip(market_ids, prices.round(3).tolist()):
+            payloads.append((market_id, {"id": market_id, "outcomePrices": {"yes": f"{yes:.3f}", "no": f"{1 - yes:.3f}"}}))
+    return payloads
+
+
+__all__ = [
+    "synthetic_live_stream",
+    "synthetic_market_payloads",
+    "synthetic_orderbook_payloads",
+    "synthetic_play_by_play",
+    "synthetic_season",
+    "synthetic_snapshots",
+]
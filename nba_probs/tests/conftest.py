@@ -1,6 +1,126 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1] / "src"
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture
+def dummy_settings(tmp_path):
+    from nba_probs.config import Paths, Settings
+
+    data_dir = tmp_path / "data"
+    paths = Paths(
+        project_root=tmp_path,
+        data_dir=data_dir,
+        raw_data_dir=data_dir / "raw",
+        processed_data_dir=data_dir / "processed",
+        models_dir=data_dir / "models",
+        polymarket_dir=data_dir / "polymarket",
+    )
+    paths.ensure_exists()
+    return Settings(paths=paths)
+
+
+class PolymarketStub:
+    """Local HTTP/1.1 server mimicking the Polymarket endpoints used by the client.
+
+    ``markets`` maps market IDs to their raw payloads; ``statuses`` queues error
+    status codes to return for a path before it succeeds.
+    """
+
+    def __init__(self, *, latency: float = 0.0) -> None:
+        import json
+        import threading
+        import time
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        from urllib.parse import urlsplit
+
+        self.latency = latency
+        self.last_modified = "Tue, 24 Oct 2023 00:00:00 GMT"
+        self.markets = {}
+        self.statuses = {}
+        self.requests = []
+        self.client_ports = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):  # keep pytest output clean
+                pass
+
+            def do_GET(self):
+                path = urlsplit(self.path).path
+                with stub._lock:
+                    stub.requests.append((path, dict(self.headers)))
+                    stub.client_ports.add(self.client_address[1])
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                    queued = stub.statuses.get(path)
+                    status = queued.pop(0) if queued else 200
+                try:
+                    time.sleep(stub.latency)
+                    if status != 200:
+                        body, headers = b"{}", {"Retry-After": "0"}
+                    else:
+                        status, body, headers = stub.respond(path, self.headers)
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    for name, value in headers.items():
+                        self.send_header(name, value)
+                    self.end_headers()
+                    self.wfile.write(body)
+                finally:
+                    with stub._lock:
+                        stub.in_flight -= 1
+
+        self._json = json
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+        self.thread.start()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def add_market(self, market_id: str, yes: str = "0.6", no: str = "0.4", **fields) -> None:
+        self.markets[market_id] = {"id": market_id, "outcomePrices": {"yes": yes, "no": no}, **fields}
+
+    def respond(self, path, request_headers):
+        if path == "/markets":
+            payload = {"markets": list(self.markets.values())}
+        elif path.startswith("/markets/") and path[len("/markets/"):] in self.markets:
+            payload = self.markets[path[len("/markets/"):]]
+        else:
+            return 404, b"{}", {}
+        import hashlib
+
+        body = self._json.dumps(payload).encode()
+        headers = {"ETag": f'"{hashlib.sha1(body).hexdigest()[:16]}"', "Last-Modified": self.last_modified}
+        if request_headers.get("If-None-Match") == headers["ETag"]:
+            return 304, b"", headers
+        return 200, body, headers
+
+    def count(self, path: str) -> int:
+        return sum(1 for seen, _ in self.requests if seen == path)
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def polymarket_stub():
+    stub = PolymarketStub()
+    yield stub
+    stub.close()
@@ -0,0 +1,112 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+pytest.importorskip("joblib")
+pytest.importorskip("requests")
+
+from nba_probs.backtest import (
+    align_snapshots,
+    estimate_minute_timestamps,
+    score_alignment,
+    simulate,
+    threshold_grid,
+)
+from nba_probs.data_pipeline import summarize_games
+from nba_probs.edge import MarketLink
+from nba_probs.modeling import LogisticScorer
+from nba_probs.synthetic import synthetic_season, synthetic_snapshots
+
+SCORER = LogisticScorer(margin_coef=0.12, seconds_coef=0.0, intercept=0.05)
+GAME_IDS = [f"00223{index:05d}" for index in range(1, 11)]
+
+
+@pytest.fixture(scope="module")
+def season():
+    minutes = summarize_games(synthetic_season(GAME_IDS, events=200))
+    minutes["timestamp"] = estimate_minute_timestamps(minutes)
+    links = [MarketLink(f"{game_id}-{side}", game_id, yes_is_home=side == "home") for game_id in GAME_IDS for side in ("home", "away")]
+    snapshots = synthetic_snapshots(minutes, links, seed=1)
+    return minutes, links, snapshots
+
+
+def _reference_simulation(scored, entry_edge, exit_edge, cost):
+    pnl, trades = 0.0, 0
+    for _, rows in scored.groupby("market_id", sort=False):
+        position = 0
+        prices, edges, outcome = rows["market_probability"].tolist(), rows["edge"].tolist(), rows["outcome"].iloc[0]
+        for index, (price, edge) in enumerate(zip(prices, edges)):
+            target = position
+            if edge >= entry_edge:
+                target = 1
+            elif edge <= -entry_edge:
+                target = -1
+            elif abs(edge) <= exit_edge:
+                target = 0
+            pnl -= cost * abs(target - position)
+            trades += target != 0 and target != position
+            position = target
+            following = prices[index + 1] if index + 1 < len(prices) else outcome
+            pnl += position * (following - price)
+    return pnl, trades
+
+
+def test_estimated_timestamps_follow_the_game_clock(season):
+    minutes, _, _ = season
+    for _, game in minutes.groupby("game_id"):
+        assert game["timestamp"].is_monotonic_increasing
+        assert game["timestamp"].iloc[0].tz is not None
+
+    tipoff = pd.Timestamp("2023-10-25T02:00:00Z")
+    shifted = estimate_minute_timestamps(minutes, {GAME_IDS[0]: tipoff})
+    first_game = minutes["game_id"] == GAME_IDS[0]
+    assert shifted[first_game].min() >= tipoff
+    assert (shifted[~first_game] == minutes.loc[~first_game, "timestamp"]).all()
+
+
+def test_align_snapshots_uses_latest_minute_at_or_before_each_quote(season):
+    minutes, links, snapshots = season
+    aligned = align_snapshots(snapshots, minutes, links)
+
+    assert len(aligned) < len(snapshots)  # pre-tipoff quotes are dropped
+    sample = aligned.sample(50, random_state=0)
+    for row in sample.itertuples():
+        game = minutes[(minutes["game_id"] == row.game_id) & (minutes["timestamp"] <= row.timestamp)]
+        assert row.score_margin == game.iloc[-1]["score_margin"]
+    assert aligned.groupby("market_id")["timestamp"].apply(lambda ts: ts.is_monotonic_increasing).all()
+
+
+@pytest.mark.parametrize("entry_edge, exit_edge, cost", [(0.05, 0.0, 0.0), (0.1, 0.02, 0.01), (0.02, 0.02, 0.0)])
+def test_simulate_matches_row_by_row_reference(season, entry_edge, exit_edge, cost):
+    minutes, links, snapshots = season
+    scored = score_alignment(align_snapshots(snapshots, minutes, links), SCORER)
+
+    result = simulate(scored, entry_edge=entry_edge, exit_edge=exit_edge, cost=cost)
+    pnl, trades = _reference_simulation(scored, entry_edge, exit_edge, cost)
+
+    assert result.pnl == pytest.approx(pnl)
+    assert result.trades == trades
+
+
+def test_threshold_grid_is_identical_across_workers(season):
+    minutes, links, snapshots = season
+    scored = score_alignment(align_snapshots(snapshots, minutes, links), SCORER)
+
+    serial = threshold_grid(scored, [0.02, 0.05, 0.1], [0.0, 0.03], n_jobs=1)
+    parallel = threshold_grid(scored, [0.02, 0.05, 0.1], [0.0, 0.03], n_jobs=2)
+
+    pd.testing.assert_frame_equal(serial, parallel)
+    assert len(serial) == 5  # (0.02, 0.03) would exit above its entry and is skipped
+    assert serial["pnl"].is_monotonic_decreasing
+    with pytest.raises(ValueError):
+        simulate(scored, entry_edge=0.01, exit_edge=0.05)
+
+
+def test_threshold_grid_without_valid_rules_is_empty(season):
+    minutes, links, snapshots = season
+    scored = score_alignment(align_snapshots(snapshots, minutes, links), SCORER)
+
+    grid = threshold_grid(scored, [0.01], [0.05], n_jobs=1)
+
+    assert grid.empty
+    assert list(grid.columns) == list(threshold_grid(scored, [0.05], [0.0], n_jobs=1).columns)
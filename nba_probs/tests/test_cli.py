@@ -8,13 +8,16 @@ from types import SimpleNamespace
 
 import pytest
 
+from nba_probs import polymarket, snapshots
 from nba_probs.cli import collect as collect_cli
 from nba_probs.cli import polymarket_snapshot as snapshot_cli
 from nba_probs.polymarket import Orderbook
+from nba_probs.snapshots import SnapshotStore
 
 pd = pytest.importorskip("pandas")
 
 SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
 
 
 def _cli_env() -> dict[str, str]:
@@ -27,6 +30,24 @@ def _cli_env() -> dict[str, str]:
     return env
 
 
+def _minute_frame(game_id: str, *, minutes: int = 1, game_date: str | None = None) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "game_id": [game_id] * minutes,
+            "minute_index": list(range(minutes)),
+            "period": [1] * minutes,
+            "seconds_remaining": [2880 - 60 * i for i in range(minutes)],
+            "home_team_score": [2 * i for i in range(minutes)],
+            "away_team_score": [0] * minutes,
+            "home_team_id": [100] * minutes,
+            "away_team_id": [200] * minutes,
+            "home_win": [1] * minutes,
+            "game_date": [game_date] * minutes,
+            "score_margin": [2 * i for i in range(minutes)],
+        }
+    )
+
+
 @pytest.mark.cli
 def test_collect_help_runs():
     result = subprocess.run(
@@ -51,6 +72,42 @@ def test_polymarket_snapshot_help_runs():
     assert "Polymarket orderbook snapshot" in result.stdout
 
 
+# Heavy modules a bare CLI import must not load. Checking the -X importtime
+# module list rather than wall-clock time keeps the test stable on shared CI.
+FORBIDDEN_IMPORTS = {
+    "nba_probs.cli.polymarket_snapshot": ("pandas", "numpy", "pyarrow", "requests"),
+    "nba_probs.cli.collect": ("pandas", "numpy", "pyarrow", "sklearn", "nba_api"),
+}
+
+
+def _import_profile(module: str) -> dict[str, float]:
+    """Return the cumulative import seconds of every module loaded by ``import module``."""
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=_cli_env(),
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        profile[name.strip()] = int(cumulative) / 1e6
+    return profile
+
+
+@pytest.mark.cli
+@pytest.mark.parametrize("module", sorted(FORBIDDEN_IMPORTS))
+def test_cli_import_skips_heavy_modules(module):
+    profile = _import_profile(module)
+
+    loaded = [f"{name} ({profile[name] * 1000:.0f} ms)" for name in FORBIDDEN_IMPORTS[module] if name in profile]
+    assert not loaded, f"{module} imports {', '.join(loaded)} at module level"
+
+
 @pytest.mark.cli
 def test_collect_main_writes_parquet(tmp_path, monkeypatch, dummy_settings):
     dataset = pd.DataFrame(
@@ -68,40 +125,309 @@ def test_collect_main_writes_parquet(tmp_path, monkeypatch, dummy_settings):
         }
     )
 
-    monkeypatch.setattr(collect_cli, "batch_fetch", lambda *args, **kwargs: dataset)
+    monkeypatch.setattr(collect_cli, "iter_batch_fetch", lambda *args, **kwargs: iter([dataset]))
     monkeypatch.setattr(collect_cli, "get_settings", lambda: dummy_settings)
 
     output_path = tmp_path / "dataset.parquet"
-    args = argparse.Namespace(game_ids=["001"], output=output_path, no_progress=True)
+    args = argparse.Namespace(
+        game_ids=["001"],
+        season=None,
+        date_range=None,
+        output=output_path,
+        no_progress=True,
+        mode="threads",
+        concurrency=2,
+        processes=0,
+        rate_limit=None,
+        retries=0,
+        no_cache=True,
+        offline=False,
+        cache_max_mb=None,
+        batch_games=50,
+        refresh=False,
+        metrics=tmp_path / "collect.prom",
+    )
 
     collect_cli.main(args)
 
     assert output_path.exists()
     assert output_path.stat().st_size > 0
+    assert (tmp_path / "collect.prom").exists()
 
 
 @pytest.mark.cli
-def test_polymarket_snapshot_appends_json(tmp_path, monkeypatch, dummy_settings):
-    monkeypatch.setattr(snapshot_cli, "get_settings", lambda: dummy_settings)
+def test_collect_main_updates_partitioned_dataset(monkeypatch, dummy_settings):
+    from nba_probs.dataset import MinuteDataset
+
+    fetched = []
 
-    def fake_client():
-        return SimpleNamespace(
-            fetch_orderbook=lambda market_id: Orderbook(
-                market_id=market_id,
-                yes_price=0.6,
-                no_price=0.4,
-            )
-        )
+    def fake_iter_batch_fetch(game_ids, **kwargs):
+        fetched.append(list(game_ids))
+        for game_id in game_ids:
+            yield _minute_frame(game_id, game_date="2023-10-24")
 
-    monkeypatch.setattr(snapshot_cli, "PolymarketClient", fake_client)
+    monkeypatch.setattr(collect_cli, "iter_batch_fetch", fake_iter_batch_fetch)
+    monkeypatch.setattr(collect_cli, "get_settings", lambda: dummy_settings)
 
-    output_path = tmp_path / "snapshot.json"
-    args = argparse.Namespace(market_id="abc", output=output_path)
+    args = argparse.Namespace(
+        game_ids=["0022300001", "0022300002"],
+        season=None,
+        date_range=None,
+        output=None,
+        no_progress=True,
+        mode="serial",
+        concurrency=1,
+        processes=0,
+        rate_limit=None,
+        retries=0,
+        no_cache=True,
+        offline=False,
+        cache_max_mb=None,
+        batch_games=50,
+        refresh=False,
+        metrics=None,
+    )
+    collect_cli.main(args)
+    args.game_ids = ["0022300002", "0022300003"]
+    collect_cli.main(args)
+
+    store = MinuteDataset(dummy_settings.paths.processed_data_dir / "minutes")
+    assert fetched == [["0022300001", "0022300002"], ["0022300003"]]
+    assert store.game_ids() == ["0022300001", "0022300002", "0022300003"]
+
+
+@pytest.mark.cli
+def test_collect_season_discovers_games_from_schedule(monkeypatch, dummy_settings, capsys):
+    from nba_probs import schedule
+    from nba_probs.dataset import MinuteDataset
+
+    payload = json.loads((FIXTURES_DIR / "schedule_2023-24.json").read_text())
+    requested = []
+    fetched = []
+
+    def fake_fetch_schedule(season):
+        requested.append(season)
+        return payload
+
+    def fake_iter_batch_fetch(game_ids, **kwargs):
+        fetched.append(list(game_ids))
+        for game_id in game_ids:
+            yield _minute_frame(game_id, game_date="2023-10-24")
+
+    monkeypatch.setattr(schedule, "schedule_endpoint", lambda: None)
+    monkeypatch.setattr(collect_cli, "schedule_endpoint", lambda: None)
+    monkeypatch.setattr(schedule, "fetch_schedule", fake_fetch_schedule)
+    monkeypatch.setattr(collect_cli, "iter_batch_fetch", fake_iter_batch_fetch)
+    monkeypatch.setattr(collect_cli, "get_settings", lambda: dummy_settings)
+    MinuteDataset(dummy_settings.paths.processed_data_dir / "minutes").write(
+        _minute_frame("0022300061", game_date="2023-10-24")
+    )
+
+    monkeypatch.setattr(
+        sys, "argv", ["collect", "--season", "2023-24", "--date-range", "2023-10-24", "2023-10-31", "--no-progress"]
+    )
+    collect_cli.main()
+
+    assert requested == ["2023-24"]
+    assert fetched == [["0022300062", "0022300063", "0022300064"]]
+    assert "Found 4 finished games in the 2023-24 schedule" in capsys.readouterr().out
+
+
+@pytest.mark.cli
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--season", "2023"],
+        ["--season", "2023-25"],
+        ["--season", "2023-24", "--offline"],
+        ["--date-range", "2023-10-24", "2023-10-31", "001"],
+        ["--season", "2023-24", "--date-range", "2023-11-01", "2023-10-01"],
+    ],
+)
+def test_collect_season_argument_errors(monkeypatch, argv):
+    monkeypatch.setattr(collect_cli, "schedule_endpoint", lambda: None)
+    monkeypatch.setattr(sys, "argv", ["collect", *argv])
+    with pytest.raises(SystemExit):
+        collect_cli.parse_args()
+
+
+@pytest.mark.cli
+def test_collect_season_reports_an_outdated_nba_api(monkeypatch, capsys):
+    # A None entry makes the endpoint import fail, as on nba_api releases before 1.8.
+    monkeypatch.setitem(sys.modules, "nba_api.stats.endpoints", None)
+    monkeypatch.setattr(sys, "argv", ["collect", "--season", "2023-24"])
+
+    with pytest.raises(SystemExit):
+        collect_cli.parse_args()
+    assert "nba_api>=1.8" in capsys.readouterr().err
+
+
+@pytest.mark.cli
+def test_write_parquet_stream_writes_one_row_group_per_batch(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    frames = (_minute_frame(f"{i:03d}", minutes=3) for i in range(5))
+
+    output_path = tmp_path / "stream.parquet"
+    rows = collect_cli.write_parquet_stream(frames, output_path, batch_games=2)
+
+    parquet_file = pq.ParquetFile(output_path)
+    assert rows == 15
+    assert parquet_file.num_row_groups == 3
+    assert parquet_file.metadata.num_rows == 15
+    assert parquet_file.schema_arrow.field("minute_index").type == "int16"
+
+
+@pytest.mark.cli
+def test_polymarket_snapshot_appends_to_store(tmp_path, monkeypatch, dummy_settings):
+    monkeypatch.setattr(snapshots, "get_settings", lambda: dummy_settings)
+
+    clients = []
+
+    class FakeClient:
+        def __init__(self):
+            self.closed = False
+            clients.append(self)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            self.closed = True
+
+        def fetch_orderbook(self, market_id):
+            return Orderbook(market_id=market_id, yes_price=0.6, no_price=0.4)
+
+    monkeypatch.setattr(polymarket, "PolymarketClient", FakeClient)
+
+    output_path = tmp_path / "snapshots"
+    args = snapshot_cli.parse_args(["abc", "--output", str(output_path)])
 
     snapshot_cli.main(args)
     snapshot_cli.main(args)
 
-    payload = json.loads(output_path.read_text())
+    payload = SnapshotStore(output_path).read("abc")
     assert len(payload) == 2
-    assert payload[0]["market_id"] == "abc"
-    assert 0 <= payload[0]["implied_yes_probability"] <= 1
+    assert payload["market_id"].tolist() == ["abc", "abc"]
+    assert (0 <= payload["implied_yes_probability"]).all() and (payload["implied_yes_probability"] <= 1).all()
+    assert list(output_path.glob("market=abc/date=*/segment-*.jsonl"))
+
+    snapshot_cli.main(snapshot_cli.parse_args(["abc", "--save"]))
+    assert len(SnapshotStore(dummy_settings.paths.polymarket_dir / "snapshots").read("abc")) == 1
+    assert len(clients) == 3 and all(client.closed for client in clients)
+
+
+@pytest.mark.cli
+def test_polymarket_snapshot_rejects_legacy_output_file_and_imports_it(tmp_path, monkeypatch, capsys):
+    legacy = tmp_path / "snapshots.json"
+    records = [
+        {
+            "market_id": "abc",
+            "timestamp": f"2024-01-0{day}T12:00:00+00:00",
+            "yes_price": 0.6,
+            "no_price": 0.4,
+            "implied_yes_probability": 0.6,
+            "implied_no_probability": 0.4,
+        }
+        for day in (1, 2)
+    ]
+    legacy.write_text(json.dumps(records))
+
+    with pytest.raises(SystemExit):
+        snapshot_cli.parse_args(["abc", "--output", str(legacy)])
+    assert "--import-legacy" in capsys.readouterr().err
+
+    def no_client():
+        raise AssertionError("importing must not touch the network")
+
+    monkeypatch.setattr(polymarket, "PolymarketClient", no_client)
+    store_path = tmp_path / "store"
+    snapshot_cli.main(snapshot_cli.parse_args(["--import-legacy", str(legacy), "--output", str(store_path)]))
+
+    assert SnapshotStore(store_path).read("abc")["timestamp"].dt.day.tolist() == [1, 2]
+    assert legacy.exists()
+
+
+class _FakeSnapshotClient:
+    def __init__(self):
+        self.discoveries = 0
+
+    def list_nba_markets(self):
+        self.discoveries += 1
+        return [
+            SimpleNamespace(id="live", status="active"),
+            SimpleNamespace(id="done", status="closed"),
+        ]
+
+    def fetch_orderbooks(self, market_ids, *, skip_errors=False):
+        return {market_id: Orderbook(market_id=market_id, yes_price=0.55, no_price=0.45) for market_id in market_ids}
+
+
+@pytest.mark.cli
+def test_polymarket_snapshot_daemon_samples_on_schedule(tmp_path):
+    from nba_probs.concurrency import FixedRateSchedule
+
+    now = [0.0]
+
+    def sleep(seconds):
+        now[0] += seconds
+
+    def fetch(market_ids, **kwargs):
+        now[0] += 0.25  # pretend every sample takes a quarter of a second
+        return _FakeSnapshotClient.fetch_orderbooks(client, market_ids, **kwargs)
+
+    client = _FakeSnapshotClient()
+    client.fetch_orderbooks = fetch
+    store = SnapshotStore(tmp_path / "snapshots")
+    args = snapshot_cli.parse_args(["abc", "--discover", "--interval", "1", "--iterations", "5", "--flush-every", "2"])
+    schedule = FixedRateSchedule(1.0, clock=lambda: now[0], sleep=sleep)
+    messages = []
+
+    summary = snapshot_cli.run_daemon(client, store, args, schedule=schedule, log=messages.append)
+
+    assert summary["ticks"] == 5
+    assert summary["max"] == 0.0
+    assert now[0] == pytest.approx(4.25)  # no drift: the fifth sample starts at t=4
+    assert store.markets() == ["abc", "live"]
+    assert len(store.read("live")) == 5
+    assert client.discoveries == 5
+    assert "Captured 10 snapshots in 5 samples" in messages[-1]
+
+
+@pytest.mark.cli
+def test_polymarket_snapshot_daemon_survives_a_failed_discovery(tmp_path):
+    import requests
+
+    from nba_probs.concurrency import FixedRateSchedule
+
+    client = _FakeSnapshotClient()
+    discover = client.list_nba_markets
+
+    def flaky_discovery():
+        if client.discoveries == 1:
+            client.discoveries += 1
+            raise requests.ConnectionError("gamma-api unreachable")
+        return discover()
+
+    client.list_nba_markets = flaky_discovery
+    store = SnapshotStore(tmp_path / "snapshots")
+    args = snapshot_cli.parse_args(["abc", "--discover", "--interval", "1", "--iterations", "3"])
+    schedule = FixedRateSchedule(1.0, clock=lambda: 0.0, sleep=lambda seconds: None)
+    messages = []
+
+    snapshot_cli.run_daemon(client, store, args, schedule=schedule, log=messages.append)
+
+    assert client.discoveries == 3
+    assert len(store.read("abc")) == 3
+    assert len(store.read("live")) == 3  # the second tick reused the first tick's markets
+    assert any("Market discovery failed" in message for message in messages)
+
+
+def test_polymarket_snapshot_compact_needs_a_store():
+    with pytest.raises(SystemExit):
+        snapshot_cli.parse_args(["abc", "--compact"])
+    assert snapshot_cli.parse_args(["abc", "--compact", "--save"]).compact
+
+
+def test_polymarket_snapshot_requires_a_market():
+    with pytest.raises(SystemExit):
+        snapshot_cli.parse_args([])
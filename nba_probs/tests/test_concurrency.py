@@ -0,0 +1,95 @@
+import asyncio
+import random
+
+import pytest
+
+from nba_probs.concurrency import (
+    TokenBucket,
+    async_call_with_retry,
+    backoff_delay,
+    call_with_retry,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_allows_burst_then_paces():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=clock)
+
+    assert bucket.try_acquire() == 0.0
+    assert bucket.try_acquire() == 0.0
+    assert bucket.try_acquire() == pytest.approx(0.5)
+
+    clock.now += 0.5
+    assert bucket.try_acquire() == 0.0
+
+
+def test_token_bucket_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_backoff_delay_is_bounded():
+    rng = random.Random(0)
+    for attempt in range(10):
+        delay = backoff_delay(attempt, base_delay=0.5, max_delay=4.0, rng=rng)
+        assert 0.0 <= delay <= min(4.0, 0.5 * 2 ** attempt)
+
+
+def test_call_with_retry_recovers_from_transient_errors():
+    calls = []
+    sleeps = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise ConnectionError("boom")
+        return "ok"
+
+    assert call_with_retry(flaky, retries=3, sleep=sleeps.append) == "ok"
+    assert len(calls) == 3
+    assert len(sleeps) == 2
+
+
+def test_call_with_retry_gives_up_after_retries():
+    def always_fails():
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        call_with_retry(always_fails, retries=2, sleep=lambda _: None)
+
+
+def test_async_call_with_retry_recovers():
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise TimeoutError("slow")
+        return 42
+
+    result = asyncio.run(async_call_with_retry(flaky, retries=1, base_delay=0.001))
+    assert result == 42
+    assert len(attempts) == 2
+
+
+def test_fixed_rate_schedule_skips_missed_ticks_without_drift():
+    from nba_probs.concurrency import FixedRateSchedule
+
+    now = [0.0]
+    schedule = FixedRateSchedule(1.0, clock=lambda: now[0], sleep=lambda seconds: now.__setitem__(0, now[0] + seconds))
+    started = []
+    for tick in schedule.ticks(4):
+        started.append((tick, now[0]))
+        now[0] += 2.5 if tick == 1 else 0.1
+
+    assert started == [(0, 0.0), (1, 1.0), (4, 4.0), (5, 5.0)]
+    assert schedule.missed == 2
+    assert schedule.jitter_summary()["max"] == 0.0
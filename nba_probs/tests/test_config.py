@@ -1,9 +1,5 @@
-import pytest
-
-pytest.importorskip("pydantic")
-pytest.importorskip("pydantic_settings")
-
-from nba_probs.config import Paths, get_settings
+from nba_probs import config
+from nba_probs.config import Paths, get_settings, read_env_file
 
 
 def test_paths_ensure_exists(tmp_path):
@@ -29,3 +25,40 @@ def test_get_settings_cached():
     first = get_settings()
     second = get_settings()
     assert first is second
+
+
+def test_read_env_file_parses_dotenv_syntax(tmp_path):
+    path = tmp_path / ".env"
+    path.write_text(
+        "# comment\n"
+        "POLYMARKET_API_KEY=abc\n"
+        "export HTTP_PROXY = 'http://proxy:8080'\n"
+        'https_proxy="https://proxy:8443"\n'
+        "not a setting\n"
+    )
+
+    assert read_env_file(path) == {
+        "POLYMARKET_API_KEY": "abc",
+        "HTTP_PROXY": "http://proxy:8080",
+        "https_proxy": "https://proxy:8443",
+    }
+    assert read_env_file(tmp_path / "missing.env") == {}
+
+
+def test_get_settings_prefers_environment(tmp_path, monkeypatch):
+    path = tmp_path / ".env"
+    path.write_text("POLYMARKET_API_KEY=from-file\nhttps_proxy=https://file-proxy\n")
+    monkeypatch.setattr(config, "ENV_FILE", path)
+    monkeypatch.setenv("POLYMARKET_API_KEY", "from-env")
+    monkeypatch.delenv("HTTPS_PROXY", raising=False)
+    monkeypatch.delenv("https_proxy", raising=False)
+    get_settings.cache_clear()
+    try:
+        settings = get_settings()
+    finally:
+        get_settings.cache_clear()
+
+    assert settings.polymarket_api_key == "from-env"
+    assert settings.https_proxy == "https://file-proxy"
+    assert settings.paths == Paths()
+    assert settings.paths.raw_data_dir == config.DATA_DIR / "raw"
@@ -1,8 +1,21 @@
+import threading
+import time
+from collections import Counter
+
 import pytest
 
 pd = pytest.importorskip("pandas")
+pytest.importorskip("tqdm")
 
-from nba_probs.data_pipeline import summarize_game_by_minute
+from nba_probs.data_pipeline import (
+    IncrementalMinuteSummarizer,
+    batch_fetch,
+    iter_batch_fetch,
+    summarize_game_by_minute,
+    summarize_game_by_minute_fast,
+    summarize_games,
+)
+from nba_probs.synthetic import synthetic_play_by_play, synthetic_season
 
 
 def _sample_play_by_play() -> pd.DataFrame:
@@ -87,3 +100,302 @@ def test_summarize_game_by_minute_handles_empty_input():
 
     with pytest.raises(ValueError):
         summarize_game_by_minute(empty)
+
+
+def _assert_matches_reference(plays: pd.DataFrame, fast: pd.DataFrame) -> None:
+    reference = summarize_game_by_minute(plays).reset_index(drop=True)
+    pd.testing.assert_frame_equal(fast, reference)
+
+
+def test_summarize_game_by_minute_fast_matches_reference_on_sample():
+    plays = _sample_play_by_play()
+    _assert_matches_reference(plays, summarize_game_by_minute_fast(plays))
+
+
+@pytest.mark.parametrize("overtime_periods", [0, 1, 2])
+def test_summarize_game_by_minute_fast_matches_reference_on_full_game(overtime_periods):
+    plays = synthetic_play_by_play(seed=overtime_periods, overtime_periods=overtime_periods)
+    _assert_matches_reference(plays, summarize_game_by_minute_fast(plays))
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_summarize_game_by_minute_fast_matches_reference_with_tied_clocks(seed):
+    plays = synthetic_play_by_play(seed=seed, overtime_periods=seed % 3, tied_fraction=0.3)
+    clocks = plays["clock"]
+    assert (clocks.eq(clocks.shift()) & plays["periodNumber"].eq(plays["periodNumber"].shift())).any()
+    _assert_matches_reference(plays, summarize_game_by_minute_fast(plays))
+
+
+def test_summarize_game_by_minute_fast_handles_empty_input():
+    with pytest.raises(ValueError):
+        summarize_game_by_minute_fast(_sample_play_by_play().iloc[0:0])
+
+
+def test_summarize_games_matches_per_game_reference():
+    plays = synthetic_season(["003", "001", "002"], events=200)
+    summary = summarize_games(plays)
+
+    expected = pd.concat(
+        [summarize_game_by_minute(group) for _, group in plays.groupby("gameId", sort=False)],
+        ignore_index=True,
+    )
+    pd.testing.assert_frame_equal(summary, expected)
+    assert list(summary["game_id"].unique()) == ["003", "001", "002"]
+
+
+class FakeStatsEndpoint:
+    """Stand-in for the stats endpoint that injects latency and failures."""
+
+    def __init__(self, *, latency: float = 0.0, failures: dict | None = None) -> None:
+        self.latency = latency
+        self.failures = dict(failures or {})
+        self.calls: Counter = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, game_id: str) -> pd.DataFrame:
+        with self._lock:
+            self.calls[game_id] += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            should_fail = self.failures.get(game_id, 0) > 0
+            if should_fail:
+                self.failures[game_id] -= 1
+        try:
+            time.sleep(self.latency)
+            if should_fail:
+                raise ConnectionError(f"injected failure for {game_id}")
+            return synthetic_play_by_play(game_id, seed=int(game_id), events=120)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+GAME_IDS = [f"{i:03d}" for i in range(8)]
+
+
+def _sorted_by_game(frame: pd.DataFrame) -> pd.DataFrame:
+    return frame.sort_values(["game_id", "minute_index"]).reset_index(drop=True)
+
+
+@pytest.mark.parametrize("mode", ["serial", "threads", "asyncio"])
+def test_batch_fetch_modes_match_serial_summaries(mode):
+    endpoint = FakeStatsEndpoint(latency=0.01, failures={"002": 1, "005": 2})
+
+    dataset = batch_fetch(
+        GAME_IDS,
+        show_progress=False,
+        mode=mode,
+        concurrency=4,
+        base_delay=0.001,
+        fetcher=endpoint,
+    )
+
+    expected = summarize_games(
+        pd.concat([synthetic_play_by_play(g, seed=int(g), events=120) for g in GAME_IDS], ignore_index=True)
+    )
+    pd.testing.assert_frame_equal(_sorted_by_game(dataset), _sorted_by_game(expected))
+    assert endpoint.calls["005"] == 3
+    assert endpoint.max_in_flight <= (1 if mode == "serial" else 4)
+
+
+def test_batch_fetch_threads_overlap_latency():
+    endpoint = FakeStatsEndpoint(latency=0.05)
+
+    start = time.perf_counter()
+    batch_fetch(GAME_IDS, show_progress=False, mode="threads", concurrency=8, fetcher=endpoint)
+    elapsed = time.perf_counter() - start
+
+    assert endpoint.max_in_flight > 1
+    assert elapsed < 0.05 * len(GAME_IDS)
+
+
+@pytest.mark.parametrize("mode", ["threads", "asyncio"])
+def test_batch_fetch_respects_rate_limit(mode):
+    endpoint = FakeStatsEndpoint()
+
+    start = time.perf_counter()
+    batch_fetch(GAME_IDS, show_progress=False, mode=mode, concurrency=8, rate_limit=50, fetcher=endpoint)
+    elapsed = time.perf_counter() - start
+
+    # One token up front, then one every 20ms for the remaining games.
+    assert elapsed >= 0.02 * (len(GAME_IDS) - 1) * 0.9
+
+
+def test_batch_fetch_skips_games_that_keep_failing(caplog, tmp_path):
+    from nba_probs import metrics
+
+    endpoint = FakeStatsEndpoint(failures={"001": 10})
+
+    with metrics.exporting(tmp_path / "metrics.json") as registry:
+        registry.reset()
+        dataset = batch_fetch(
+            GAME_IDS[:3],
+            show_progress=False,
+            mode="threads",
+            retries=1,
+            base_delay=0.001,
+            fetcher=endpoint,
+        )
+        games = registry.counter("nba_games_total", status="failed").value, registry.counter(
+            "nba_games_total", status="ok"
+        ).value
+        attempts = registry.counter("nba_fetch_attempts_total").value
+        summarized = registry.histogram("nba_summarize_seconds").count
+
+    assert set(dataset["game_id"]) == {"000", "002"}
+    assert endpoint.calls["001"] == 2
+    assert "Failed to process game 001" in caplog.text
+    assert games == (1, 2)
+    assert attempts == 4
+    assert summarized == 2
+
+
+def test_batch_fetch_rejects_unknown_mode():
+    with pytest.raises(ValueError):
+        batch_fetch(GAME_IDS, show_progress=False, mode="processes", fetcher=FakeStatsEndpoint())
+
+
+def test_iter_batch_fetch_is_lazy():
+    endpoint = FakeStatsEndpoint()
+
+    frames = iter_batch_fetch(GAME_IDS, show_progress=False, fetcher=endpoint)
+    first = next(frames)
+
+    assert sum(endpoint.calls.values()) == 1
+    assert first["game_id"].iloc[0] == GAME_IDS[0]
+    frames.close()
+
+
+@pytest.mark.parametrize("mode", ["threads", "asyncio"])
+def test_iter_batch_fetch_bounds_work_ahead_of_consumer(mode):
+    endpoint = FakeStatsEndpoint()
+    ids = [f"{i:03d}" for i in range(40)]
+
+    frames = iter_batch_fetch(ids, show_progress=False, mode=mode, concurrency=2, fetcher=endpoint)
+    next(frames)
+    time.sleep(0.1)
+
+    # Only a small window of games may be fetched while the consumer stalls.
+    assert sum(endpoint.calls.values()) < 10
+    assert len(list(frames)) == len(ids) - 1
+
+
+@pytest.mark.parametrize("processes", [0, 1])
+@pytest.mark.parametrize("mode", ["serial", "threads", "asyncio"])
+def test_iter_batch_fetch_early_close_stops_workers(mode, processes):
+    endpoint = FakeStatsEndpoint(latency=0.01)
+    ids = [f"{i:03d}" for i in range(40)]
+    before = set(threading.enumerate())
+
+    frames = iter_batch_fetch(ids, show_progress=False, mode=mode, concurrency=2, fetcher=endpoint, processes=processes)
+    next(frames)
+    frames.close()
+
+    deadline = time.monotonic() + 5
+    while set(threading.enumerate()) - before and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not set(threading.enumerate()) - before
+    calls = sum(endpoint.calls.values())
+    time.sleep(0.05)
+    assert sum(endpoint.calls.values()) == calls < len(ids)
+
+
+@pytest.mark.parametrize("mode", ["serial", "threads", "asyncio"])
+def test_batch_fetch_process_pool_matches_in_thread_summaries(mode):
+    endpoint = FakeStatsEndpoint(failures={"002": 1})
+    fetcher = lambda game_id: pd.DataFrame() if game_id == "006" else endpoint(game_id)  # noqa: E731
+
+    serial = batch_fetch(GAME_IDS, show_progress=False, base_delay=0.001, fetcher=fetcher)
+    pooled = batch_fetch(
+        GAME_IDS, show_progress=False, mode=mode, concurrency=4, base_delay=0.001, fetcher=fetcher, processes=2
+    )
+
+    # Game 006 fails to summarize inside a worker and is skipped like any other failure.
+    assert "006" not in set(pooled["game_id"])
+    pd.testing.assert_frame_equal(_sorted_by_game(pooled), _sorted_by_game(serial))
+
+
+def test_offline_rebuild_on_process_pool_matches_serial(tmp_path):
+    from nba_probs.raw_cache import RawPlayByPlayCache
+
+    cache = RawPlayByPlayCache(tmp_path / "play_by_play")
+    for offset, game_id in enumerate(GAME_IDS):
+        cache.put(game_id, synthetic_play_by_play(game_id, seed=offset, overtime_periods=offset % 2))
+
+    serial = batch_fetch(GAME_IDS, show_progress=False, cache=cache, offline=True)
+    pooled = batch_fetch(GAME_IDS, show_progress=False, mode="threads", cache=cache, offline=True, processes=2)
+
+    pd.testing.assert_frame_equal(_sorted_by_game(pooled), _sorted_by_game(serial))
+
+
+def test_process_pool_applies_backpressure_to_io_stage():
+    endpoint = FakeStatsEndpoint()
+    ids = [f"{i:03d}" for i in range(40)]
+
+    frames = iter_batch_fetch(ids, show_progress=False, mode="threads", concurrency=2, fetcher=endpoint, processes=1)
+    next(frames)
+    time.sleep(0.2)
+
+    # Two games queued for the pool plus the I/O stage's own small window.
+    assert sum(endpoint.calls.values()) < 12
+    frames.close()
+
+
+def _feed_in_chunks(plays, sizes):
+    summarizer = IncrementalMinuteSummarizer()
+    emitted = []
+    start = 0
+    for size in sizes:
+        emitted.extend(summarizer.feed(plays.iloc[start:start + size]))
+        start += size
+        if start >= len(plays):
+            break
+    emitted.extend(summarizer.feed(plays.iloc[start:]))
+    emitted.extend(summarizer.flush())
+    return summarizer, emitted
+
+
+@pytest.mark.parametrize("chunk", [1, 7, 64])
+def test_incremental_summarizer_matches_batch(chunk):
+    plays = synthetic_season([f"00223{index:05d}" for index in range(1, 6)], events=300)
+    plays = plays.sort_values(["periodNumber", "actionNumber"], kind="stable").reset_index(drop=True)
+
+    summarizer, emitted = _feed_in_chunks(plays, [chunk] * len(plays))
+
+    expected = summarize_games(plays)
+    pd.testing.assert_frame_equal(summarizer.to_frame(), expected)
+    emitted_keys = [(minute.game_id, minute.minute_index) for minute in emitted]
+    assert sorted(emitted_keys) == sorted(zip(expected["game_id"], expected["minute_index"]))
+    assert all(minute.home_win is None for minute in emitted)
+
+
+def test_incremental_summarizer_resolves_period_boundary_minute():
+    plays = synthetic_play_by_play(events=200, overtime_periods=1)
+    summarizer = IncrementalMinuteSummarizer()
+    end_of_first = plays.index[(plays["periodNumber"] == 1)][-1]
+
+    finalized = summarizer.feed(plays.loc[:end_of_first])
+    assert 12 not in {minute.minute_index for minute in finalized}  # Q2 may still claim minute 12
+
+    # The 12:00 event of Q2 lands in minute 12 as well and replaces the Q1 buzzer.
+    assert summarizer.feed(plays.loc[end_of_first + 1:end_of_first + 1]) == []
+    assert [(minute.minute_index, minute.period) for minute in summarizer.flush()] == [(12, 2)]
+    summarizer.feed(plays.loc[end_of_first + 2:])
+
+    pd.testing.assert_frame_equal(summarizer.to_frame(), summarize_game_by_minute_fast(plays))
+    row = summarizer.to_frame().set_index("minute_index").loc[12]
+    assert row["period"] == 2
+
+
+def test_incremental_summarizer_random_chunks_match_reference():
+    import random
+
+    plays = synthetic_play_by_play(events=400, overtime_periods=2, seed=5)
+    rng = random.Random(1)
+
+    summarizer, _ = _feed_in_chunks(plays, [rng.randint(0, 40) for _ in range(len(plays))])
+
+    pd.testing.assert_frame_equal(summarizer.to_frame(), summarize_game_by_minute_fast(plays))
+    assert summarizer.feed(plays.iloc[:0]) == []
@@ -0,0 +1,143 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+
+from nba_probs.data_pipeline import summarize_games
+from nba_probs.dataset import MinuteDataset, season_from_date, season_from_game_id
+from nba_probs.synthetic import synthetic_play_by_play
+
+
+def _minutes(game_id: str, game_date: str, seed: int = 0) -> pd.DataFrame:
+    plays = synthetic_play_by_play(game_id, seed=seed, events=120, game_date=game_date)
+    return summarize_games(plays)
+
+
+def _files(root):
+    return sorted(path.relative_to(root).as_posix() for path in root.rglob("*.parquet"))
+
+
+def test_season_helpers():
+    assert season_from_game_id("0022300001") == "2023-24"
+    assert season_from_game_id("0029900001") == "2099-00"
+    assert season_from_game_id("abc") is None
+    assert season_from_date("2024-01-15") == "2023-24"
+    assert season_from_date("2023-10-24") == "2023-24"
+    assert season_from_date(None) is None
+
+
+def test_write_creates_hive_partitions_and_catalog(tmp_path):
+    dataset = MinuteDataset(tmp_path)
+    frame = pd.concat(
+        [_minutes("0022300001", "2023-10-24"), _minutes("0022300002", "2023-10-25", seed=1)],
+        ignore_index=True,
+    )
+
+    touched = dataset.write(frame)
+
+    assert touched == ["season=2023-24/date=2023-10-24", "season=2023-24/date=2023-10-25"]
+    assert dataset.game_ids() == ["0022300001", "0022300002"]
+    assert MinuteDataset(tmp_path).catalog()["0022300001"].rows == len(_minutes("0022300001", "2023-10-24"))
+
+
+def test_append_only_touches_new_partitions(tmp_path):
+    dataset = MinuteDataset(tmp_path)
+    dataset.write(_minutes("0022300001", "2023-10-24"), mode="append")
+    before = _files(tmp_path)
+
+    dataset.write(_minutes("0022300002", "2023-10-25"), mode="append")
+    after = _files(tmp_path)
+
+    assert set(before) <= set(after)
+    assert [name for name in after if name not in before][0].startswith("season=2023-24/date=2023-10-25/")
+
+
+def test_append_rejects_existing_games(tmp_path):
+    dataset = MinuteDataset(tmp_path)
+    dataset.write(_minutes("0022300001", "2023-10-24"))
+
+    with pytest.raises(ValueError):
+        dataset.write(_minutes("0022300001", "2023-10-24"), mode="append")
+
+
+def test_upsert_replaces_game_rows(tmp_path):
+    dataset = MinuteDataset(tmp_path)
+    dataset.write(pd.concat([_minutes("0022300001", "2023-10-24"), _minutes("0022300003", "2023-10-24", seed=3)]))
+
+    replacement = _minutes("0022300001", "2023-10-24", seed=9)
+    dataset.write(replacement, mode="upsert")
+
+    stored = dataset.read(game_ids=["0022300001"]).sort_values("minute_index").reset_index(drop=True)
+    assert stored["home_team_score"].tolist() == replacement["home_team_score"].tolist()
+    assert len(dataset.read()) == len(replacement) + len(_minutes("0022300003", "2023-10-24", seed=3))
+
+
+def test_interrupted_upsert_keeps_previous_rows_and_ignores_orphans(tmp_path, monkeypatch):
+    original = pd.concat([_minutes("0022300001", "2023-10-24"), _minutes("0022300003", "2023-10-24", seed=3)])
+    MinuteDataset(tmp_path).write(original)
+    files_before = _files(tmp_path)
+
+    dataset = MinuteDataset(tmp_path)
+
+    def crash():
+        raise RuntimeError("killed before the catalog was saved")
+
+    monkeypatch.setattr(dataset, "_save_catalog", crash)
+    with pytest.raises(RuntimeError):
+        dataset.write(_minutes("0022300001", "2023-10-24", seed=9), mode="upsert")
+
+    assert set(files_before) < set(_files(tmp_path))
+    reopened = MinuteDataset(tmp_path)
+    assert len(reopened.read()) == len(original)
+    assert sum(batch.num_rows for batch in reopened.iter_batches()) == len(original)
+    stored = reopened.read(game_ids=["0022300001"]).sort_values("minute_index")
+    assert stored["home_team_score"].tolist() == _minutes("0022300001", "2023-10-24")["home_team_score"].tolist()
+
+
+def test_read_prunes_by_date_range(tmp_path):
+    dataset = MinuteDataset(tmp_path)
+    for offset, day in enumerate(["2023-10-24", "2023-10-25", "2023-10-26"]):
+        dataset.write(_minutes(f"002230000{offset}", day, seed=offset))
+
+    subset = dataset.read(start="2023-10-25", end="2023-10-26")
+
+    assert sorted(subset["game_id"].unique()) == ["0022300001", "0022300002"]
+    assert "date" not in subset.columns
+
+
+def test_games_without_dates_use_unknown_partition(tmp_path):
+    dataset = MinuteDataset(tmp_path)
+    frame = _minutes("custom-id", "2023-10-24").assign(game_date=None)
+
+    assert dataset.write(frame) == ["season=unknown/date=unknown"]
+    assert dataset.read(start="2023-01-01").empty
+    assert len(dataset.read()) == len(frame)
+
+
+def test_compact_merges_partition_files(tmp_path):
+    dataset = MinuteDataset(tmp_path)
+    dataset.write(_minutes("0022300001", "2023-10-24"))
+    dataset.write(_minutes("0022300002", "2023-10-24", seed=2))
+    partition = "season=2023-24/date=2023-10-24"
+    total = len(dataset.read())
+
+    dataset.compact(partition)
+
+    assert len(_files(tmp_path)) == 1
+    assert len(dataset.read()) == total
+
+
+def test_iter_batches_streams_bounded_batches(tmp_path):
+    dataset = MinuteDataset(tmp_path)
+    frame = pd.concat(
+        [_minutes("0022300001", "2023-10-24"), _minutes("0022300002", "2023-10-25", seed=1)],
+        ignore_index=True,
+    )
+    dataset.write(frame)
+
+    batches = list(dataset.iter_batches(columns=["game_id", "score_margin"], batch_size=10, end="2023-10-24"))
+
+    assert all(batch.num_rows <= 10 for batch in batches)
+    assert batches[0].schema.names == ["game_id", "score_margin"]
+    assert sum(batch.num_rows for batch in batches) == dataset.catalog()["0022300001"].rows
+    assert list(MinuteDataset(tmp_path / "empty").iter_batches()) == []
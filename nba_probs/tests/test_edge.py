@@ -0,0 +1,59 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("requests")
+
+from nba_probs.data_pipeline import summarize_games
+from nba_probs.edge import EdgeEngine, MarketLink
+from nba_probs.modeling import LogisticScorer
+from nba_probs.polymarket import Orderbook
+from nba_probs.synthetic import synthetic_live_stream, synthetic_season
+
+SCORER = LogisticScorer(margin_coef=0.12, seconds_coef=0.0, intercept=0.05)
+
+
+def test_replay_matches_brute_force_recompute():
+    minutes = summarize_games(synthetic_season([f"00223{index:05d}" for index in range(1, 25)], events=150))
+    links, events = synthetic_live_stream(minutes, seed=3)
+    engine = EdgeEngine(SCORER, links)
+
+    engine.replay(events)
+
+    states, prices = {}, {}
+    for event in events:
+        if isinstance(event, Orderbook):
+            prices[event.market_id] = event.implied_yes_probability
+        else:
+            states[event.game_id] = (event.score_margin, event.seconds_remaining)
+    for link in links:
+        home = SCORER.predict_one(*states[link.game_id])
+        edge = engine.edge(link.market_id)
+        assert edge.model_probability == pytest.approx(home if link.yes_is_home else 1 - home)
+        assert edge.market_probability == prices[link.market_id]
+    assert engine.recomputed < len(events) * 2
+
+
+def test_only_markets_with_changed_inputs_are_recomputed():
+    engine = EdgeEngine(
+        SCORER,
+        [MarketLink("a-home", "A"), MarketLink("a-away", "A", yes_is_home=False), MarketLink("b", "B")],
+    )
+    assert engine.update_state("A", 5, 600) == []  # no prices yet
+    engine.update_orderbook(Orderbook("a-home", 0.6, 0.4))
+    engine.update_orderbook(Orderbook("a-away", 0.4, 0.6))
+    engine.update_orderbook(Orderbook("b", 0.5, 0.5))
+    assert engine.recomputed == 2
+
+    assert engine.update_orderbook(Orderbook("a-home", 0.6, 0.4)) == []
+    assert engine.update_state("A", 5, 600) == []
+    assert engine.recomputed == 2
+
+    changed = engine.update_state("A", 8, 540)
+    assert sorted(edge.market_id for edge in changed) == ["a-away", "a-home"]
+    assert changed[0].model_probability + changed[1].model_probability == pytest.approx(1.0)
+    assert engine.edge("b") is None
+
+    engine.update_state("B", -3, 100)
+    sizes = [abs(edge.edge) for edge in engine.opportunities(0.0)]
+    assert len(sizes) == 3 and sizes == sorted(sizes, reverse=True)
+    assert all(abs(edge.edge) >= 0.05 for edge in engine.opportunities(0.05))
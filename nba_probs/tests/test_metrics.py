@@ -0,0 +1,89 @@
+import json
+
+import pytest
+
+from nba_probs.metrics import MetricsRegistry
+
+
+def test_disabled_registry_records_nothing():
+    registry = MetricsRegistry()
+
+    registry.inc("games_total")
+    registry.observe("fetch_seconds", 0.2)
+    with registry.timer("summarize_seconds"):
+        pass
+
+    assert registry.snapshot() == {}
+    assert registry.to_prometheus() == ""
+
+
+def test_counters_and_histograms_are_kept_per_label_set():
+    registry = MetricsRegistry(enabled=True)
+
+    registry.inc("games_total", status="ok")
+    registry.inc("games_total", 2, status="ok")
+    registry.inc("games_total", status="failed")
+    for value in (0.003, 0.02, 40.0):
+        registry.observe("fetch_seconds", value)
+    with registry.timer("summarize_seconds"):
+        pass
+
+    assert registry.counter("games_total", status="ok").value == 3
+    assert registry.counter("games_total", status="failed").value == 1
+    fetch = registry.histogram("fetch_seconds")
+    assert fetch.count == 3
+    assert fetch.sum == pytest.approx(40.023)
+    assert dict(fetch.cumulative())[0.005] == 1
+    assert fetch.cumulative()[-1] == (float("inf"), 3)
+    assert registry.histogram("summarize_seconds").count == 1
+
+    with pytest.raises(ValueError):
+        registry.observe("games_total", 1.0)
+
+
+def test_shortcut_labels_may_share_parameter_names():
+    registry = MetricsRegistry(enabled=True)
+
+    registry.inc("requests_total", help="yes")
+    registry.observe("latency_seconds", 0.2, buckets="default")
+    with registry.timer("latency_seconds", buckets="default"):
+        pass
+
+    snapshot = registry.snapshot()
+    assert snapshot["requests_total"]["help"] == ""
+    assert snapshot["requests_total"]["series"] == [{"labels": {"help": "yes"}, "value": 1.0}]
+    assert snapshot["latency_seconds"]["series"][0]["labels"] == {"buckets": "default"}
+    assert snapshot["latency_seconds"]["series"][0]["count"] == 2
+
+
+def test_prometheus_text_and_json_exports(tmp_path):
+    registry = MetricsRegistry(enabled=True)
+    registry.counter("requests_total", "Requests sent", endpoint="/markets/{id}", status=200).inc()
+    registry.histogram("request_seconds", buckets=(0.1, 1.0)).observe(0.5)
+
+    text = registry.write(tmp_path / "metrics.prom").read_text()
+    assert "# HELP requests_total Requests sent\n# TYPE requests_total counter\n" in text
+    assert 'requests_total{endpoint="/markets/{id}",status="200"} 1.0' in text
+    assert 'request_seconds_bucket{le="0.1"} 0' in text
+    assert 'request_seconds_bucket{le="1.0"} 1' in text
+    assert 'request_seconds_bucket{le="+Inf"} 1' in text
+    assert "request_seconds_count 1" in text
+
+    payload = json.loads(registry.write(tmp_path / "metrics.json").read_text())
+    assert payload["requests_total"]["series"] == [
+        {"labels": {"endpoint": "/markets/{id}", "status": "200"}, "value": 1.0}
+    ]
+    assert payload["request_seconds"]["series"][0]["mean"] == 0.5
+
+
+def test_exporting_restores_the_previous_state(tmp_path):
+    from nba_probs import metrics
+
+    assert not metrics.REGISTRY.enabled
+    with metrics.exporting(tmp_path / "run.json") as registry:
+        registry.reset()
+        metrics.inc("runs_total")
+    metrics.inc("runs_total")
+
+    assert not metrics.REGISTRY.enabled
+    assert json.loads((tmp_path / "run.json").read_text())["runs_total"]["series"][0]["value"] == 1.0
@@ -1,3 +1,8 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 
 np = pytest.importorskip("numpy")
@@ -5,7 +10,17 @@ pd = pytest.importorskip("pandas")
 pytest.importorskip("sklearn")
 pytest.importorskip("joblib")
 
-from nba_probs.modeling import load_model, predict_win_probability, train_baseline_model
+from nba_probs import modeling
+from nba_probs.modeling import (
+    LogisticScorer,
+    WinProbabilityGrid,
+    load_model,
+    predict_win_probability,
+    save_model,
+    train_baseline_model,
+    train_grouped_cv_model,
+    train_streaming_model,
+)
 from sklearn.linear_model import LogisticRegression
 
 
@@ -47,3 +62,257 @@ def test_predict_win_probability_in_range():
     )
 
     assert 0.0 <= prob <= 1.0
+
+
+def test_logistic_scorer_matches_predict_proba():
+    artifacts = train_baseline_model(sample_training_data(), random_state=0)
+    scorer = artifacts.scorer()
+
+    rng = np.random.default_rng(0)
+    margins = rng.integers(-40, 40, size=5000)
+    seconds = rng.integers(0, 2880, size=5000)
+    features = pd.DataFrame({"score_margin": margins, "seconds_remaining": seconds})
+
+    expected = artifacts.model.predict_proba(features)[:, 1]
+    np.testing.assert_allclose(scorer.predict(margins, seconds), expected, rtol=1e-12)
+    np.testing.assert_allclose(scorer.predict_proba(features.to_numpy())[:, 1], expected, rtol=1e-12)
+
+    for margin, remaining, prob in zip(margins[:50], seconds[:50], expected[:50]):
+        assert scorer.predict_one(margin, remaining) == pytest.approx(prob, rel=1e-12)
+        assert predict_win_probability(
+            artifacts.model, score_margin=margin, seconds_remaining=remaining
+        ) == pytest.approx(prob, rel=1e-9)
+
+
+def test_logistic_scorer_reuses_output_buffer_and_saturates():
+    scorer = LogisticScorer(margin_coef=1.0, seconds_coef=0.0, intercept=0.0)
+    out = np.empty(3)
+
+    result = scorer.predict(np.array([-1000, 0, 1000]), np.zeros(3), out=out)
+
+    assert result is out
+    np.testing.assert_allclose(result, [0.0, 0.5, 1.0])
+    assert scorer.predict_one(-1000, 0) == 0.0
+    assert scorer.predict_one(1000, 0) == 1.0
+
+
+def test_logistic_scorer_accepts_scalars_and_scores_without_allocating():
+    import tracemalloc
+
+    scorer = LogisticScorer(margin_coef=0.1, seconds_coef=-0.001, intercept=0.05)
+    assert float(scorer.predict(3, 100)) == pytest.approx(scorer.predict_one(3, 100), rel=1e-12)
+
+    margins = np.linspace(-30.0, 30.0, 100_000)
+    seconds = np.linspace(0.0, 2880.0, 100_000)
+    out = np.empty_like(margins)
+    scorer.predict(margins, seconds, out=out)
+
+    tracemalloc.start()
+    try:
+        scorer.predict(margins, seconds, out=out)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < out.nbytes // 10
+    np.testing.assert_allclose(out[:5], [scorer.predict_one(m, s) for m, s in zip(margins[:5], seconds[:5])], rtol=1e-12)
+
+
+def test_win_probability_grid_matches_scorer_on_grid_points():
+    scorer = train_baseline_model(sample_training_data(), random_state=0).scorer()
+    grid = WinProbabilityGrid.from_scorer(scorer, margin_range=(-20, 20), max_seconds=600)
+
+    for margin, seconds in [(-20, 0), (0, 300), (7, 599), (20, 600)]:
+        assert grid.lookup(margin, seconds) == pytest.approx(scorer.predict_one(margin, seconds), rel=1e-12)
+
+
+def test_win_probability_grid_interpolates_and_falls_back():
+    scorer = train_baseline_model(sample_training_data(), random_state=0).scorer()
+    grid = WinProbabilityGrid.from_scorer(scorer, margin_range=(-20, 20), max_seconds=600)
+
+    midpoint = grid.lookup(3.5, 120.5)
+    corners = [scorer.predict_one(m, s) for m in (3, 4) for s in (120, 121)]
+    assert midpoint == pytest.approx(sum(corners) / 4)
+
+    assert grid.lookup(45, 2000) == pytest.approx(scorer.predict_one(45, 2000))
+    np.testing.assert_allclose(
+        grid.lookup_many([-30, 0, 30], [100, 100, 900]),
+        scorer.predict(np.array([-30, 0, 30]), np.array([100, 100, 900])),
+    )
+
+
+def test_grid_is_saved_and_memory_mapped(tmp_path):
+    artifacts = train_baseline_model(sample_training_data(), random_state=0)
+    model_path = tmp_path / "model.joblib"
+
+    artifacts.save(model_path, grid=True)
+    loaded = load_model(model_path)
+
+    assert (tmp_path / "model.grid.npy").exists()
+    assert isinstance(loaded.grid.values, np.memmap)
+    assert loaded.grid.lookup(5, 300) == pytest.approx(artifacts.scorer().predict_one(5, 300))
+
+    plain_path = tmp_path / "plain.joblib"
+    train_baseline_model(sample_training_data(), random_state=0).save(plain_path)
+    assert load_model(plain_path).grid is None
+
+
+def test_lightweight_artifacts_round_trip(tmp_path):
+    artifacts = train_baseline_model(sample_training_data(), random_state=0)
+    path = tmp_path / "model.json"
+
+    artifacts.save(path, grid=True)
+    loaded = load_model(path)
+
+    assert isinstance(loaded.model, LogisticScorer)
+    assert loaded.features == artifacts.features
+    assert np.isclose(loaded.brier, artifacts.brier)
+    assert loaded.scorer().predict_one(4, 600) == pytest.approx(artifacts.scorer().predict_one(4, 600))
+    assert predict_win_probability(loaded.model, score_margin=4, seconds_remaining=600) == pytest.approx(
+        artifacts.scorer().predict_one(4, 600)
+    )
+    assert isinstance(loaded.grid.values, np.memmap)
+
+
+def test_lightweight_load_does_not_import_sklearn(tmp_path):
+    path = tmp_path / "model.json"
+    train_baseline_model(sample_training_data(), random_state=0).save(path)
+
+    script = (
+        "import sys\n"
+        "from pathlib import Path\n"
+        "from nba_probs.modeling import load_model\n"
+        f"artifacts = load_model(Path({str(path)!r}))\n"
+        "print(artifacts.scorer().predict_one(3, 100))\n"
+        "assert 'sklearn' not in sys.modules and 'joblib' not in sys.modules\n"
+    )
+    env = {**os.environ, "PYTHONPATH": str(Path(__file__).resolve().parents[1] / "src")}
+    subprocess.run([sys.executable, "-c", script], check=True, env=env, capture_output=True)
+
+
+def test_save_model_writes_both_formats_and_loads_lightweight_on_request(monkeypatch, dummy_settings):
+    monkeypatch.setattr(modeling, "get_settings", lambda: dummy_settings)
+    artifacts = train_baseline_model(sample_training_data(), random_state=0)
+
+    path = save_model(artifacts)
+
+    assert path.suffix == ".joblib"
+    assert path.with_suffix(".json").exists()
+    assert isinstance(load_model().model, LogisticRegression)
+    assert isinstance(load_model(path).model, LogisticRegression)
+    assert isinstance(load_model(lightweight=True).model, LogisticScorer)
+    assert isinstance(load_model(path, lightweight=True).model, LogisticScorer)
+    assert isinstance(load_model(path.with_suffix(".json")).model, LogisticScorer)
+
+
+def _grouped_training_data() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    frames = []
+    for game in range(24):
+        strength = rng.normal(0, 6)
+        seconds = np.arange(2880, -1, -60)
+        margin = np.round(strength * (1 - seconds / 2880) + rng.normal(0, 3, size=len(seconds)))
+        frames.append(
+            pd.DataFrame(
+                {
+                    "game_id": f"g{game:02d}",
+                    "score_margin": margin,
+                    "seconds_remaining": seconds,
+                    "home_win": int(margin[-1] > 0 or (margin[-1] == 0 and strength > 0)),
+                }
+            )
+        )
+    return pd.concat(frames, ignore_index=True)
+
+
+def test_train_grouped_cv_model_reports_fold_metrics(tmp_path):
+    data = _grouped_training_data()
+
+    artifacts = train_grouped_cv_model(data, n_splits=4, c_grid=(0.1, 1.0), n_jobs=2)
+
+    assert len(artifacts.fold_metrics) == 8
+    assert artifacts.regularization_c in (0.1, 1.0)
+    assert artifacts.train_rows == len(data)
+    best = [m for m in artifacts.fold_metrics if m.regularization_c == artifacts.regularization_c]
+    assert sum(m.test_rows for m in best) == len(data)
+    assert artifacts.brier == pytest.approx(np.mean([m.brier for m in best]))
+    assert all(0 <= m.brier <= 1 for m in artifacts.fold_metrics)
+
+    for suffix in (".joblib", ".json"):
+        path = tmp_path / f"cv{suffix}"
+        artifacts.save(path)
+        loaded = load_model(path)
+        assert loaded.fold_metrics == artifacts.fold_metrics
+        assert loaded.regularization_c == artifacts.regularization_c
+
+
+def test_train_grouped_cv_model_is_deterministic_across_workers():
+    data = _grouped_training_data()
+
+    serial = train_grouped_cv_model(data, n_splits=3, c_grid=(1.0,), n_jobs=1)
+    parallel = train_grouped_cv_model(data, n_splits=3, c_grid=(1.0,), n_jobs=3)
+
+    assert serial.fold_metrics == parallel.fold_metrics
+
+
+def test_train_grouped_cv_model_requires_enough_games():
+    data = _grouped_training_data()
+    with pytest.raises(ValueError):
+        train_grouped_cv_model(data[data["game_id"].isin(["g00", "g01"])], n_splits=3)
+
+
+def test_train_streaming_model_matches_in_memory_fit(tmp_path):
+    pytest.importorskip("pyarrow")
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.metrics import brier_score_loss, roc_auc_score
+
+    from nba_probs.data_pipeline import summarize_games
+    from nba_probs.dataset import MinuteDataset
+    from nba_probs.synthetic import synthetic_season
+
+    game_ids = [f"00223{index:05d}" for index in range(1, 41)]
+    minutes = summarize_games(synthetic_season(game_ids, events=150))
+    dataset = MinuteDataset(tmp_path / "minutes")
+    dataset.write(minutes)
+
+    artifacts = train_streaming_model(dataset, batch_size=256, test_fraction=0.25)
+
+    holdout = modeling._holdout_mask(minutes["game_id"].astype(str), 0.25)
+    X = minutes[list(modeling.FEATURES)].to_numpy(dtype=float)
+    y = minutes["home_win"].to_numpy()
+    reference = LogisticRegression(max_iter=1000, tol=1e-10).fit(X[~holdout], y[~holdout])
+    prob = reference.predict_proba(X[holdout])[:, 1]
+
+    assert artifacts.train_rows == int((~holdout).sum())
+    assert artifacts.test_rows == int(holdout.sum())
+    np.testing.assert_allclose(artifacts.scorer().coef_, reference.coef_, rtol=1e-3)
+    assert artifacts.scorer().intercept == pytest.approx(reference.intercept_[0], rel=1e-3, abs=1e-4)
+    assert artifacts.brier == pytest.approx(brier_score_loss(y[holdout], prob), rel=1e-4)
+    assert artifacts.roc_auc == pytest.approx(roc_auc_score(y[holdout], prob), abs=2e-3)
+
+    path = tmp_path / "streaming.json"
+    artifacts.save(path)
+    loaded = load_model(path)
+    assert loaded.scorer() == artifacts.scorer()
+    assert loaded.train_rows == artifacts.train_rows
+
+
+def test_train_streaming_model_reads_parquet_paths(tmp_path):
+    pytest.importorskip("pyarrow")
+    from nba_probs.data_pipeline import summarize_games
+    from nba_probs.synthetic import synthetic_season
+
+    minutes = summarize_games(synthetic_season([f"00223{index:05d}" for index in range(1, 21)], events=120))
+    path = tmp_path / "minutes.parquet"
+    minutes.to_parquet(path, row_group_size=100)
+
+    from_path = train_streaming_model(path, batch_size=64)
+    from_frame = train_streaming_model(lambda: _record_batches(minutes))
+
+    np.testing.assert_allclose(from_path.scorer().coef_, from_frame.scorer().coef_)
+    assert from_path.brier == pytest.approx(from_frame.brier)
+
+
+def _record_batches(frame):
+    import pyarrow as pa
+
+    return pa.Table.from_pandas(frame, preserve_index=False).to_batches(max_chunksize=500)
@@ -15,3 +15,127 @@ def test_safe_float_handles_invalid_values():
     assert PolymarketClient._safe_float(None) is None
     assert PolymarketClient._safe_float("not-a-number") is None
     assert PolymarketClient._safe_float("0.55") == 0.55
+
+
+@pytest.fixture
+def client_factory(monkeypatch, dummy_settings, polymarket_stub):
+    from nba_probs import polymarket
+
+    monkeypatch.setattr(polymarket, "get_settings", lambda: dummy_settings)
+
+    def factory(**kwargs):
+        kwargs.setdefault("backoff_factor", 0)
+        return PolymarketClient(base_url=polymarket_stub.base_url, **kwargs)
+
+    return factory
+
+
+def test_fetch_orderbooks_runs_concurrently_on_a_bounded_pool(client_factory, polymarket_stub):
+    polymarket_stub.latency = 0.05
+    market_ids = [f"m{index}" for index in range(12)]
+    for index, market_id in enumerate(market_ids):
+        polymarket_stub.add_market(market_id, yes=f"0.{index + 10}")
+
+    with client_factory(pool_maxsize=4, max_workers=8) as client:
+        orderbooks = client.fetch_orderbooks(market_ids)
+        executor = client._executor
+        orderbooks = client.fetch_orderbooks(market_ids)
+        assert client._executor is executor  # one worker pool per client, not per call
+
+    assert client._executor is None
+    assert executor._shutdown
+
+    assert list(orderbooks) == market_ids
+    assert orderbooks["m3"].yes_price == 0.13
+    assert 1 < polymarket_stub.max_in_flight <= 4
+    assert len(polymarket_stub.client_ports) <= 4  # connections are kept alive and reused
+    assert client.latency_summary()["count"] == 24
+    assert client.latency_summary()["p50"] >= 0.05
+
+
+def test_request_retries_rate_limits_and_server_errors(client_factory, polymarket_stub):
+    polymarket_stub.add_market("abc", yes="0.55")
+    polymarket_stub.statuses["/markets/abc"] = [429, 503]
+
+    with client_factory(retries=3) as client:
+        orderbook = client.fetch_orderbook("abc")
+
+    assert orderbook.yes_price == 0.55
+    assert polymarket_stub.count("/markets/abc") == 3
+    assert client.metrics[-1].retries == 2
+    assert client.metrics[-1].status == 200
+
+
+def test_fetch_orderbooks_reports_or_skips_failures(client_factory, polymarket_stub):
+    import requests
+
+    polymarket_stub.add_market("good")
+    polymarket_stub.statuses["/markets/bad"] = [500, 500]
+
+    with client_factory(retries=1) as client:
+        with pytest.raises(requests.HTTPError):
+            client.fetch_orderbooks(["good", "bad"])
+        assert list(client.fetch_orderbooks(["good", "missing"], skip_errors=True)) == ["good"]
+
+
+def test_response_cache_serves_fresh_entries_and_revalidates_stale_ones(client_factory, polymarket_stub):
+    polymarket_stub.add_market("abc", question="Hawks vs Hornets")
+    now = [1000.0]
+
+    with client_factory(cache_ttls={"/markets": 30.0}) as client:
+        client.cache._clock = lambda: now[0]
+        assert [market.id for market in client.list_nba_markets()] == ["abc"]
+        client.list_nba_markets()
+        now[0] += 31
+        assert [market.question for market in client.list_nba_markets()] == ["Hawks vs Hornets"]
+
+        polymarket_stub.add_market("def")
+        now[0] += 31
+        assert [market.id for market in client.list_nba_markets()] == ["abc", "def"]
+
+    assert client.cache.stats() == {"hits": 1, "revalidations": 1, "misses": 2, "entries": 1}
+    assert polymarket_stub.count("/markets") == 3
+    assert polymarket_stub.requests[1][1]["If-None-Match"].startswith('"')
+
+
+def test_response_cache_persists_to_polymarket_dir(client_factory, polymarket_stub, dummy_settings):
+    polymarket_stub.add_market("abc")
+
+    with client_factory(persist_cache=True) as client:
+        client.fetch_orderbook("abc")
+    with client_factory(persist_cache=True) as client:
+        assert client.fetch_orderbook("abc").yes_price == 0.6
+
+    assert client.cache.stats()["revalidations"] == 1
+    assert list((dummy_settings.paths.polymarket_dir / "http_cache").glob("*.json"))
+
+
+def test_cache_can_be_disabled(client_factory, polymarket_stub):
+    polymarket_stub.add_market("abc")
+
+    with client_factory(cache=False) as client:
+        client.fetch_orderbook("abc")
+        client.fetch_orderbook("abc")
+
+    assert client.cache is None
+    assert all("If-None-Match" not in headers for _, headers in polymarket_stub.requests)
+
+
+def test_requests_and_cache_outcomes_are_exported_by_endpoint(client_factory, polymarket_stub, tmp_path):
+    from nba_probs import metrics
+
+    polymarket_stub.add_market("abc")
+    polymarket_stub.add_market("def")
+
+    with metrics.exporting(tmp_path / "polymarket.prom") as registry:
+        registry.reset()
+        with client_factory() as client:
+            client.fetch_orderbooks(["abc", "def"])
+            client.fetch_orderbook("abc")
+
+    text = (tmp_path / "polymarket.prom").read_text()
+    assert 'polymarket_request_seconds_count{endpoint="/markets/{id}"} 3' in text
+    assert 'polymarket_requests_total{endpoint="/markets/{id}",status="200"} 2.0' in text
+    assert 'polymarket_requests_total{endpoint="/markets/{id}",status="304"} 1.0' in text
+    assert 'polymarket_cache_total{outcome="revalidated"} 1.0' in text
+    assert 'polymarket_cache_total{outcome="miss"} 2.0' in text
@@ -0,0 +1,146 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+
+from nba_probs.data_pipeline import batch_fetch
+from nba_probs.raw_cache import RawPlayByPlayCache, is_game_finished
+from nba_probs.synthetic import synthetic_play_by_play
+
+
+def _finished_game(game_id: str) -> pd.DataFrame:
+    plays = synthetic_play_by_play(game_id, seed=1, events=120)
+    last = plays.index[-1]
+    plays.loc[last, "homeScore"] = plays.loc[last, "awayScore"] + 1
+    return plays
+
+
+def _live_game(game_id: str) -> pd.DataFrame:
+    plays = _finished_game(game_id)
+    return plays.loc[plays["periodNumber"] <= 2].reset_index(drop=True)
+
+
+class CountingFetcher:
+    def __init__(self, factory=_finished_game) -> None:
+        self.factory = factory
+        self.calls: list[str] = []
+
+    def __call__(self, game_id: str) -> pd.DataFrame:
+        self.calls.append(game_id)
+        return self.factory(game_id)
+
+
+def test_is_game_finished():
+    assert is_game_finished(_finished_game("001"))
+    assert not is_game_finished(_live_game("001"))
+
+    tied = _finished_game("001")
+    tied.loc[tied.index[-1], "homeScore"] = tied.loc[tied.index[-1], "awayScore"]
+    assert not is_game_finished(tied)
+
+
+def test_put_and_get_round_trip(tmp_path):
+    cache = RawPlayByPlayCache(tmp_path)
+    plays = _finished_game("001")
+
+    entry = cache.put("001", plays)
+
+    assert entry.finished
+    assert cache.is_finished("001")
+    pd.testing.assert_frame_equal(cache.get("001"), plays, check_dtype=False)
+    assert cache.get("missing") is None
+
+
+def test_objects_are_content_addressed(tmp_path):
+    cache = RawPlayByPlayCache(tmp_path)
+    plays = _finished_game("001")
+
+    first = cache.put("001", plays)
+    second = cache.put("001-copy", plays)
+
+    assert first.digest == second.digest
+    assert len(list((tmp_path / "objects").rglob("*.parquet"))) == 1
+    assert cache.total_bytes == first.size
+
+
+def test_manifest_survives_reload(tmp_path):
+    cache = RawPlayByPlayCache(tmp_path)
+    cache.put("001", _finished_game("001"))
+    cache.put("002", _live_game("002"))
+    cache.flush()
+
+    reloaded = RawPlayByPlayCache(tmp_path)
+
+    assert reloaded.game_ids() == ["001", "002"]
+    assert reloaded.is_finished("001")
+    assert not reloaded.is_finished("002")
+    assert reloaded.get("002", finished_only=True) is None
+
+
+def test_manifest_is_rewritten_every_flush_every_puts(tmp_path):
+    cache = RawPlayByPlayCache(tmp_path, flush_every=3)
+
+    for index in range(7):
+        cache.put(f"{index:03d}", _finished_game(f"{index:03d}"))
+        if index == 1:
+            assert not cache.manifest_path.exists()
+
+    assert RawPlayByPlayCache(tmp_path).game_ids() == [f"{index:03d}" for index in range(6)]
+    cache.flush()
+    assert len(RawPlayByPlayCache(tmp_path)) == 7
+
+
+def test_lru_eviction_keeps_recently_used_games(tmp_path):
+    cache = RawPlayByPlayCache(tmp_path)
+    for game_id in ("001", "002", "003"):
+        cache.put(game_id, synthetic_play_by_play(game_id, seed=int(game_id), events=120))
+    cache.get("001")
+
+    budget = cache.total_bytes - 1
+    evicted = cache.evict(budget)
+
+    assert evicted == ["002"]
+    assert cache.total_bytes <= budget
+    assert "001" in cache and "003" in cache
+
+
+def test_batch_fetch_never_refetches_finished_games(tmp_path):
+    cache = RawPlayByPlayCache(tmp_path)
+    fetcher = CountingFetcher()
+
+    first = batch_fetch(["001", "002"], show_progress=False, fetcher=fetcher, cache=cache)
+    second = batch_fetch(["001", "002"], show_progress=False, fetcher=fetcher, cache=cache)
+
+    assert sorted(fetcher.calls) == ["001", "002"]
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_batch_fetch_refetches_unfinished_games(tmp_path):
+    cache = RawPlayByPlayCache(tmp_path)
+    fetcher = CountingFetcher(_live_game)
+
+    batch_fetch(["001"], show_progress=False, fetcher=fetcher, cache=cache)
+    batch_fetch(["001"], show_progress=False, fetcher=fetcher, cache=cache)
+
+    assert fetcher.calls == ["001", "001"]
+
+
+@pytest.mark.parametrize("mode", ["serial", "threads", "asyncio"])
+def test_offline_rebuild_uses_no_network(tmp_path, mode):
+    cache = RawPlayByPlayCache(tmp_path)
+    cache.put("001", _finished_game("001"))
+    cache.put("002", _live_game("002"))
+
+    def no_network(game_id: str) -> pd.DataFrame:
+        raise AssertionError(f"unexpected fetch for {game_id}")
+
+    dataset = batch_fetch(
+        cache.game_ids(),
+        show_progress=False,
+        mode=mode,
+        fetcher=no_network,
+        cache=cache,
+        offline=True,
+    )
+
+    assert set(dataset["game_id"]) == {"001", "002"}
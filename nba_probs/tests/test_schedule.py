@@ -0,0 +1,88 @@
+import json
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from nba_probs import metrics
+from nba_probs.schedule import ScheduledGame, discover_game_ids, filter_games, parse_schedule, validate_season
+
+FIXTURE = Path(__file__).resolve().parent / "fixtures" / "schedule_2023-24.json"
+
+
+@pytest.fixture
+def payload():
+    return json.loads(FIXTURE.read_text())
+
+
+def test_parse_schedule_flattens_game_dates(payload):
+    games = parse_schedule(payload)
+
+    assert len(games) == 8
+    assert games[0] == ScheduledGame("0012300001", date(2023, 10, 5), "DAL", "MIN", 3)
+    assert [game.game_type for game in games] == [
+        "preseason", "regular", "regular", "regular", "regular", "cup", "play-in", "playoffs"
+    ]
+    assert games == sorted(games, key=lambda game: (game.game_date, game.game_id))
+
+
+def test_parse_schedule_falls_back_to_the_game_date_label():
+    payload = {"leagueSchedule": {"gameDates": [{"gameDate": "10/24/2023 00:00:00", "games": [{"gameId": "0022300061"}]}]}}
+
+    (game,) = parse_schedule(payload)
+
+    assert game.game_date == date(2023, 10, 24)
+    assert game.status == 0 and not game.is_final
+
+
+def test_filter_games_by_date_type_and_status(payload):
+    games = parse_schedule(payload) + [ScheduledGame("0022301230", date(2024, 4, 14), "NYK", "CHI", 1)]
+
+    assert [game.game_id for game in filter_games(games, start=date(2023, 10, 25), end=date(2024, 4, 16))] == [
+        "0022300063", "0022300064", "0052300101"
+    ]
+    assert "0022301230" not in [game.game_id for game in filter_games(games)]
+    assert "0022301230" in [game.game_id for game in filter_games(games, final_only=False)]
+    assert [game.game_id for game in filter_games(games, game_types=("cup",))] == ["0062300001"]
+
+
+def test_discover_game_ids_retries_the_single_schedule_call(payload):
+    calls = []
+
+    def flaky(season):
+        calls.append(season)
+        if len(calls) == 1:
+            raise ConnectionError("reset")
+        return payload
+
+    registry = metrics.enable()
+    registry.reset()
+    try:
+        game_ids = discover_game_ids("2023-24", retries=1, fetcher=flaky)
+        discovered = registry.snapshot()["nba_schedule_games_total"]["series"][0]["value"]
+    finally:
+        metrics.disable()
+        registry.reset()
+
+    assert calls == ["2023-24", "2023-24"]
+    assert game_ids == ["0022300061", "0022300062", "0022300063", "0022300064", "0052300101", "0042300101"]
+    assert discovered == 6
+
+
+def test_discover_game_ids_fails_fast_without_the_schedule_endpoint(monkeypatch):
+    monkeypatch.setitem(sys.modules, "nba_api.stats.endpoints", None)
+    calls = []
+    monkeypatch.setattr("nba_probs.schedule.fetch_schedule", calls.append)
+
+    with pytest.raises(ImportError, match="nba_api>=1.8"):
+        discover_game_ids("2023-24")
+    assert calls == []
+
+
+@pytest.mark.parametrize("season", ["2023", "2023-25", "23-24", "2023-2024"])
+def test_validate_season_rejects_malformed_labels(season):
+    with pytest.raises(ValueError):
+        validate_season(season)
+    with pytest.raises(ValueError):
+        discover_game_ids(season, fetcher=lambda season: {})
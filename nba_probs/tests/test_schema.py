@@ -0,0 +1,90 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from nba_probs.data_pipeline import summarize_games
+from nba_probs.schema import (
+    MINUTE_SCHEMA_VERSION,
+    SCHEMA_VERSION_KEY,
+    SchemaVersionError,
+    conform_minutes,
+    minute_schema,
+    read_minutes,
+    to_arrow_table,
+)
+from nba_probs.synthetic import synthetic_season
+
+
+@pytest.fixture(scope="module")
+def season_minutes() -> pd.DataFrame:
+    return summarize_games(synthetic_season([f"00223{i:05d}" for i in range(60)], events=300))
+
+
+def test_compact_dtypes_cut_memory(season_minutes):
+    before = season_minutes.memory_usage(deep=True).sum()
+    compact = conform_minutes(season_minutes)
+    after = compact.memory_usage(deep=True).sum()
+
+    assert after * 3 < before
+    assert compact["minute_index"].dtype == "int16"
+    assert compact["home_win"].dtype == "int8"
+    assert isinstance(compact["game_id"].dtype, pd.CategoricalDtype)
+    assert isinstance(compact["period"].dtype, pd.CategoricalDtype)
+
+
+def test_conform_preserves_values(season_minutes):
+    compact = conform_minutes(season_minutes)
+
+    for column in season_minutes.columns:
+        expected = season_minutes[column]
+        actual = compact[column]
+        if isinstance(actual.dtype, pd.CategoricalDtype):
+            actual = actual.astype(actual.cat.categories.dtype)
+        assert actual.astype(expected.dtype).tolist() == expected.tolist(), column
+
+
+def test_schema_is_versioned():
+    metadata = minute_schema().metadata
+    assert int(metadata[SCHEMA_VERSION_KEY]) == MINUTE_SCHEMA_VERSION
+
+
+def test_to_arrow_table_rejects_missing_columns(season_minutes):
+    with pytest.raises(ValueError):
+        to_arrow_table(season_minutes.drop(columns=["score_margin"]))
+
+
+def test_to_arrow_table_rejects_values_that_do_not_fit(season_minutes):
+    frame = season_minutes.head(1).assign(home_team_score=100_000)
+    with pytest.raises(pa.ArrowInvalid):
+        to_arrow_table(frame)
+
+
+def test_read_minutes_enforces_schema_on_legacy_files(tmp_path, season_minutes):
+    path = tmp_path / "legacy.parquet"
+    season_minutes.to_parquet(path, index=False)
+
+    loaded = read_minutes(path)
+
+    assert loaded["seconds_remaining"].dtype == "int16"
+    assert len(loaded) == len(season_minutes)
+
+
+def test_read_minutes_rejects_other_schema_versions(tmp_path, season_minutes):
+    table = to_arrow_table(season_minutes)
+    table = table.replace_schema_metadata({SCHEMA_VERSION_KEY: b"999"})
+    path = tmp_path / "future.parquet"
+    pq.write_table(table, path)
+
+    with pytest.raises(SchemaVersionError):
+        read_minutes(path)
+
+
+def test_compact_files_are_smaller_on_disk(tmp_path, season_minutes):
+    wide = tmp_path / "wide.parquet"
+    compact = tmp_path / "compact.parquet"
+    season_minutes.to_parquet(wide, index=False)
+    pq.write_table(to_arrow_table(season_minutes), compact)
+
+    assert compact.stat().st_size < wide.stat().st_size
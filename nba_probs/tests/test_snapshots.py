@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+
+from nba_probs.polymarket import Orderbook
+from nba_probs.snapshots import SnapshotStore, snapshot_record
+
+START = datetime(2024, 1, 15, 23, 50, tzinfo=timezone.utc)
+
+
+def _records(market_id: str, count: int, *, start: datetime = START, step: timedelta = timedelta(minutes=5)):
+    return [
+        snapshot_record(Orderbook(market_id, 0.5 + index / 100, 0.5 - index / 100), timestamp=start + index * step)
+        for index in range(count)
+    ]
+
+
+def test_append_partitions_by_market_and_day_and_reads_time_ranges(tmp_path):
+    store = SnapshotStore(tmp_path)
+    store.append(_records("abc", 6) + _records("x/y", 2))
+
+    assert store.markets() == ["abc", "x/y"]
+    assert sorted(path.name for path in (tmp_path / "market=abc").iterdir()) == ["date=2024-01-15", "date=2024-01-16"]
+
+    everything = store.read("abc")
+    assert len(everything) == 6
+    assert everything["timestamp"].is_monotonic_increasing
+
+    window = store.read("abc", start="2024-01-16T00:00:00+00:00", end=START + timedelta(minutes=20))
+    assert window["yes_price"].tolist() == [0.52, 0.53, 0.54]
+    assert len(store.read("x/y")) == 2
+    assert store.read("missing").empty
+
+
+def test_torn_last_line_is_skipped_and_repaired(tmp_path):
+    store = SnapshotStore(tmp_path)
+    store.append(_records("abc", 2, step=timedelta(seconds=1)))
+    segment = next(tmp_path.rglob("segment-*.jsonl"))
+    with segment.open("ab") as handle:
+        handle.write(b'{"market_id":"abc","timest')
+
+    assert len(store.read("abc")) == 2
+
+    store.append(_records("abc", 1, start=START + timedelta(seconds=5)))
+    assert len(store.read("abc")) == 3
+    assert segment.read_bytes().count(b"\n") == 3
+
+
+def test_segments_roll_over_and_compact_into_parquet(tmp_path):
+    store = SnapshotStore(tmp_path, max_segment_bytes=300)
+    for record in _records("abc", 12, step=timedelta(seconds=10)):
+        store.append([record])
+    partition = tmp_path / "market=abc" / "date=2024-01-15"
+    assert len(list(partition.glob("segment-*.jsonl"))) > 1
+    before = store.read("abc")
+
+    written = store.compact(before=START.date() + timedelta(days=1))
+
+    assert [path.parent for path in written] == [partition]
+    assert not list(partition.glob("segment-*.jsonl"))
+    pd.testing.assert_frame_equal(store.read("abc"), before)
+
+    store.append(_records("abc", 1, start=START + timedelta(minutes=5)))
+    assert len(store.read("abc")) == 13
+    assert store.compact(before=START.date()) == []
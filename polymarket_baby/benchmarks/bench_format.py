@@ -0,0 +1,125 @@
+"""Compare per-trade formatting with the batched, buffered formatter.
+
+Run from the ``polymarket_baby/`` directory::
+
+    python benchmarks/bench_format.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import io
+import random
+import sys
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import main  # noqa: E402
+
+
+def synthetic_trades(count: int, *, seed: int = 0, start: int = 1_700_000_000):
+    """Return ``count`` trades shaped like the data API's ``/trades`` payload."""
+
+    rng = random.Random(seed)
+    markets = [f"Will team {index} win game {index + 100}?" for index in range(40)]
+    trades = []
+    stamp = start
+    for index in range(count):
+        stamp += rng.choice((0, 0, 1, 2))
+        trades.append({
+            "transactionHash": f"0x{rng.getrandbits(128):032x}",
+            "asset": str(rng.getrandbits(64)),
+            "side": rng.choice(("BUY", "SELL")),
+            "title": rng.choice(markets),
+            "outcome": rng.choice(("Yes", "No")),
+            "price": round(rng.uniform(0.01, 0.99), 4),
+            "size": round(rng.uniform(1, 5_000), 2),
+            "timestamp": stamp,
+        })
+    return trades
+
+
+def synthetic_bursts(trades, *, seed: int = 0, sizes=(0, 1, 3, 10, 40, 120)):
+    """Split ``trades`` into the bursts that arrive between successive polls."""
+
+    rng = random.Random(seed)
+    bursts = []
+    position = 0
+    while position < len(trades):
+        size = rng.choice(sizes)
+        bursts.append(trades[position:position + size])
+        position += size
+    return bursts
+
+
+def _legacy_format_trade(trade):
+    """``format_trade`` as it was before batching, kept as the baseline."""
+
+    market = main._safe_get(trade, "market", "question", "title")
+    if isinstance(market, dict):
+        market_question = main._safe_get(market, "question", "title", "name") or "Unknown market"
+    else:
+        market_question = str(market) if market is not None else "Unknown market"
+    outcome = main._safe_get(trade, "outcome", "side", "token")
+    if isinstance(outcome, dict):
+        outcome_text = main._safe_get(outcome, "name", "label", "title") or "Unknown outcome"
+    else:
+        outcome_text = str(outcome) if outcome is not None else "Unknown outcome"
+    try:
+        price = float(main._safe_get(trade, "price") or 0)
+        size = float(main._safe_get(trade, "size") or 0)
+    except (TypeError, ValueError):
+        price = 0.0
+        size = 0.0
+    timestamp = dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+    return (
+        f"[{timestamp}] Market: {market_question} | "
+        f"Outcome: {outcome_text} | "
+        f"Shares: {size:,.2f} | Price: ${price:,.4f} | "
+        f"Total: ${price * size:,.2f}"
+    )
+
+
+def _best(func, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main_() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trades", type=int, default=100_000, help="Synthetic trades to format")
+    parser.add_argument("--repeats", type=int, default=3, help="Timing repeats (best is reported)")
+    args = parser.parse_args()
+
+    trades = synthetic_trades(args.trades)
+
+    def legacy():
+        with redirect_stdout(io.StringIO()):
+            for trade in trades:
+                print(_legacy_format_trade(trade))
+
+    variants = {
+        "per-trade print (legacy)": legacy,
+        "batched text": lambda: main.write_trades(trades, io.StringIO()),
+        "batched ndjson": lambda: main.write_trades(trades, io.StringIO(), output_format="ndjson"),
+    }
+    baseline = None
+    for name, func in variants.items():
+        seconds = _best(func, args.repeats)
+        baseline = baseline or seconds
+        print(
+            f"{name:<26} {seconds * 1000:9.1f} ms  {args.trades / seconds:12,.0f} trades/s"
+            f"  x{baseline / seconds:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main_()
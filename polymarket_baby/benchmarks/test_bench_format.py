@@ -0,0 +1,60 @@
+"""pytest-benchmark suite for trade formatting and polling.
+
+Run from the ``polymarket_baby/`` directory::
+
+    python -m pytest benchmarks --benchmark-autosave
+    python -m pytest benchmarks --benchmark-compare
+"""
+
+import io
+
+import pytest
+
+import main
+from bench_format import synthetic_bursts, synthetic_trades
+
+TRADES = 20_000
+
+
+@pytest.fixture(scope="module")
+def trades():
+    return synthetic_trades(TRADES)
+
+
+def test_format_trade(benchmark, trades):
+    line = benchmark(main.format_trade, trades[0])
+    assert line.startswith("[")
+
+
+def test_format_trades(benchmark, trades):
+    assert len(benchmark(main.format_trades, trades)) == TRADES
+
+
+def test_trades_to_ndjson(benchmark, trades):
+    assert len(benchmark(main.trades_to_ndjson, trades)) == TRADES
+
+
+@pytest.mark.parametrize("output_format", main.OUTPUT_FORMATS)
+def test_write_trades(benchmark, trades, output_format):
+    benchmark(lambda: main.write_trades(trades, io.StringIO(), output_format=output_format))
+
+
+def test_watcher_replays_a_trade_stream(benchmark, trades):
+    bursts = synthetic_bursts(trades[:5_000])
+
+    def replay():
+        history = []
+
+        def fetch_page(limit, offset):
+            newest_first = history[::-1]
+            return newest_first[offset:offset + limit]
+
+        watcher = main.TradeWatcher(fetch_page, page_size=100, max_pages=50)
+        watcher.poll()
+        emitted = 0
+        for burst in bursts:
+            history.extend(burst)
+            emitted += len(watcher.poll())
+        return emitted
+
+    assert benchmark.pedantic(replay, rounds=3) == 5_000
@@ -11,20 +11,34 @@ from __future__ import annotations
 import argparse
 import datetime as dt
 import itertools
+import json
+import math
+import os
 import sys
 import time
-from typing import Any, Dict, Iterable, Optional, Sequence
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, TextIO
 
 import requests
 
-# Base endpoint serving recent trades. The API supports pagination via
-# query parameters such as ``limit``. We request a single trade because we
-# only care about the latest event.
+# Base endpoint serving recent trades, paginated with the ``limit`` and
+# ``offset`` query parameters. ``fetch_latest_trade`` asks for a single trade;
+# ``TradeWatcher`` pages through ``PAGE_SIZE`` trades at a time from its cursor.
 API_URL = "https://data-api.polymarket.com/trades"
 
 # Number of seconds to wait between API calls (5 minutes).
 POLL_INTERVAL_SECONDS = 30
 
+# Page size and bounds used by the cursor-based ``TradeWatcher``. The poll
+# interval shrinks towards ``MIN_POLL_INTERVAL_SECONDS`` while trades keep
+# arriving and grows back to ``POLL_INTERVAL_SECONDS`` when the market is quiet.
+PAGE_SIZE = 100
+MAX_PAGES_PER_POLL = 50
+MIN_POLL_INTERVAL_SECONDS = 2
+DEDUP_WINDOW = 10_000
+
 # Sample trades used when the script runs in "demo" mode. They provide a quick
 # way to preview the output format without making any network requests—useful
 # in restricted environments such as automated tests or sandboxes that cannot
@@ -89,38 +103,160 @@ def _safe_get(trade: Dict[str, Any], *keys: str) -> Optional[Any]:
     return None
 
 
-def format_trade(trade: Dict[str, Any]) -> str:
-    """Convert a raw trade dictionary into a human-readable string."""
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+OUTPUT_FORMATS = ("text", "ndjson")
 
-    market = _safe_get(trade, "market", "question", "title")
-    if isinstance(market, dict):
-        market_question = _safe_get(market, "question", "title", "name") or "Unknown market"
-    else:
-        market_question = str(market) if market is not None else "Unknown market"
+# Trades are written in chunks of this many lines to keep ``write`` calls rare.
+OUTPUT_CHUNK_SIZE = 1_000
 
-    outcome = _safe_get(trade, "outcome", "side", "token")
-    if isinstance(outcome, dict):
-        outcome_text = _safe_get(outcome, "name", "label", "title") or "Unknown outcome"
-    else:
-        outcome_text = str(outcome) if outcome is not None else "Unknown outcome"
+# Payload timestamps outside [0, 9999-12-31 23:59:59] cannot be formatted and
+# are treated as missing.
+MAX_TIMESTAMP_SECONDS = 253_402_300_799
 
-    # Extract price and size
-    try:
-        price = float(_safe_get(trade, "price") or 0)
-        size = float(_safe_get(trade, "size") or 0)
-    except (TypeError, ValueError):
-        price = 0.0
-        size = 0.0
 
-    total_value = price * size
-    timestamp = dt.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+@dataclass
+class TradeColumns:
+    """Normalized trades stored column by column."""
+
+    timestamp: List[str] = field(default_factory=list)
+    epoch: List[Optional[float]] = field(default_factory=list)
+    market: List[str] = field(default_factory=list)
+    outcome: List[str] = field(default_factory=list)
+    size: List[float] = field(default_factory=list)
+    price: List[float] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.market)
+
+    @property
+    def total(self) -> List[float]:
+        return [price * size for price, size in zip(self.price, self.size)]
+
+
+def _label(value: Any, keys: Sequence[str], default: str) -> str:
+    if isinstance(value, dict):
+        return _safe_get(value, *keys) or default
+    return str(value) if value is not None else default
+
+
+def normalize_trades(trades: Iterable[Dict[str, Any]], *, now: Optional[dt.datetime] = None) -> TradeColumns:
+    """Normalize raw trades into :class:`TradeColumns` in a single pass.
+
+    Timestamps come from the trade payload (see :func:`trade_timestamp`) and are
+    formatted once per distinct second. Trades without one are stamped with
+    ``now``, which is read once per batch.
+    """
+
+    columns = TradeColumns()
+    timestamps, epochs = columns.timestamp.append, columns.epoch.append
+    markets, outcomes = columns.market.append, columns.outcome.append
+    prices, sizes = columns.price.append, columns.size.append
+    formatted: Dict[int, str] = {}
+    fallback: Optional[str] = None
+    for trade in trades:
+        # Fast path for the data API's numeric ``timestamp`` field.
+        stamp = trade.get("timestamp")
+        if type(stamp) is int and 0 <= stamp < 100_000_000_000:
+            stamp = float(stamp)
+        else:
+            stamp = trade_timestamp(trade)
+        if stamp is None:
+            if fallback is None:
+                fallback = (now or dt.datetime.now(dt.timezone.utc)).strftime(TIMESTAMP_FORMAT)
+            text = fallback
+        else:
+            second = int(stamp)
+            text = formatted.get(second)
+            if text is None:
+                text = formatted[second] = time.strftime(TIMESTAMP_FORMAT, time.gmtime(second))
 
-    return (
-        f"[{timestamp}] Market: {market_question} | "
-        f"Outcome: {outcome_text} | "
+        # Extract price and size
+        try:
+            price = float(trade.get("price") or 0)
+            size = float(trade.get("size") or 0)
+        except (TypeError, ValueError):
+            price = 0.0
+            size = 0.0
+
+        market = trade.get("market")
+        if market is None or market == "":
+            market = _safe_get(trade, "question", "title")
+        outcome = trade.get("outcome")
+        if outcome is None or outcome == "":
+            outcome = _safe_get(trade, "side", "token")
+
+        timestamps(text)
+        epochs(stamp)
+        markets(market if type(market) is str else _label(market, ("question", "title", "name"), "Unknown market"))
+        outcomes(outcome if type(outcome) is str else _label(outcome, ("name", "label", "title"), "Unknown outcome"))
+        prices(price)
+        sizes(size)
+    return columns
+
+
+def format_trades(trades: Iterable[Dict[str, Any]], *, now: Optional[dt.datetime] = None) -> List[str]:
+    """Format many trades as human-readable lines."""
+
+    columns = normalize_trades(trades, now=now)
+    return [
+        f"[{timestamp}] Market: {market} | "
+        f"Outcome: {outcome} | "
         f"Shares: {size:,.2f} | Price: ${price:,.4f} | "
-        f"Total: ${total_value:,.2f}"
-    )
+        f"Total: ${price * size:,.2f}"
+        for timestamp, market, outcome, size, price in zip(
+            columns.timestamp, columns.market, columns.outcome, columns.size, columns.price
+        )
+    ]
+
+
+def _json_number(value: Optional[float]) -> str:
+    # JSON has no NaN or infinity, so non-finite numbers are written as null.
+    return repr(value) if value is not None and math.isfinite(value) else "null"
+
+
+def trades_to_ndjson(trades: Iterable[Dict[str, Any]], *, now: Optional[dt.datetime] = None) -> List[str]:
+    """Format many trades as JSON objects, one per line.
+
+    Non-finite prices, sizes and totals are written as ``null``.
+    """
+
+    columns = normalize_trades(trades, now=now)
+    quote = json.encoder.encode_basestring
+    number = _json_number
+    return [
+        f'{{"timestamp":{number(epoch)},"time":"{timestamp}",'
+        f'"market":{quote(market)},"outcome":{quote(outcome)},'
+        f'"size":{number(size)},"price":{number(price)},"total":{number(price * size)}}}'
+        for timestamp, epoch, market, outcome, size, price in zip(
+            columns.timestamp, columns.epoch, columns.market, columns.outcome, columns.size, columns.price
+        )
+    ]
+
+
+def format_trade(trade: Dict[str, Any]) -> str:
+    """Convert a raw trade dictionary into a human-readable string."""
+
+    return format_trades((trade,))[0]
+
+
+def write_trades(
+    trades: Sequence[Dict[str, Any]],
+    stream: Optional[TextIO] = None,
+    *,
+    output_format: str = "text",
+    chunk_size: int = OUTPUT_CHUNK_SIZE,
+) -> int:
+    """Write formatted trades to ``stream`` in buffered chunks and return the count."""
+
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format {output_format!r}; expected one of {OUTPUT_FORMATS}")
+    stream = stream or sys.stdout
+    formatter = format_trades if output_format == "text" else trades_to_ndjson
+    for start in range(0, len(trades), chunk_size):
+        lines = formatter(trades[start:start + chunk_size])
+        stream.write("\n".join(lines) + "\n")
+    stream.flush()
+    return len(trades)
 
 
 def fetch_latest_trade() -> Optional[Dict[str, Any]]:
@@ -137,40 +273,226 @@ def fetch_latest_trade() -> Optional[Dict[str, Any]]:
     return trades
 
 
-def run_live_loop() -> None:
-    """Continuously poll Polymarket and print information about trades."""
+def trade_timestamp(trade: Dict[str, Any]) -> Optional[float]:
+    """Return the trade's time as Unix seconds, or ``None`` if it has none.
 
-    print("Starting Polymarket Baby trade watcher. Press Ctrl+C to stop.")
-    while True:
+    The API reports Unix seconds; ISO-8601 strings and millisecond values are
+    accepted as well. Non-finite values and times outside years 1970-9999
+    count as missing.
+    """
+
+    value = _safe_get(trade, "timestamp", "time", "createdAt", "matchTime")
+    if value is None:
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
         try:
-            trade = fetch_latest_trade()
-        except requests.RequestException as exc:
-            # Network problems are expected from time to time. We log the
-            # issue and continue looping so the script remains resilient.
-            print(f"Error fetching trades: {exc}", file=sys.stderr)
+            parsed = dt.datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=dt.timezone.utc)
+        number = parsed.timestamp()
+    else:
+        number = number / 1000 if number > 1e11 else number
+    if not (0 <= number <= MAX_TIMESTAMP_SECONDS):  # also rejects NaN
+        return None
+    return number
+
+
+def trade_id(trade: Dict[str, Any]) -> str:
+    """Return a stable identifier for deduplicating a trade.
+
+    Uses the trade ID when present. Otherwise the transaction hash is combined
+    with the fill details, since one transaction can contain several fills.
+    Payloads without either fall back to their canonical JSON.
+    """
+
+    identifier = _safe_get(trade, "id", "tradeId")
+    if identifier is not None:
+        return str(identifier)
+    if trade.get("transactionHash"):
+        fields = ("transactionHash", "proxyWallet", "asset", "side", "size", "price")
+        return ":".join(str(trade.get(field, "")) for field in fields)
+    return json.dumps(trade, sort_keys=True, default=str)
+
+
+def fetch_trade_page(
+    limit: int,
+    offset: int,
+    *,
+    session: Optional[requests.Session] = None,
+    url: str = API_URL,
+) -> List[Dict[str, Any]]:
+    """Fetch one page of trades, newest first."""
+
+    response = (session or requests).get(url, params={"limit": limit, "offset": offset}, timeout=30)
+    response.raise_for_status()
+    return list(_coerce_trades(response.json()))
+
+
+class TradeWatcher:
+    """Page forward through new trades without dropping or repeating any.
+
+    The watcher keeps a cursor (the newest trade timestamp seen) and, on each
+    poll, requests pages until it reaches trades older than the cursor. Trades
+    sharing the cursor's timestamp are re-fetched on purpose and filtered by a
+    bounded LRU of recently seen trade IDs. With ``cursor_path`` the cursor and
+    the IDs at the cursor timestamp survive restarts.
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[int, int], List[Dict[str, Any]]] = fetch_trade_page,
+        *,
+        cursor_path: Optional[Path] = None,
+        page_size: int = PAGE_SIZE,
+        max_pages: int = MAX_PAGES_PER_POLL,
+        dedup_size: int = DEDUP_WINDOW,
+        min_interval: float = MIN_POLL_INTERVAL_SECONDS,
+        max_interval: float = POLL_INTERVAL_SECONDS,
+    ) -> None:
+        self.fetch_page = fetch_page
+        self.cursor_path = cursor_path
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.dedup_size = dedup_size
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = max_interval
+        self.cursor: Optional[float] = None
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+        self._load_cursor()
+        # The first poll of a fresh watcher only reports the latest page
+        # instead of backfilling the whole history.
+        self._primed = self.cursor is not None
+
+    def _load_cursor(self) -> None:
+        if self.cursor_path is None or not self.cursor_path.exists():
+            return
+        state = json.loads(self.cursor_path.read_text())
+        self.cursor = state.get("timestamp")
+        for identifier in state.get("ids_at_cursor", []):
+            self._remember(identifier)
+
+    def _save_cursor(self, ids_at_cursor: List[str]) -> None:
+        if self.cursor_path is None:
+            return
+        self.cursor_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cursor_path.with_name(f".{self.cursor_path.name}.tmp")
+        tmp_path.write_text(json.dumps({"timestamp": self.cursor, "ids_at_cursor": ids_at_cursor}))
+        os.replace(tmp_path, self.cursor_path)
+
+    def _remember(self, identifier: str) -> None:
+        self._seen[identifier] = None
+        self._seen.move_to_end(identifier)
+        while len(self._seen) > self.dedup_size:
+            self._seen.popitem(last=False)
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """Return every trade not seen before, oldest first."""
+
+        fetched: List[Dict[str, Any]] = []
+        for page_number in range(self.max_pages):
+            page = self.fetch_page(self.page_size, page_number * self.page_size)
+            fetched.extend(page)
+            if not self._primed or len(page) < self.page_size:
+                break
+            oldest = trade_timestamp(page[-1])
+            if self.cursor is not None and oldest is not None and oldest < self.cursor:
+                break
         else:
-            if not trade:
-                print("No trades returned by the API.")
+            print(
+                f"Warning: more than {self.max_pages * self.page_size} new trades; older ones were skipped.",
+                file=sys.stderr,
+            )
+
+        new_trades = []
+        for trade in reversed(fetched):
+            stamp = trade_timestamp(trade)
+            if self.cursor is not None and stamp is not None and stamp < self.cursor:
+                continue
+            identifier = trade_id(trade)
+            if identifier in self._seen:
+                continue
+            self._remember(identifier)
+            new_trades.append(trade)
+
+        stamps = [stamp for stamp in map(trade_timestamp, new_trades) if stamp is not None]
+        if stamps and (self.cursor is None or max(stamps) >= self.cursor):
+            self.cursor = max(stamps)
+            ids_at_cursor = [trade_id(trade) for trade in fetched if trade_timestamp(trade) == self.cursor]
+            self._save_cursor(ids_at_cursor)
+
+        self._primed = True
+        self._adapt_interval(len(new_trades))
+        return new_trades
+
+    def _adapt_interval(self, new_count: int) -> None:
+        """Halve the interval while trades arrive and back off by 1.5x when idle."""
+
+        if new_count >= self.page_size:
+            self.interval = self.min_interval
+        elif new_count:
+            self.interval = max(self.min_interval, self.interval / 2)
+        else:
+            self.interval = min(self.max_interval, self.interval * 1.5)
+
+    def run(
+        self,
+        emit: Callable[[List[Dict[str, Any]]], None],
+        *,
+        iterations: Optional[int] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Poll forever (or ``iterations`` times), passing each batch of new trades to ``emit``."""
+
+        for count in itertools.count():
+            if iterations is not None and count >= iterations:
+                return
+            try:
+                trades = self.poll()
+            except requests.RequestException as exc:
+                # Network problems are expected from time to time. We log the
+                # issue and continue looping so the script remains resilient.
+                print(f"Error fetching trades: {exc}", file=sys.stderr)
             else:
-                for t in trade:
-                    print(format_trade(t))
+                if trades:
+                    emit(trades)
+            sleep(self.interval)
+
+
+def _status_stream(output_format: str) -> TextIO:
+    # Keep NDJSON output machine-readable by sending banners to stderr.
+    return sys.stderr if output_format == "ndjson" else sys.stdout
+
 
-        # Wait for the requested polling interval before fetching again.
-        time.sleep(POLL_INTERVAL_SECONDS)
+def run_live_loop(cursor_path: Optional[Path] = None, output_format: str = "text") -> None:
+    """Continuously poll Polymarket and print every new trade."""
+
+    print("Starting Polymarket Baby trade watcher. Press Ctrl+C to stop.", file=_status_stream(output_format))
+    session = requests.Session()
+    watcher = TradeWatcher(
+        lambda limit, offset: fetch_trade_page(limit, offset, session=session),
+        cursor_path=cursor_path,
+    )
+    watcher.run(lambda trades: write_trades(trades, output_format=output_format))
 
 
-def run_demo_loop(iterations: int = 3, sleep_seconds: int = 1) -> None:
+def run_demo_loop(iterations: int = 3, sleep_seconds: int = 1, output_format: str = "text") -> None:
     """Emit formatted sample trades without contacting the Polymarket API."""
 
     print(
         "Running in demo mode. Use --live to poll Polymarket. "
-        "Press Ctrl+C to stop."
+        "Press Ctrl+C to stop.",
+        file=_status_stream(output_format),
     )
     for idx, trade in zip(range(iterations), itertools.cycle(SAMPLE_TRADES)):
-        # ``format_trade`` already handles dictionaries and strings in the same
+        # The formatter already handles dictionaries and strings in the same
         # way the live API would deliver them, so we can re-use it for the demo
         # data.
-        print(format_trade(trade))
+        write_trades([trade], output_format=output_format)
         if idx < iterations - 1:
             time.sleep(sleep_seconds)
 
@@ -188,6 +510,22 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
             "environments."
         ),
     )
+    parser.add_argument(
+        "--cursor-file",
+        type=Path,
+        default=None,
+        help=(
+            "Live mode: persist the trade cursor here so a restarted watcher "
+            "resumes where it stopped."
+        ),
+    )
+    parser.add_argument(
+        "--format",
+        dest="output_format",
+        choices=OUTPUT_FORMATS,
+        default="text",
+        help="Print trades as human-readable lines (default) or NDJSON records.",
+    )
     return parser.parse_args(argv)
 
 
@@ -196,9 +534,9 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
 
     args = parse_args(argv)
     if args.live:
-        run_live_loop()
+        run_live_loop(args.cursor_file, args.output_format)
     else:
-        run_demo_loop()
+        run_demo_loop(output_format=args.output_format)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,147 @@
+import itertools
+import random
+
+import pytest
+
+import main
+
+
+class FakeTradeEndpoint:
+    """Serves a growing trade history newest first, like the data API."""
+
+    def __init__(self):
+        self.trades = []
+        self.requests = []
+
+    def fetch_page(self, limit, offset):
+        self.requests.append((limit, offset))
+        newest_first = self.trades[::-1]
+        return newest_first[offset:offset + limit]
+
+
+def _sample_stream(count):
+    # Several trades share each second so the cursor timestamp is ambiguous.
+    return [
+        dict(trade, id=f"t{index}", timestamp=1_700_000_000 + index // 3)
+        for index, trade in zip(range(count), itertools.cycle(main.SAMPLE_TRADES))
+    ]
+
+
+def test_watcher_replays_sample_trades_without_drops_or_duplicates(tmp_path):
+    stream = _sample_stream(600)
+    endpoint = FakeTradeEndpoint()
+    cursor_path = tmp_path / "cursor.json"
+    watcher = main.TradeWatcher(endpoint.fetch_page, cursor_path=cursor_path, page_size=25)
+    rng = random.Random(0)
+
+    emitted = watcher.poll()  # the watcher starts before any trades exist
+    position = 0
+    poll = 0
+    while position < len(stream):
+        burst = rng.choice([0, 1, 4, 30, 80])
+        endpoint.trades.extend(stream[position:position + burst])
+        position += burst
+        emitted.extend(watcher.poll())
+        poll += 1
+        if poll == 10:  # restart halfway through from the persisted cursor
+            watcher = main.TradeWatcher(endpoint.fetch_page, cursor_path=cursor_path, page_size=25)
+
+    assert [trade["id"] for trade in emitted] == [trade["id"] for trade in stream]
+
+
+def test_watcher_adapts_interval_to_volume():
+    endpoint = FakeTradeEndpoint()
+    watcher = main.TradeWatcher(endpoint.fetch_page, page_size=10, min_interval=1, max_interval=32)
+    endpoint.trades.extend(_sample_stream(3))
+
+    watcher.poll()
+    assert watcher.interval == 16
+    watcher.poll()
+    assert watcher.interval == 24
+    endpoint.trades.extend(_sample_stream(40)[3:])
+    watcher.poll()
+    assert watcher.interval == 1
+
+
+def test_trade_helpers_parse_payload_fields():
+    assert main.trade_timestamp({"timestamp": 1_700_000_000}) == 1_700_000_000
+    assert main.trade_timestamp({"timestamp": 1_700_000_000_000}) == 1_700_000_000
+    assert main.trade_timestamp({"timestamp": "2023-11-14T22:13:20Z"}) == 1_700_000_000
+    assert main.trade_timestamp(main.SAMPLE_TRADES[0]) is None
+    fills = [{"transactionHash": "0xabc", "asset": asset, "size": 1} for asset in ("yes", "no")]
+    assert main.trade_id(fills[0]) != main.trade_id(fills[1])
+    assert main.trade_id({"id": 7}) == "7"
+
+
+def _payload_trades():
+    return [
+        {"title": "Hawks vs Hornets", "outcome": "Hawks", "price": "0.61", "size": 1200, "timestamp": 1_700_000_000},
+        {"market": {"question": "Celtics vs Knicks"}, "outcome": {"name": "Knicks"}, "price": 0.4, "size": "bad"},
+        *main.SAMPLE_TRADES,
+    ]
+
+
+def test_format_trades_uses_payload_timestamps():
+    now = main.dt.datetime(2024, 4, 29, 12, 30, tzinfo=main.dt.timezone.utc)
+    lines = main.format_trades(_payload_trades(), now=now)
+
+    assert lines[0] == (
+        "[2023-11-14 22:13:20] Market: Hawks vs Hornets | Outcome: Hawks | "
+        "Shares: 1,200.00 | Price: $0.6100 | Total: $732.00"
+    )
+    assert lines[1].startswith("[2024-04-29 12:30:00] Market: Celtics vs Knicks | Outcome: Knicks | Shares: 0.00")
+    assert lines[2].endswith("Outcome: Yes | Shares: 0.00 | Price: $0.0000 | Total: $0.00")
+    assert main.format_trade(_payload_trades()[0]) == lines[0]
+
+
+def test_write_trades_chunks_and_ndjson_are_consistent():
+    import io
+    import json
+
+    trades = [dict(trade, price=0.5, size=index) for index, trade in enumerate(_payload_trades() * 40)]
+    outputs = []
+    for chunk_size in (1, 7, 1000):
+        stream = io.StringIO()
+        assert main.write_trades(trades, stream, chunk_size=chunk_size) == len(trades)
+        outputs.append(stream.getvalue())
+    assert outputs[0] == outputs[1] == outputs[2]
+    assert len(outputs[0].splitlines()) == len(trades)
+
+    stream = io.StringIO()
+    main.write_trades(trades[:3], stream, output_format="ndjson", chunk_size=2)
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert records[0]["timestamp"] == 1_700_000_000
+    assert records[0]["total"] == 0.0 and records[2]["total"] == 1.0
+    assert records[1]["market"] == "Celtics vs Knicks"
+
+
+def test_malformed_timestamps_fall_back_to_now():
+    now = main.dt.datetime(2024, 4, 29, 12, 30, tzinfo=main.dt.timezone.utc)
+    trades = [
+        {"title": "Bad stamp", "timestamp": stamp}
+        for stamp in ("NaN", "Infinity", "-Infinity", 1e20, -5, 10**30, "0001-01-01T00:00:00")
+    ]
+    for trade in trades:
+        assert main.trade_timestamp(trade) is None
+    lines = main.format_trades(trades, now=now)
+    assert all(line.startswith("[2024-04-29 12:30:00] Market: Bad stamp") for line in lines)
+
+    ids = itertools.count()
+    watcher = main.TradeWatcher(lambda limit, offset: [dict(trades[0], id=next(ids))], page_size=10)
+    batches = []
+    watcher.run(lambda new: batches.append(main.format_trades(new)), iterations=2, sleep=lambda _: None)
+    assert len(batches) == 2
+
+
+def test_ndjson_writes_non_finite_numbers_as_null():
+    import json
+
+    trades = [
+        {"title": "Odd prices", "price": "NaN", "size": 3, "timestamp": "nan"},
+        {"title": "Odd sizes", "price": 0.5, "size": "inf", "timestamp": 1_700_000_000},
+    ]
+    lines = main.trades_to_ndjson(trades)
+    records = [json.loads(line, parse_constant=lambda name: pytest.fail(f"invalid JSON constant {name}")) for line in lines]
+    assert records[0]["timestamp"] is None
+    assert records[0]["price"] is None and records[0]["size"] == 3.0 and records[0]["total"] is None
+    assert records[1]["size"] is None and records[1]["total"] is None